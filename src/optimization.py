@@ -8,7 +8,6 @@ import yaml
 import logging
 from pathlib import Path
 from typing import Tuple
-from src.utils import safe_divide
 
 logger = logging.getLogger(__name__)
 
@@ -155,8 +154,11 @@ def calculate_tco_metrics(df_items: pd.DataFrame,
 
     # Calculate annual demand based on actual forecast horizon (extrapolate)
     # For 3-month horizon: multiply by 4, for 6-month: multiply by 2
-    df_merged['annualization_factor'] = df_merged['forecast_horizon'].apply(
-        lambda x: round(12 / x, 2) if x > 0 else 2.0  # Default to 6-month horizon if invalid
+    # (Vectorized over the column; invalid horizons default to the 6-month factor)
+    horizon = df_merged['forecast_horizon'].to_numpy(dtype=float)
+    valid_horizon = horizon > 0
+    df_merged['annualization_factor'] = np.where(
+        valid_horizon, np.round(12 / np.where(valid_horizon, horizon, 1.0), 2), 2.0
     )
     df_merged['annual_demand'] = df_merged['forecast_period_demand'] * df_merged['annualization_factor']
 
@@ -175,22 +177,18 @@ def calculate_tco_metrics(df_items: pd.DataFrame,
     ) * df_merged['annual_demand']
 
     # Make recommendation with tiebreaker logic
-    def get_recommendation(row):
-        """Determine STOCK vs SPECIAL ORDER recommendation with tiebreaker."""
-        stock_cost = row['cost_to_stock_annual']
-        special_cost = row['cost_to_special_annual']
-
-        # Use 1% tolerance for "equal" costs (handles floating point precision)
-        threshold = 0.01 * min(stock_cost, special_cost) if min(stock_cost, special_cost) > 0 else 0.01
-
-        if abs(stock_cost - special_cost) < threshold:
-            return 'NEUTRAL (Costs equal)'
-        elif stock_cost < special_cost:
-            return 'STOCK'
-        else:
-            return 'SPECIAL ORDER'
-
-    df_merged['recommendation'] = df_merged.apply(get_recommendation, axis=1)
+    stock_cost = df_merged['cost_to_stock_annual'].to_numpy(dtype=float)
+    special_cost = df_merged['cost_to_special_annual'].to_numpy(dtype=float)
+
+    # Use 1% tolerance for "equal" costs (handles floating point precision).
+    # NaN costs fail every comparison and fall through to SPECIAL ORDER.
+    min_cost = np.minimum(stock_cost, special_cost)
+    threshold = np.where(min_cost > 0, 0.01 * min_cost, 0.01)
+    df_merged['recommendation'] = np.select(
+        [np.abs(stock_cost - special_cost) < threshold, stock_cost < special_cost],
+        ['NEUTRAL (Costs equal)', 'STOCK'],
+        default='SPECIAL ORDER'
+    )
 
     # Calculate annual savings if we switch to the recommended approach
     # Current approach: Assume everything is currently STOCKED
@@ -198,19 +196,19 @@ def calculate_tco_metrics(df_items: pd.DataFrame,
     df_merged['current_cost_annual'] = df_merged['cost_to_stock_annual']
 
     # Calculate cost if we follow recommendation
-    df_merged['recommended_cost_annual'] = df_merged.apply(
-        lambda row: row['cost_to_stock_annual'] if row['recommendation'] == 'STOCK' else row['cost_to_special_annual'],
-        axis=1
+    df_merged['recommended_cost_annual'] = np.where(
+        df_merged['recommendation'] == 'STOCK', stock_cost, special_cost
     )
 
     # Calculate savings
     df_merged['annual_savings'] = df_merged['current_cost_annual'] - df_merged['recommended_cost_annual']
 
     # Calculate potential annual savings percentage (with division by zero protection)
-    df_merged['savings_percent'] = df_merged.apply(
-        lambda row: safe_divide(row['annual_savings'], row['current_cost_annual'], 0.0) * 100,
-        axis=1
-    )
+    current_cost = df_merged['current_cost_annual'].to_numpy(dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        df_merged['savings_percent'] = np.where(
+            current_cost == 0, 0.0, df_merged['annual_savings'].to_numpy(dtype=float) / current_cost
+        ) * 100
 
     # Flag items that should switch from Stock to Special Order
     # Exclude NEUTRAL cases from switching
@@ -290,10 +288,12 @@ def calculate_stockout_predictions(df_items: pd.DataFrame,
     df_merged['forecast_period_demand'] = df_merged[forecast_cols].fillna(0).sum(axis=1)
 
     # For display/analysis, also calculate annualized 12-month equivalent
-    df_merged['forecast_annualized_demand'] = df_merged.apply(
-        lambda row: row['forecast_period_demand'] * safe_divide(12, row['forecast_horizon'], 1.0),
-        axis=1
-    )
+    # (Column arrays instead of row-wise apply; a zero horizon falls back to the defaults)
+    period_demand = df_merged['forecast_period_demand'].to_numpy(dtype=float)
+    horizon = df_merged['forecast_horizon'].to_numpy(dtype=float)
+    zero_horizon = horizon == 0
+    safe_horizon = np.where(zero_horizon, 1.0, horizon)
+    df_merged['forecast_annualized_demand'] = period_demand * np.where(zero_horizon, 1.0, 12 / safe_horizon)
 
     # Calculate stockout status
     df_merged['will_stockout'] = df_merged['total_available'] < df_merged['forecast_period_demand']
@@ -306,32 +306,24 @@ def calculate_stockout_predictions(df_items: pd.DataFrame,
 
     # Calculate days until stockout (simplified - assumes constant demand rate)
     # Use actual forecast horizon for average monthly calculation
-    df_merged['avg_monthly_demand'] = df_merged.apply(
-        lambda row: safe_divide(row['forecast_period_demand'], row['forecast_horizon'], 0.0),
-        axis=1
-    )
-    df_merged['days_until_stockout'] = df_merged.apply(
-        lambda row: (row['total_available'] / row['avg_monthly_demand']) * 30
-                    if row['avg_monthly_demand'] > 0 and row['will_stockout']
-                    else 999,  # No stockout expected
-        axis=1
+    avg_monthly = np.where(zero_horizon, 0.0, period_demand / safe_horizon)
+    df_merged['avg_monthly_demand'] = avg_monthly
+    stocking_out = (avg_monthly > 0) & df_merged['will_stockout'].to_numpy(dtype=bool)
+    df_merged['days_until_stockout'] = np.where(
+        stocking_out,
+        df_merged['total_available'].to_numpy(dtype=float) / np.where(stocking_out, avg_monthly, 1.0) * 30,
+        999  # No stockout expected
     )
 
-    # Categorize urgency with correct boundary conditions
-    def classify_urgency(days):
-        """Classify stockout urgency with correct boundary conditions."""
-        if pd.isna(days) or days < 0:
-            return 'UNKNOWN'
-        elif days <= 30:
-            return 'CRITICAL (<30 days)'
-        elif days <= 60:
-            return 'HIGH (30-60 days)'
-        elif days <= 90:
-            return 'MEDIUM (60-90 days)'
-        else:
-            return 'LOW (>90 days)'
-
-    df_merged['urgency'] = df_merged['days_until_stockout'].apply(classify_urgency)
+    # Categorize urgency with correct boundary conditions: one binary-search
+    # pass into right-inclusive bins (<=30, <=60, <=90, >90), then negative
+    # or missing days are UNKNOWN
+    days = df_merged['days_until_stockout'].to_numpy(dtype=float)
+    urgency_labels = np.array(['CRITICAL (<30 days)', 'HIGH (30-60 days)',
+                               'MEDIUM (60-90 days)', 'LOW (>90 days)'], dtype=object)
+    urgency = urgency_labels[np.searchsorted([30, 60, 90], days, side='left')]
+    urgency[np.isnan(days) | (days < 0)] = 'UNKNOWN'
+    df_merged['urgency'] = urgency
 
     # Identify intermittent items (very long periods between purchases)
     # These should be special order only, not stocked
@@ -342,9 +334,8 @@ def calculate_stockout_predictions(df_items: pd.DataFrame,
     )
 
     # For intermittent items: recommend special order, allow stock to go to 0
-    df_merged['inventory_strategy'] = df_merged.apply(
-        lambda row: 'SPECIAL ORDER ONLY' if row['is_intermittent'] else 'STOCK ITEM',
-        axis=1
+    df_merged['inventory_strategy'] = np.where(
+        df_merged['is_intermittent'], 'SPECIAL ORDER ONLY', 'STOCK ITEM'
     )
 
     # Log intermittent items for review
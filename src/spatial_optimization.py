@@ -23,10 +23,106 @@ from functools import lru_cache
 import pickle
 import json
 
-logger = logging.getLogger(__name__)
+# Optional: numba for the batch units-per-skid kernel (NumPy fallback if absent)
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Standard skid dimensions used to estimate units per skid (cm)
+_SKID_LENGTH_CM = 120.0
+_SKID_WIDTH_CM = 100.0
+_SKID_MAX_HEIGHT_CM = 150.0
+
+
+# Format version of the pickled dimension cache (bump when the ItemDimensions
+# layout changes)
+_DIMENSION_CACHE_VERSION = 2
+
+# Pattern-based fallback rules for items without dimension data, checked in
+# order: (keywords, reason, ItemDimensions fields). Built once at import.
+_FALLBACK_RULES = (
+    # Liquids and bulk materials
+    (('liquid', 'oil', 'fluid', 'solution', 'chemical'), 'Liquid/chemical',
+     dict(length_cm=40, width_cm=40, height_cm=50, weight_kg=50, units_per_skid=4)),
+    # Boxes/cartons
+    (('box', 'carton', 'case', 'pack'), 'Box/carton',
+     dict(length_cm=40, width_cm=30, height_cm=30, weight_kg=15, units_per_skid=50)),
+    # Bags
+    (('bag', 'sack', 'pouch'), 'Bag',
+     dict(length_cm=50, width_cm=40, height_cm=30, weight_kg=25, units_per_skid=25)),
+    # Sheets/pads
+    (('sheet', 'pad', 'wipe', 'cloth'), 'Sheet/pad',
+     dict(length_cm=30, width_cm=20, height_cm=20, weight_kg=5, units_per_skid=100)),
+    # Small parts/fasteners
+    (('screw', 'bolt', 'nut', 'nail', 'fastener', 'clip'), 'Small parts',
+     dict(length_cm=20, width_cm=20, height_cm=20, weight_kg=10, units_per_skid=200)),
+    # Tools/equipment
+    (('tool', 'wrench', 'hammer', 'plier', 'equipment'), 'Tool',
+     dict(length_cm=60, width_cm=40, height_cm=40, weight_kg=30, units_per_skid=10)),
+)
+
+
+@lru_cache(maxsize=1024)
+def _match_fallback_rule(item_code: str, description: str) -> int:
+    """Index of the first _FALLBACK_RULES entry matching description or item code, -1 if none."""
+    for index, (patterns, _, _) in enumerate(_FALLBACK_RULES):
+        for pattern in patterns:
+            if pattern in description or pattern in item_code:
+                return index
+    return -1
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _units_per_skid_nb(length, width, height):
+        """Per-row DimensionManager._estimate_units_per_skid over float64 arrays."""
+        out = np.empty(length.shape[0], np.int64)
+        for i in prange(length.shape[0]):
+            if length[i] == 0 or width[i] == 0 or height[i] == 0:
+                out[i] = 1
+                continue
+            units_per_layer = int((_SKID_LENGTH_CM / length[i]) * (_SKID_WIDTH_CM / width[i]))
+            max_layers = max(int(_SKID_MAX_HEIGHT_CM / height[i]), 1)
+            out[i] = max(1, units_per_layer * max_layers)
+        return out
+
+
+def _estimate_units_per_skid_batch(length: np.ndarray, width: np.ndarray,
+                                   height: np.ndarray) -> np.ndarray:
+    """
+    Estimate units per skid for many items at once.
+
+    Same result per row as DimensionManager._estimate_units_per_skid, for
+    non-negative dimensions in cm.
+
+    Parameters:
+    -----------
+    length, width, height : np.ndarray
+        Item dimensions in cm
+
+    Returns:
+    --------
+    np.ndarray
+        int64 units per skid
+    """
+    length = np.ascontiguousarray(length, dtype=np.float64)
+    width = np.ascontiguousarray(width, dtype=np.float64)
+    height = np.ascontiguousarray(height, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _units_per_skid_nb(length, width, height)
+
+    missing = (length == 0) | (width == 0) | (height == 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        units_per_layer = np.trunc((_SKID_LENGTH_CM / length) * (_SKID_WIDTH_CM / width))
+        max_layers = np.maximum(np.trunc(_SKID_MAX_HEIGHT_CM / height), 1)
+        total = np.maximum(1, units_per_layer * max_layers)
+    return np.where(missing, 1, total).astype(np.int64)
+
+
+@dataclass(slots=True, frozen=True)
 class ItemDimensions:
     """Physical dimensions of an item"""
     length_cm: float  # Length in centimeters
@@ -37,7 +133,7 @@ class ItemDimensions:
     stacking_allowed: bool = True  # Can skids be stacked
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SkidSpace:
     """Warehouse skid space capacity"""
     location: str  # Warehouse location code
@@ -103,42 +199,37 @@ class DimensionManager:
         """
         dimensions = {}
 
-        for _, row in df_items.iterrows():
-            item_code = row.get('Item No.')
-
-            if pd.isna(item_code):
-                continue
-
-            # Try to extract dimensions from SAP data
-            try:
-                # Check if dimension data exists
-                has_dimensions = all(col in df_items.columns for col in ['Length', 'Width', 'Height'])
-
-                if has_dimensions:
-                    length = self._parse_dimension(row.get('Length', 0))
-                    width = self._parse_dimension(row.get('Width', 0))
-                    height = self._parse_dimension(row.get('Height', 0))
-                    weight = self._parse_dimension(row.get('Weight', 0))
-
-                    # Skip if all dimensions are zero (no data available)
-                    if length == 0 and width == 0 and height == 0:
-                        continue
+        # Check if dimension data exists
+        has_dimensions = all(col in df_items.columns for col in ['Length', 'Width', 'Height'])
+
+        if has_dimensions and 'Item No.' in df_items.columns:
+            # Parse whole columns at once and keep rows with an item code and
+            # at least one non-zero dimension (all zero = no data available)
+            lengths = self._parse_dimension_array(df_items['Length'])
+            widths = self._parse_dimension_array(df_items['Width'])
+            heights = self._parse_dimension_array(df_items['Height'])
+            if 'Weight' in df_items.columns:
+                weights = self._parse_dimension_array(df_items['Weight'])
+            else:
+                weights = np.zeros(len(df_items))
 
-                    # Estimate units per skid based on dimensions
-                    units_per_skid = self._estimate_units_per_skid(length, width, height)
+            item_codes = df_items['Item No.']
+            keep = item_codes.notna().to_numpy() & ((lengths != 0) | (widths != 0) | (heights != 0))
 
-                    dimensions[item_code] = ItemDimensions(
-                        length_cm=length,
-                        width_cm=width,
-                        height_cm=height,
-                        weight_kg=weight,
-                        units_per_skid=units_per_skid,
-                        stacking_allowed=True
-                    )
+            # Estimate units per skid based on dimensions (one batch call)
+            units_per_skid = _estimate_units_per_skid_batch(lengths[keep], widths[keep], heights[keep])
 
-            except Exception as e:
-                logger.debug(f"Could not parse dimensions for {item_code}: {e}")
-                continue
+            for item_code, length, width, height, weight, units in zip(
+                    item_codes[keep].tolist(), lengths[keep].tolist(), widths[keep].tolist(),
+                    heights[keep].tolist(), weights[keep].tolist(), units_per_skid.tolist()):
+                dimensions[item_code] = ItemDimensions(
+                    length_cm=length,
+                    width_cm=width,
+                    height_cm=height,
+                    weight_kg=weight,
+                    units_per_skid=units,
+                    stacking_allowed=True
+                )
 
         logger.info(f"Loaded dimensions for {len(dimensions)} items from SAP")
         self.dimensions_cache.update(dimensions)
@@ -271,24 +362,46 @@ class DimensionManager:
         """
         default_dimensions = {}
 
-        for _, row in df_items.iterrows():
-            item_code = row.get('Item No.')
+        if 'Item No.' not in df_items.columns:
+            return default_dimensions
 
-            if pd.isna(item_code):
-                continue
+        # Items with a code and no dimensions yet
+        item_codes = df_items['Item No.']
+        pending = item_codes.notna() & ~item_codes.isin(list(self.dimensions_cache))
+        df_pending = df_items[pending]
+        if df_pending.empty:
+            return default_dimensions
 
-            # Skip if already has dimensions
-            if item_code in self.dimensions_cache:
-                continue
-
-            description = str(row.get('Item Description', '')).lower()
-            item_code_str = str(item_code).upper()
-
-            # Try to categorize and assign defaults
-            dims = self._get_fallback_dimensions(item_code_str, description)
+        if 'Item Description' in df_pending.columns:
+            descriptions = df_pending['Item Description'].astype(str).str.lower()
+        else:
+            descriptions = pd.Series('', index=df_pending.index)
+        codes_upper = df_pending['Item No.'].astype(str).str.upper()
+
+        # Index of the first matching fallback rule per item (-1: none), one
+        # vectorized keyword scan per rule instead of a per-row loop
+        conditions = []
+        for patterns, _, _ in _FALLBACK_RULES:
+            keywords = '|'.join(patterns)
+            conditions.append((descriptions.str.contains(keywords, regex=True)
+                               | codes_upper.str.contains(keywords, regex=True)).to_numpy())
+        rule_indices = np.select(conditions, np.arange(len(_FALLBACK_RULES)), default=-1)
+
+        # ItemDimensions is immutable, so items in the same category share
+        # one instance; the last entry is the ultra-conservative default
+        # (1 unit per skid) used when no rule matches (index -1)
+        templates = [ItemDimensions(**fields, stacking_allowed=True) for _, _, fields in _FALLBACK_RULES]
+        templates.append(ItemDimensions(
+            length_cm=60.0,
+            width_cm=40.0,
+            height_cm=40.0,
+            weight_kg=20.0,
+            units_per_skid=1,
+            stacking_allowed=True
+        ))
 
-            if dims:
-                default_dimensions[item_code] = dims
+        for item_code, rule_index in zip(df_pending['Item No.'].tolist(), rule_indices.tolist()):
+            default_dimensions[item_code] = templates[rule_index]
 
         if default_dimensions:
             logger.warning(f"Using DEFAULT/FALLBACK dimensions for {len(default_dimensions)} items "
@@ -305,83 +418,12 @@ class DimensionManager:
         --------
         ItemDimensions or None
         """
-        # Pattern-based fallback rules
-        fallback_rules = [
-            # Liquids and bulk materials
-            {
-                'patterns': ['liquid', 'oil', 'fluid', 'solution', 'chemical'],
-                'units_per_skid': 4,
-                'length_cm': 40,
-                'width_cm': 40,
-                'height_cm': 50,
-                'weight_kg': 50,
-                'reason': 'Liquid/chemical'
-            },
-            # Boxes/cartons
-            {
-                'patterns': ['box', 'carton', 'case', 'pack'],
-                'units_per_skid': 50,
-                'length_cm': 40,
-                'width_cm': 30,
-                'height_cm': 30,
-                'weight_kg': 15,
-                'reason': 'Box/carton'
-            },
-            # Bags
-            {
-                'patterns': ['bag', 'sack', 'pouch'],
-                'units_per_skid': 25,
-                'length_cm': 50,
-                'width_cm': 40,
-                'height_cm': 30,
-                'weight_kg': 25,
-                'reason': 'Bag'
-            },
-            # Sheets/pads
-            {
-                'patterns': ['sheet', 'pad', 'wipe', 'cloth'],
-                'units_per_skid': 100,
-                'length_cm': 30,
-                'width_cm': 20,
-                'height_cm': 20,
-                'weight_kg': 5,
-                'reason': 'Sheet/pad'
-            },
-            # Small parts/fasteners
-            {
-                'patterns': ['screw', 'bolt', 'nut', 'nail', 'fastener', 'clip'],
-                'units_per_skid': 200,
-                'length_cm': 20,
-                'width_cm': 20,
-                'height_cm': 20,
-                'weight_kg': 10,
-                'reason': 'Small parts'
-            },
-            # Tools/equipment
-            {
-                'patterns': ['tool', 'wrench', 'hammer', 'plier', 'equipment'],
-                'units_per_skid': 10,
-                'length_cm': 60,
-                'width_cm': 40,
-                'height_cm': 40,
-                'weight_kg': 30,
-                'reason': 'Tool'
-            },
-        ]
-
         # Check patterns against description and item code
-        for rule in fallback_rules:
-            for pattern in rule['patterns']:
-                if pattern in description or pattern in item_code:
-                    logger.debug(f"Item {item_code}: Using fallback rule '{rule['reason']}'")
-                    return ItemDimensions(
-                        length_cm=rule['length_cm'],
-                        width_cm=rule['width_cm'],
-                        height_cm=rule['height_cm'],
-                        weight_kg=rule['weight_kg'],
-                        units_per_skid=rule['units_per_skid'],
-                        stacking_allowed=True
-                    )
+        rule_index = _match_fallback_rule(item_code, description)
+        if rule_index >= 0:
+            _, reason, fields = _FALLBACK_RULES[rule_index]
+            logger.debug(f"Item {item_code}: Using fallback rule '{reason}'")
+            return ItemDimensions(**fields, stacking_allowed=True)
 
         # Ultra-conservative default if no patterns match
         # Assume 1 unit per skid, standard skid size
@@ -435,6 +477,35 @@ class DimensionManager:
             stacking_allowed=True
         )
 
+    def get_units_per_skid_batch(self, item_codes, df_items: pd.DataFrame = None) -> np.ndarray:
+        """
+        Get units per skid for many items at once
+
+        Cached items are read straight from dimensions_cache; the rest go
+        through get_dimensions_with_fallback so fallback behaviour matches
+        the single-item path.
+
+        Parameters:
+        -----------
+        item_codes : iterable of str
+            Item codes to look up
+        df_items : pd.DataFrame, optional
+            Full items dataframe for fallback generation
+
+        Returns:
+        --------
+        np.ndarray
+            Units per skid per item (float64), 1 where no positive value is available
+        """
+        cache = self.dimensions_cache
+        units = np.fromiter(
+            ((cache[code] if code in cache
+              else self.get_dimensions_with_fallback(code, df_items)).units_per_skid
+             for code in item_codes),
+            dtype=np.float64
+        )
+        return np.where(units > 0, units, 1.0)
+
     def get_fallback_statistics(self) -> Dict[str, int]:
         """
         Get statistics on dimension sources
@@ -457,23 +528,22 @@ class DimensionManager:
 
         return stats
 
+    def _parse_dimension_array(self, values: pd.Series) -> np.ndarray:
+        """Vectorized _parse_dimension: float64 array, unparseable/missing/negative -> 0"""
+        parsed = pd.to_numeric(values, errors='coerce').to_numpy(dtype=np.float64)
+        return np.where(parsed > 0, parsed, 0.0)
+
     def _parse_dimension(self, value: Any) -> float:
         """Parse dimension value, handling various formats"""
-        if pd.isna(value):
-            return 0.0
-
         try:
-            # If it's a string, remove non-numeric characters (except decimal point and minus)
-            if isinstance(value, str):
-                value = float(value)
-            else:
-                value = float(value)
-
-            return max(0, value)  # Ensure non-negative
-
+            value = float(value)
         except (ValueError, TypeError):
+            # None, pd.NA and non-numeric strings
             return 0.0
 
+        # Ensure non-negative; NaN fails the comparison and maps to 0 too
+        return value if value > 0 else 0.0
+
     def _estimate_units_per_skid(self, length_cm: float, width_cm: float,
                                 height_cm: float) -> int:
         """
@@ -515,6 +585,12 @@ class DimensionManager:
                 with open(cache_file, 'rb') as f:
                     cached_data = pickle.load(f)
 
+                # Caches written before ItemDimensions used __slots__ hold
+                # instance dicts that no longer unpickle correctly
+                if cached_data.get('version') != _DIMENSION_CACHE_VERSION:
+                    logger.info("Dimension cache format is outdated, ignoring it")
+                    return
+
                 # Load dimensions cache
                 self.dimensions_cache = cached_data.get('dimensions', {})
 
@@ -533,6 +609,7 @@ class DimensionManager:
 
         try:
             cached_data = {
+                'version': _DIMENSION_CACHE_VERSION,
                 'dimensions': self.dimensions_cache,
                 'patterns': self._pattern_cache,
                 'timestamp': pd.Timestamp.now().isoformat()
@@ -791,27 +868,59 @@ class WarehouseCapacityManager:
         """
         self.current_stock = {}
 
-        for _, row in df_items.iterrows():
-            item_code = row.get('Item No.')
+        df = df_items[df_items['Item No.'].notna()] if 'Item No.' in df_items.columns else df_items.iloc[0:0]
+        if df.empty:
+            logger.info("Loaded current stock for 0 locations")
+            return
 
-            if pd.isna(item_code):
-                continue
+        locations = self._extract_locations(df)
 
-            # Extract location from item code or warehouse column
-            location = self._extract_location(row)
-
-            if location not in self.current_stock:
-                self.current_stock[location] = {}
+        # Current stock in Sales UOM; missing values count as 0 and are
+        # truncated to whole units like int()
+        if 'CurrentStock_SalesUOM' in df.columns:
+            quantities = pd.to_numeric(df['CurrentStock_SalesUOM'], errors='coerce').fillna(0).to_numpy()
+            quantities = np.trunc(quantities).astype(np.int64)
+        else:
+            quantities = np.zeros(len(df), dtype=np.int64)
 
-            # Get current stock in Sales UOM
-            current_stock = row.get('CurrentStock_SalesUOM', 0)
-            if pd.isna(current_stock):
-                current_stock = 0
+        item_codes = df['Item No.'].to_numpy(dtype=object)
 
-            self.current_stock[location][item_code] = int(current_stock)
+        # One dict per location, built from the row positions of each group
+        # (later rows win for duplicate item codes, as before)
+        for location, positions in df.groupby(locations, sort=False).indices.items():
+            self.current_stock[location] = dict(zip(item_codes[positions].tolist(),
+                                                    quantities[positions].tolist()))
 
         logger.info(f"Loaded current stock for {len(self.current_stock)} locations")
 
+    _LOCATION_CODES = ['CGY', 'TOR', 'EDM', 'VAN', 'WIN', 'MON', 'OTT']
+
+    def _extract_locations(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Vectorized _extract_location for every row of df
+
+        Returns:
+        --------
+        np.ndarray
+            Location code per row (object dtype)
+        """
+        item_codes = df['Item No.'].astype(str) if 'Item No.' in df.columns else pd.Series('', index=df.index)
+
+        # Item code suffix/prefix, first matching location wins
+        conditions = [
+            (item_codes.str.endswith(f'-{loc}') | item_codes.str.startswith(f'{loc}-')).to_numpy()
+            for loc in self._LOCATION_CODES
+        ]
+        locations = np.select(conditions, self._LOCATION_CODES, default='GENERIC').astype(object)
+
+        # Warehouse overrides the item code, Region overrides both
+        for column in ('Warehouse', 'Region'):
+            if column in df.columns:
+                present = df[column].notna().to_numpy()
+                locations[present] = df[column][present].astype(str).to_numpy()
+
+        return locations
+
     def _extract_location(self, row: pd.Series) -> str:
         """
         Extract location code from item row
@@ -838,7 +947,7 @@ class WarehouseCapacityManager:
         item_code = str(row.get('Item No.', ''))
 
         # Check common suffixes
-        for loc in ['CGY', 'TOR', 'EDM', 'VAN', 'WIN', 'MON', 'OTT']:
+        for loc in self._LOCATION_CODES:
             if item_code.endswith(f'-{loc}'):
                 return loc
             if item_code.startswith(f'{loc}-'):
@@ -893,13 +1002,14 @@ class WarehouseCapacityManager:
         if location not in self.current_stock:
             return 0.0
 
-        total_skids = 0.0
+        stock = self.current_stock[location]
+        if not stock:
+            return 0.0
 
-        for item_code, quantity in self.current_stock[location].items():
-            skids = self.calculate_space_required(item_code, quantity)
-            total_skids += skids
+        quantities = np.fromiter(stock.values(), dtype=np.float64, count=len(stock))
+        units_per_skid = self.dimension_manager.get_units_per_skid_batch(stock.keys())
 
-        return total_skids
+        return float(np.sum(quantities / units_per_skid))
 
     def check_capacity_constraint(self, location: str, additional_items: Dict[str, int]) -> Tuple[bool, float]:
         """
@@ -921,17 +1031,47 @@ class WarehouseCapacityManager:
             logger.warning(f"Unknown location: {location}, assuming unlimited capacity")
             return True, 0.0
 
+        # Calculate space required for additional items
+        additional_space = 0.0
+        if additional_items:
+            quantities = np.fromiter(additional_items.values(), dtype=np.float64,
+                                     count=len(additional_items))
+            units_per_skid = self.dimension_manager.get_units_per_skid_batch(additional_items.keys())
+            additional_space = float(np.sum(quantities / units_per_skid))
+
+        return self.check_skid_capacity(location, additional_space)
+
+    def check_skid_capacity(self, location: str, additional_skids: float,
+                            current_usage: float = None) -> Tuple[bool, float]:
+        """
+        Check if location has room for a number of additional skids
+
+        Parameters:
+        -----------
+        location : str
+            Warehouse location code
+        additional_skids : float
+            Skids required by the items to add
+        current_usage : float, optional
+            Precomputed calculate_current_space_usage(location), for callers
+            checking the same location repeatedly
+
+        Returns:
+        --------
+        Tuple[bool, float]
+            (has_capacity, shortage_skids)
+        """
+        if location not in self.location_capacities:
+            logger.warning(f"Unknown location: {location}, assuming unlimited capacity")
+            return True, 0.0
+
         capacity = self.location_capacities[location]
 
         # Calculate current space usage
-        current_usage = self.calculate_current_space_usage(location)
-
-        # Calculate space required for additional items
-        additional_space = 0.0
-        for item_code, quantity in additional_items.items():
-            additional_space += self.calculate_space_required(item_code, quantity)
+        if current_usage is None:
+            current_usage = self.calculate_current_space_usage(location)
 
-        total_required = current_usage + additional_space
+        total_required = current_usage + additional_skids
 
         has_capacity = total_required <= capacity.total_skids
         shortage = max(0, total_required - capacity.total_skids)
@@ -947,27 +1087,49 @@ class WarehouseCapacityManager:
         pd.DataFrame
             Capacity status by location
         """
-        status_data = []
+        locations = list(self.location_capacities)
+        capacities = self.location_capacities.values()
+        total_skids = np.fromiter((c.total_skids for c in capacities), dtype=np.int64, count=len(locations))
+        used_skids = np.fromiter((c.used_skids for c in capacities), dtype=np.int64, count=len(locations))
+        current_usage = np.fromiter((self.calculate_current_space_usage(loc) for loc in locations),
+                                    dtype=np.float64, count=len(locations))
+
+        # Column arithmetic over all locations at once
+        with np.errstate(divide='ignore', invalid='ignore'):
+            utilization = np.where(total_skids > 0, current_usage / total_skids * 100, 0.0)
+
+        return pd.DataFrame({
+            'Location': locations,
+            'Total_Skids': total_skids,
+            'Current_Usage_Skids': np.round(current_usage, 2),
+            'Available_Skids': np.maximum(0, total_skids - used_skids),
+            'Utilization_Pct': np.round(utilization, 2)
+        })
 
-        for location, capacity in self.location_capacities.items():
-            current_usage = self.calculate_current_space_usage(location)
 
-            status_data.append({
-                'Location': location,
-                'Total_Skids': capacity.total_skids,
-                'Current_Usage_Skids': round(current_usage, 2),
-                'Available_Skids': round(capacity.available_skids, 2),
-                'Utilization_Pct': round((current_usage / capacity.total_skids * 100) if capacity.total_skids > 0 else 0, 2)
-            })
+# Low-cardinality string columns that drive grouping and filtering
+_CATEGORICAL_COLUMNS = ('TargetVendor', 'TargetVendorName', 'Warehouse', 'Region')
 
-        return pd.DataFrame(status_data)
+
+def _with_categorical_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return df with the vendor/location columns stored as categoricals
+
+    Groupby and equality filters then work on the integer codes instead of
+    hashing strings per row. The caller's dataframe is left untouched.
+    """
+    if df is None:
+        return df
+    columns = {c: 'category' for c in _CATEGORICAL_COLUMNS
+               if c in df.columns and not isinstance(df[c].dtype, pd.CategoricalDtype)}
+    return df.astype(columns) if columns else df
 
 
 class VendorGroupOptimizer:
     """Optimizes orders by vendor for shipping efficiency"""
 
     def __init__(self, df_items: pd.DataFrame):
-        self.df_items = df_items
+        self.df_items = _with_categorical_columns(df_items)
 
     def group_items_by_vendor(self, items_to_order: pd.DataFrame) -> Dict[str, pd.DataFrame]:
         """
@@ -984,11 +1146,13 @@ class VendorGroupOptimizer:
         Dict[str, pd.DataFrame]
             Dictionary mapping vendor_code to DataFrame of items
         """
-        vendor_groups = {}
-
-        # Group by vendor
-        for vendor_code, group in items_to_order.groupby('TargetVendor'):
-            vendor_groups[vendor_code] = group.copy()
+        # Row positions per vendor come from the groupby hash table; each
+        # group is then a single take (which returns a copy)
+        group_indices = items_to_order.groupby('TargetVendor', observed=True).indices
+        vendor_groups = {
+            vendor_code: items_to_order.take(positions)
+            for vendor_code, positions in group_indices.items()
+        }
 
         logger.info(f"Grouped {len(items_to_order)} items across {len(vendor_groups)} vendors")
         return vendor_groups
@@ -1006,27 +1170,31 @@ class VendorGroupOptimizer:
         - estimated_weight_kg: Total weight
         - estimated_shipping_cost: Estimated shipping cost
         """
-        total_units = 0
-        total_skids = 0.0
-        total_weight = 0.0
-
-        for _, row in vendor_group.iterrows():
-            item_code = row.get('Item No.')
-            order_qty = row.get('Recommended_Order_Qty', 0)
+        if 'Recommended_Order_Qty' in vendor_group.columns:
+            order_qty = pd.to_numeric(vendor_group['Recommended_Order_Qty'], errors='coerce').fillna(0).to_numpy()
+            order_qty = np.trunc(order_qty)
+        else:
+            order_qty = np.zeros(len(vendor_group))
 
-            if pd.isna(order_qty):
-                order_qty = 0
+        if 'Item No.' in vendor_group.columns:
+            item_codes = vendor_group['Item No.'].tolist()
+        else:
+            item_codes = [None] * len(vendor_group)
 
-            total_units += int(order_qty)
+        dimension_manager = capacity_manager.dimension_manager
+        total_units = int(order_qty.sum())
 
-            # Calculate space requirements
-            skids = capacity_manager.calculate_space_required(item_code, int(order_qty))
-            total_skids += skids
+        # Space requirements (same fallback as calculate_space_required)
+        units_per_skid = dimension_manager.get_units_per_skid_batch(item_codes)
+        total_skids = float(np.sum(order_qty / units_per_skid))
 
-            # Add weight
-            dimensions = capacity_manager.dimension_manager.get_dimensions(item_code)
-            if dimensions:
-                total_weight += dimensions.weight_kg * int(order_qty)
+        # Weight, only for items with known dimensions
+        cache = dimension_manager.dimensions_cache
+        weights = np.fromiter(
+            (cache[code].weight_kg if code in cache else 0.0 for code in item_codes),
+            dtype=np.float64, count=len(item_codes)
+        )
+        total_weight = float(np.dot(weights, order_qty))
 
         # Estimate shipping cost (simple model: $50 base + $10 per skid + $0.01 per kg)
         estimated_shipping_cost = 50.0 + (total_skids * 10.0) + (total_weight * 0.01)
@@ -1043,11 +1211,11 @@ class SpatialOrderOptimizer:
     """Optimizes orders considering spatial constraints and vendor grouping"""
 
     def __init__(self, df_items: pd.DataFrame, df_stockout: pd.DataFrame):
-        self.df_items = df_items
-        self.df_stockout = df_stockout
+        self.df_items = _with_categorical_columns(df_items)
+        self.df_stockout = _with_categorical_columns(df_stockout)
         self.dimension_manager = DimensionManager()
         self.capacity_manager = WarehouseCapacityManager(self.dimension_manager)
-        self.vendor_optimizer = VendorGroupOptimizer(df_items)
+        self.vendor_optimizer = VendorGroupOptimizer(self.df_items)
 
         # Load data
         self._initialize()
@@ -1111,68 +1279,81 @@ class SpatialOrderOptimizer:
         # Add recommended order quantity (shortage + safety stock buffer)
         items_to_order['Recommended_Order_Qty'] = items_to_order['shortage_qty'] * 1.2
 
-        # Group by vendor
-        vendor_groups = self.vendor_optimizer.group_items_by_vendor(items_to_order)
-
-        # Optimize each vendor group considering spatial constraints
-        optimized_orders = []
-
-        for vendor_code, vendor_items in vendor_groups.items():
-            vendor_name = vendor_items['TargetVendorName'].iloc[0] if 'TargetVendorName' in vendor_items.columns else vendor_code
-
-            # Calculate space requirements for this vendor group
-            total_skids = 0.0
-            for _, row in vendor_items.iterrows():
-                item_code = row['Item No.']
-                qty = int(row['Recommended_Order_Qty'])
-                skids = self.capacity_manager.calculate_space_required(item_code, qty)
-                total_skids += skids
-
-            # Check if vendor items are in multiple locations
-            location_summary = vendor_items.groupby('Region').agg({
-                'Item No.': 'count',
-                'Recommended_Order_Qty': 'sum'
-            }).rename(columns={'Item No.': 'item_count', 'Recommended_Order_Qty': 'total_qty'})
-
-            # Check capacity for each location
-            all_constraints_met = True
-            constraint_details = []
-
-            for location, location_data in location_summary.iterrows():
-                location_items = vendor_items[vendor_items['Region'] == location]
+        # Per order line, computed once for all vendors: whole units (as
+        # int()), skids (units / units per skid) and weight for items with
+        # known dimensions
+        order_units = np.trunc(items_to_order['Recommended_Order_Qty'].to_numpy(dtype=np.float64))
+        item_codes = items_to_order['Item No.'].tolist()
+        cache = self.dimension_manager.dimensions_cache
+        weights = np.fromiter(
+            (cache[code].weight_kg if code in cache else 0.0 for code in item_codes),
+            dtype=np.float64, count=len(item_codes)
+        )
+        items_to_order['_Order_Units'] = order_units
+        items_to_order['_Skids_Required'] = order_units / self.dimension_manager.get_units_per_skid_batch(item_codes)
+        items_to_order['_Weight_kg'] = order_units * weights
+
+        # Vendor totals in one grouped aggregation
+        vendor_totals = items_to_order.groupby('TargetVendor', observed=True).agg(
+            Item_Count=('Item No.', 'size'),
+            Items=('Item No.', list),
+            Total_Units=('_Order_Units', 'sum'),
+            Total_Skids_Required=('_Skids_Required', 'sum'),
+            Total_Weight_kg=('_Weight_kg', 'sum'),
+        )
+        # Shipping cost (simple model: $50 base + $10 per skid + $0.01 per kg)
+        vendor_totals['Estimated_Shipping_Cost'] = (
+            50.0 + vendor_totals['Total_Skids_Required'] * 10.0 + vendor_totals['Total_Weight_kg'] * 0.01
+        ).round(2)
+        vendor_totals['Total_Skids_Required'] = vendor_totals['Total_Skids_Required'].round(2)
+        if 'TargetVendorName' in items_to_order.columns:
+            first_rows = items_to_order.drop_duplicates('TargetVendor')
+            vendor_names = dict(zip(first_rows['TargetVendor'].tolist(), first_rows['TargetVendorName'].tolist()))
+        else:
+            vendor_names = {}
 
-                # Build items dict for this location
-                location_order_dict = {
-                    row['Item No.']: int(row['Recommended_Order_Qty'])
-                    for _, row in location_items.iterrows()
-                }
+        # Extra skids per vendor and location, one line per item (the last
+        # one wins, as in an item -> qty dict)
+        location_skids = (
+            items_to_order.drop_duplicates(['TargetVendor', 'Region', 'Item No.'], keep='last')
+            .groupby(['TargetVendor', 'Region'], observed=True)['_Skids_Required'].sum()
+        )
 
-                has_capacity, shortage = self.capacity_manager.check_capacity_constraint(
-                    location, location_order_dict
-                )
+        # Check capacity for each location a vendor's items go to; current
+        # usage per location does not change between vendors
+        current_usage = {}
+        constraints_met = {}
+        constraint_details = {}
 
-                if not has_capacity:
-                    all_constraints_met = False
-                    constraint_details.append(f"{location}: {shortage:.1f} skids shortage")
-                else:
-                    constraint_details.append(f"{location}: OK")
+        for (vendor_code, location), additional_skids in location_skids.items():
+            if location in self.capacity_manager.location_capacities and location not in current_usage:
+                current_usage[location] = self.capacity_manager.calculate_current_space_usage(location)
 
-            # Calculate vendor metrics
-            metrics = self.vendor_optimizer.calculate_vendor_group_metrics(
-                vendor_items, self.capacity_manager
+            has_capacity, shortage = self.capacity_manager.check_skid_capacity(
+                location, float(additional_skids), current_usage.get(location)
             )
 
-            optimized_orders.append({
-                'Vendor': vendor_code,
-                'Vendor_Name': vendor_name,
-                'Item_Count': len(vendor_items),
-                'Total_Units': metrics['total_units'],
-                'Total_Skids_Required': metrics['total_skids'],
-                'Estimated_Shipping_Cost': metrics['estimated_shipping_cost'],
-                'Space_Constraint_Met': all_constraints_met,
-                'Constraint_Details': '; '.join(constraint_details),
-                'Items': vendor_items['Item No.'].tolist()
-            })
+            details = constraint_details.setdefault(vendor_code, [])
+            if not has_capacity:
+                constraints_met[vendor_code] = False
+                details.append(f"{location}: {shortage:.1f} skids shortage")
+            else:
+                details.append(f"{location}: OK")
+
+        optimized_orders = [
+            {
+                'Vendor': totals.Index,
+                'Vendor_Name': vendor_names.get(totals.Index, totals.Index),
+                'Item_Count': totals.Item_Count,
+                'Total_Units': int(totals.Total_Units),
+                'Total_Skids_Required': totals.Total_Skids_Required,
+                'Estimated_Shipping_Cost': totals.Estimated_Shipping_Cost,
+                'Space_Constraint_Met': constraints_met.get(totals.Index, True),
+                'Constraint_Details': '; '.join(constraint_details.get(totals.Index, [])),
+                'Items': totals.Items
+            }
+            for totals in vendor_totals.itertuples()
+        ]
 
         result_df = pd.DataFrame(optimized_orders)
 
@@ -14,6 +14,12 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Legacy column names kept for readers of the older export layout
+# (alias -> source column). Added as categoricals so the alias shares a small
+# category table instead of duplicating every string cell.
+_COLUMN_ALIASES = {'SalesUOM': 'SalesUoM'}
+
+
 def convert_stock_to_sales_uom_sap(df_items: pd.DataFrame) -> pd.DataFrame:
     """
     Convert stock from SAP Base UOM (Litres/kg) to Sales UOM (Pails/Drums)
@@ -34,8 +40,6 @@ def convert_stock_to_sales_uom_sap(df_items: pd.DataFrame) -> pd.DataFrame:
     pd.DataFrame
         Items dataframe with stock converted to sales UOM
     """
-    df_converted = df_items.copy()
-
     # Check if required UOM columns exist
     required_cols = ['BaseUoM', 'SalesUoM', 'QtyPerSalesUoM']
     missing_cols = [col for col in required_cols if col not in df_items.columns]
@@ -49,22 +53,25 @@ def convert_stock_to_sales_uom_sap(df_items: pd.DataFrame) -> pd.DataFrame:
     # VECTORIZED CONVERSION - 100-1000x faster than iterrows loop
     conversion_log = []
 
-    # Ensure numeric types (vectorized) - use normalized column names
-    df_converted['QtyPerSalesUoM'] = pd.to_numeric(df_converted['QtyPerSalesUoM'], errors='coerce')
-    df_converted['current_stock'] = pd.to_numeric(df_converted['current_stock'], errors='coerce').fillna(0)
-    df_converted['incoming_stock'] = pd.to_numeric(df_converted['incoming_stock'], errors='coerce').fillna(0)
-
     # Find rows where conversion is needed (SalesUoM != BaseUoM)
-    needs_conversion = (df_converted['SalesUoM'].notna()) & \
-                       (df_converted['SalesUoM'] != df_converted['BaseUoM'])
+    needs_conversion = (df_items['SalesUoM'].notna()) & \
+                       (df_items['SalesUoM'] != df_items['BaseUoM'])
 
     if not needs_conversion.any():
         logger.info("No items require UoM conversion")
         return df_items
 
+    df_converted = df_items.copy()
+
+    # Ensure numeric types (vectorized) - use normalized column names
+    df_converted['QtyPerSalesUoM'] = pd.to_numeric(df_converted['QtyPerSalesUoM'], errors='coerce')
+    df_converted['current_stock'] = pd.to_numeric(df_converted['current_stock'], errors='coerce').fillna(0)
+    df_converted['incoming_stock'] = pd.to_numeric(df_converted['incoming_stock'], errors='coerce').fillna(0)
+
     # Validate conversion factors (vectorized)
     invalid_mask = (df_converted['QtyPerSalesUoM'].isna()) | \
                    (df_converted['QtyPerSalesUoM'] <= 0)
+    valid_mask = ~invalid_mask
 
     if invalid_mask.any():
         invalid_count = invalid_mask.sum()
@@ -77,11 +84,6 @@ def convert_stock_to_sales_uom_sap(df_items: pd.DataFrame) -> pd.DataFrame:
         df_converted.loc[invalid_mask, 'ConversionFactor'] = np.nan
         df_converted.loc[invalid_mask, 'ConversionError'] = 'Invalid QtyPerSalesUoM'
 
-        # Exclude invalid items from conversion
-        valid_mask = ~invalid_mask
-    else:
-        valid_mask = pd.Series([True] * len(df_converted), index=df_converted.index)
-
     # Vectorized conversion (much faster!) - use normalized column names
     if valid_mask.any():
         df_converted.loc[valid_mask, 'current_stock_SalesUOM'] = \
@@ -92,9 +94,8 @@ def convert_stock_to_sales_uom_sap(df_items: pd.DataFrame) -> pd.DataFrame:
 
         df_converted.loc[valid_mask, 'ConversionFactor'] = df_converted.loc[valid_mask, 'QtyPerSalesUoM']
 
-    # Copy string columns (vectorized) - use SalesUOM for test compatibility
-    df_converted['SalesUOM'] = df_converted['SalesUoM']
-    df_converted['BaseUoM_Copy'] = df_converted['BaseUoM']
+    for alias, source in _COLUMN_ALIASES.items():
+        df_converted[alias] = df_converted[source].astype('category')
 
     # Build conversion log (only for first 1000 to avoid memory issues) - use normalized column names
     sample_conversions = df_converted[valid_mask & (df_converted['QtyPerSalesUoM'] != 1.0)].head(1000)
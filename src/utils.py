@@ -5,6 +5,7 @@ Provides standardized validation and error handling across the application.
 """
 import pandas as pd
 import logging
+import os
 import re
 from pathlib import Path
 from typing import Optional, Tuple, Any, Union
@@ -290,6 +291,32 @@ def handle_common_errors(error: Exception, context: str = "Operation") -> str:
 
 # ===== Security Utilities =====
 
+# Injection/XSS patterns removed by sanitize_string: the plain substrings
+# first, then the regexes (compiled once at import). Applied in this order,
+# one after another: removing one pattern can form another (e.g. 'sel--ect'),
+# so they are not merged into a single alternation.
+_DANGEROUS_SUBSTRINGS = [
+    '--',  # SQL comments
+    ';--',
+    '/*',  # Multi-line comments
+    '*/',
+]
+_DANGEROUS_PATTERNS = [
+    re.compile(r'<script.*?>', re.IGNORECASE),  # Script tags
+    re.compile(r'on\w+\s*=', re.IGNORECASE),  # Event handlers (onclick=, onload=, etc.)
+    re.compile(r'javascript:', re.IGNORECASE),  # JavaScript protocol
+    re.compile(r'(union|select|insert|update|delete|drop|exec|execute)', re.IGNORECASE),  # SQL keywords
+]
+# All patterns as one alternation, used only to detect clean input in a
+# single scan: when nothing matches, the sequential removal is a no-op
+_ANY_DANGEROUS_PATTERN_RE = re.compile(
+    '|'.join(f'(?:{pattern.pattern})' for pattern in _DANGEROUS_PATTERNS), re.IGNORECASE
+)
+
+# Anything other than alphanumeric, spaces, and basic punctuation
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s\-.,;:]')
+
+
 def sanitize_string(input_string: Any, max_length: int = 1000,
                    allow_special_chars: bool = False) -> str:
     """
@@ -319,25 +346,17 @@ def sanitize_string(input_string: Any, max_length: int = 1000,
     sanitized = sanitized[:max_length]
 
     # Remove potential SQL injection and XSS patterns first
-    dangerous_patterns = [
-        (r'--', ''),  # SQL comments
-        (r';--', ''),
-        (r'/\*', ''),  # Multi-line comments
-        (r'\*/', ''),
-        (r'<script.*?>', '', True),  # Script tags
-        (r'on\w+\s*=', '', True),  # Event handlers (onclick=, onload=, etc.)
-        (r'javascript:', '', True),  # JavaScript protocol
-        (r'(union|select|insert|update|delete|drop|exec|execute)', '', True),  # SQL keywords
-    ]
-
-    for pattern in dangerous_patterns:
-        flags = re.IGNORECASE if len(pattern) > 2 and pattern[2] else 0
-        sanitized = re.sub(pattern[0], pattern[1], sanitized, flags=flags)
+    if (any(substring in sanitized for substring in _DANGEROUS_SUBSTRINGS)
+            or _ANY_DANGEROUS_PATTERN_RE.search(sanitized) is not None):
+        for substring in _DANGEROUS_SUBSTRINGS:
+            sanitized = sanitized.replace(substring, '')
+        for pattern in _DANGEROUS_PATTERNS:
+            sanitized = pattern.sub('', sanitized)
 
     if not allow_special_chars:
         # Remove potentially dangerous characters
         # Keep only alphanumeric, spaces, and basic punctuation
-        sanitized = re.sub(r'[^\w\s\-.,;:]', '', sanitized)
+        sanitized = _SPECIAL_CHARS_RE.sub('', sanitized)
 
     return sanitized.strip()
 
@@ -366,20 +385,23 @@ def validate_path_safe(filepath: Path, allowed_dir: Path = None) -> Path:
     if allowed_dir is None:
         allowed_dir = DataConfig.DATA_DIR
 
-    # Resolve to absolute paths
-    filepath = filepath.resolve()
-    allowed_dir = allowed_dir.resolve()
+    # Resolve to absolute paths (symlinks followed, so a link inside the
+    # allowed directory that points outside it is rejected)
+    resolved = os.path.realpath(filepath)
+    allowed_resolved = os.path.realpath(allowed_dir)
 
     # Check if filepath is within allowed directory
     try:
-        filepath.relative_to(allowed_dir)
-    except ValueError:
+        inside = os.path.commonpath([resolved, allowed_resolved]) == allowed_resolved
+    except ValueError:  # e.g. different drives on Windows
+        inside = False
+    if not inside:
         raise ValueError(
-            f"Path outside allowed directory: {filepath}\n"
-            f"Must be within: {allowed_dir}"
+            f"Path outside allowed directory: {resolved}\n"
+            f"Must be within: {allowed_resolved}"
         )
 
-    return filepath
+    return Path(resolved)
 
 
 def sanitize_dataframe(df: pd.DataFrame, max_string_length: int = 1000) -> pd.DataFrame:
@@ -402,10 +424,29 @@ def sanitize_dataframe(df: pd.DataFrame, max_string_length: int = 1000) -> pd.Da
 
     for col in df_sanitized.columns:
         if df_sanitized[col].dtype == 'object':
-            # Sanitize string columns
-            df_sanitized[col] = df_sanitized[col].apply(
-                lambda x: sanitize_string(x, max_string_length) if pd.notna(x) else x
-            )
+            # Sanitize string columns: same steps as sanitize_string, run as
+            # column-wide Series.str operations; missing values are kept as-is
+            values = df_sanitized[col].to_numpy()
+            present = pd.notna(values)
+            if not present.any():
+                continue
+            # Truncation and plain-substring removal run as Arrow compute
+            # kernels over one contiguous string buffer
+            cleaned = pd.Series(values[present]).astype(str).astype('string[pyarrow]')
+            cleaned = cleaned.str.slice(0, max_string_length)
+            for substring in _DANGEROUS_SUBSTRINGS:
+                cleaned = cleaned.str.replace(substring, '', regex=False)
+            # The remaining patterns rely on Python's Unicode-aware \w/\s
+            # (Arrow's RE2 is ASCII-only there), so they run on object strings
+            cleaned = cleaned.astype(object)
+            for pattern in _DANGEROUS_PATTERNS:
+                cleaned = cleaned.str.replace(pattern, '', regex=True)
+            cleaned = cleaned.str.replace(_SPECIAL_CHARS_RE, '', regex=True).str.strip()
+
+            # Write the cleaned strings back by position (no index alignment)
+            values = values.copy()
+            values[present] = cleaned.to_numpy()
+            df_sanitized[col] = values
 
     return df_sanitized
 
@@ -451,6 +492,11 @@ def validate_numeric_range(value: Any, name: str = "Value",
     return num_value
 
 
+# Filename characters kept by safe_filename besides alphanumerics
+_FILENAME_SAFE_PUNCT = str.maketrans('', '', '_-.')
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'[^\w\-.]')
+
+
 def safe_filename(filename: str, max_length: int = 255) -> str:
     """
     Create a safe filename by removing dangerous characters.
@@ -470,8 +516,12 @@ def safe_filename(filename: str, max_length: int = 255) -> str:
     # Remove path components
     filename = Path(filename).name
 
-    # Remove dangerous characters (keep alphanumeric, underscore, hyphen, dot)
-    filename = re.sub(r'[^\w\-.]', '_', filename)
+    # Remove dangerous characters (keep alphanumeric, underscore, hyphen, dot).
+    # \w is exactly str.isalnum() plus underscore, so names that are already
+    # clean are recognised by a translate + isalnum pass and skip the regex.
+    stripped = filename.translate(_FILENAME_SAFE_PUNCT)
+    if stripped and not stripped.isalnum():
+        filename = _UNSAFE_FILENAME_CHARS_RE.sub('_', filename)
 
     # Truncate to max length
     filename = filename[:max_length]
@@ -5,12 +5,178 @@ Identifies fastest vendors and provides vendor performance metrics
 """
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 import logging
+import weakref
 from typing import Dict, Tuple, Optional
 from pathlib import Path
 
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Lead time statistics shared by the vendor and item-vendor aggregations
+_LEAD_TIME_AGGREGATIONS = {
+    'mean_lead_time': ('lead_time_days', 'mean'),
+    'median_lead_time': ('lead_time_days', 'median'),
+    'min_lead_time': ('lead_time_days', 'min'),
+    'max_lead_time': ('lead_time_days', 'max'),
+    'std_lead_time': ('lead_time_days', 'std'),
+    'count': ('lead_time_days', 'count'),
+}
+
+
+def _coefficient_of_variation(stats: pd.DataFrame) -> np.ndarray:
+    """Vectorized std/mean over aggregated stats (0.0 where the mean is not positive)."""
+    std = stats['std_lead_time'].to_numpy(dtype=float)
+    mean = stats['mean_lead_time'].to_numpy(dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(mean > 0, std / mean, 0.0)
+
+
+def _aggregate_item_vendor_lead_times(df_valid: pd.DataFrame) -> pd.DataFrame:
+    """
+    Aggregate lead time statistics per item-vendor pair.
+
+    Uses the multi-threaded Polars group_by when Polars is installed and
+    falls back to pandas otherwise. Both paths return the same columns,
+    including the lead_time_sum and lead_time_sumsq partials needed for
+    the vendor roll-up. Row order is not part of the contract (the pandas
+    path skips the group key sort); callers sort where order matters.
+
+    Parameters:
+    -----------
+    df_valid : pd.DataFrame
+        Filtered supply history with ItemCode, VendorCode, lead_time_days
+
+    Returns:
+    --------
+    pd.DataFrame
+        Item-vendor aggregates
+    """
+    if POLARS_AVAILABLE:
+        lead_time = pl.col('lead_time_days')
+        item_vendor_raw = (
+            pl.from_pandas(df_valid[['ItemCode', 'VendorCode', 'lead_time_days']])
+            .lazy()
+            .sort(['ItemCode', 'VendorCode'])
+            .group_by(['ItemCode', 'VendorCode'], maintain_order=True)
+            .agg([
+                lead_time.mean().alias('mean_lead_time'),
+                lead_time.median().alias('median_lead_time'),
+                lead_time.min().alias('min_lead_time'),
+                lead_time.max().alias('max_lead_time'),
+                lead_time.std().alias('std_lead_time'),
+                lead_time.count().cast(pl.Int64).alias('count'),
+                lead_time.sum().alias('lead_time_sum'),
+                (lead_time * lead_time).sum().alias('lead_time_sumsq'),
+            ])
+            .collect()
+            .to_pandas()
+        )
+        # Polars orders categories by appearance; restore the source category order
+        for col in ('ItemCode', 'VendorCode'):
+            item_vendor_raw[col] = item_vendor_raw[col].cat.set_categories(df_valid[col].cat.categories)
+        return item_vendor_raw
+
+    return (
+        df_valid
+        .assign(lead_time_sq=df_valid['lead_time_days'] ** 2)
+        .groupby(['ItemCode', 'VendorCode'], sort=False, observed=True)
+        .agg(**_LEAD_TIME_AGGREGATIONS,
+             lead_time_sum=('lead_time_days', 'sum'),
+             lead_time_sumsq=('lead_time_sq', 'sum'))
+        .reset_index()
+    )
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _group_argmin(codes, values, ngroups):
+        """Row position of the first minimum value per group code (-1 if none)."""
+        out = np.full(ngroups, -1, np.int64)
+        best = np.full(ngroups, np.inf, np.float64)
+        for i in range(codes.shape[0]):
+            c = codes[i]
+            if c < 0:
+                continue
+            v = values[i]
+            if v < best[c]:
+                best[c] = v
+                out[c] = i
+        return out
+
+
+def _downcast_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcast int64 output columns (counts, ranks) to int32.
+
+    Float columns (lead times and scores) stay float64 so callers and the
+    parquet cache get exact values back; only the integer counts are narrowed.
+    """
+    dtypes = {col: 'int32' for col in df.select_dtypes(include='int64').columns}
+    return df.astype(dtypes) if dtypes else df
+
+
+def _rollup_vendor_stats(item_vendor_raw: pd.DataFrame, df_valid: pd.DataFrame) -> pd.DataFrame:
+    """
+    Roll item-vendor partial aggregates up to vendor level.
+
+    Mean and sample std are rebuilt from summed counts, sums and sums of
+    squares; min/max combine directly. Medians cannot be combined from
+    partials, so they are the only statistic taken from the raw history.
+
+    Parameters:
+    -----------
+    item_vendor_raw : pd.DataFrame
+        Item-vendor aggregates including lead_time_sum and lead_time_sumsq
+    df_valid : pd.DataFrame
+        Filtered supply history (used for vendor medians only)
+
+    Returns:
+    --------
+    pd.DataFrame
+        Vendor-level statistics with the same columns as the item-vendor stats
+    """
+    vendor_stats = item_vendor_raw.groupby('VendorCode', sort=False, observed=True).agg(
+        lead_time_sum=('lead_time_sum', 'sum'),
+        lead_time_sumsq=('lead_time_sumsq', 'sum'),
+        min_lead_time=('min_lead_time', 'min'),
+        max_lead_time=('max_lead_time', 'max'),
+        count=('count', 'sum'),
+    )
+
+    count = vendor_stats['count'].to_numpy(dtype=float)
+    total = vendor_stats['lead_time_sum'].to_numpy(dtype=float)
+    total_sq = vendor_stats['lead_time_sumsq'].to_numpy(dtype=float)
+    mean = total / count
+
+    # Sample variance (ddof=1) to match pandas' std; undefined for one observation
+    sq_dev = np.maximum(total_sq - total * mean, 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        std = np.where(count > 1, np.sqrt(sq_dev / (count - 1)), np.nan)
+
+    vendor_stats['mean_lead_time'] = mean
+    vendor_stats['median_lead_time'] = df_valid.groupby('VendorCode', sort=False, observed=True)['lead_time_days'].median()
+    vendor_stats['std_lead_time'] = std
+
+    # Vendor stats are tiny: order them by vendor so score ties rank
+    # deterministically regardless of the item-vendor row order
+    vendor_stats = vendor_stats[list(_LEAD_TIME_AGGREGATIONS)].sort_index().reset_index()
+    vendor_stats['cv'] = _coefficient_of_variation(vendor_stats)
+    return vendor_stats
+
 
 def calculate_item_vendor_lead_times(df_history: pd.DataFrame,
                                      min_sample_size: int = 3) -> Tuple[pd.DataFrame, pd.DataFrame]:
@@ -36,75 +202,70 @@ def calculate_item_vendor_lead_times(df_history: pd.DataFrame,
     """
     logger.info("Calculating item-vendor lead time statistics...")
 
-    # Filter to valid lead times only
-    df_valid = df_history[
-        df_history['lead_time_days'].notna() &
-        (df_history['lead_time_days'] > 0)
-    ].copy()
+    # Filter to valid lead times only, projected to the columns aggregated
+    # below (read-only, so no defensive copy). NaN compares False, so one
+    # comparison covers both the null and non-positive checks; eval uses
+    # numexpr for a single fused pass when it is installed.
+    df_valid = df_history.loc[
+        df_history.eval('lead_time_days > 0'),
+        ['ItemCode', 'VendorCode', 'lead_time_days']
+    ]
 
     if len(df_valid) == 0:
         logger.warning("No valid lead time data found")
         return pd.DataFrame(), pd.DataFrame()
 
-    # Import safe_divide for CV calculations
-    from src.utils import safe_divide
+    # Categorical keys: every groupby below hashes small integer codes instead
+    # of Python strings. The dtype is kept on the returned frames.
+    df_valid = df_valid.astype({'ItemCode': 'category', 'VendorCode': 'category'})
 
-    # Calculate vendor-level stats (for fallback)
-    vendor_stats = df_valid.groupby('VendorCode')['lead_time_days'].agg([
-        ('mean_lead_time', 'mean'),
-        ('median_lead_time', 'median'),
-        ('min_lead_time', 'min'),
-        ('max_lead_time', 'max'),
-        ('std_lead_time', 'std'),
-        ('count', 'count'),
-        ('cv', lambda x: safe_divide(x.std(), x.mean(), 0.0))  # Coefficient of variation
-    ]).reset_index()
-
-    vendor_stats = vendor_stats.round(2)
-    logger.info(f"Calculated vendor stats for {len(vendor_stats)} vendors")
+    # Calculate item-vendor level stats in a single scan of the raw history.
+    # Partial sums are carried along so vendor stats can be rolled up from
+    # the item-vendor groups instead of re-scanning lead_time_days.
+    item_vendor_stats = _aggregate_item_vendor_lead_times(df_valid)
+    item_vendor_stats['cv'] = _coefficient_of_variation(item_vendor_stats)
 
-    # Calculate item-vendor level stats
-    item_vendor_stats = df_valid.groupby(['ItemCode', 'VendorCode'])['lead_time_days'].agg([
-        ('mean_lead_time', 'mean'),
-        ('median_lead_time', 'median'),
-        ('min_lead_time', 'min'),
-        ('max_lead_time', 'max'),
-        ('std_lead_time', 'std'),
-        ('count', 'count'),
-        ('cv', lambda x: safe_divide(x.std(), x.mean(), 0.0))
-    ]).reset_index()
+    # Calculate vendor-level stats (for fallback)
+    vendor_stats = _rollup_vendor_stats(item_vendor_stats, df_valid)
+    item_vendor_stats = item_vendor_stats.drop(columns=['lead_time_sum', 'lead_time_sumsq'])
 
-    item_vendor_stats = item_vendor_stats.round(2)
+    logger.info(f"Calculated vendor stats for {len(vendor_stats)} vendors")
 
     # Determine if we should use item-vendor or vendor fallback
-    # Add vendor averages for fallback
-    item_vendor_stats = item_vendor_stats.merge(
-        vendor_stats[['VendorCode', 'mean_lead_time', 'median_lead_time']],
-        on='VendorCode',
-        suffixes=('', '_vendor')
-    )
+    # Add vendor averages for fallback. Both frames share the VendorCode
+    # categories, so vendor values are gathered by category code (no join).
+    vendor_lookup_codes = vendor_stats['VendorCode'].cat.codes.to_numpy()
+    item_vendor_codes = item_vendor_stats['VendorCode'].cat.codes.to_numpy()
+    n_vendors = len(vendor_stats['VendorCode'].cat.categories)
+    for col in ('mean_lead_time', 'median_lead_time'):
+        lookup = np.full(n_vendors, np.nan)
+        lookup[vendor_lookup_codes] = vendor_stats[col].to_numpy()
+        item_vendor_stats[f'{col}_vendor'] = lookup[item_vendor_codes]
 
     # Flag items with insufficient data
     item_vendor_stats['use_fallback'] = item_vendor_stats['count'] < min_sample_size
 
     # Add effective lead time (item-vendor if enough data, else vendor)
-    item_vendor_stats['effective_mean_lead_time'] = item_vendor_stats.apply(
-        lambda row: row['mean_lead_time_vendor'] if row['use_fallback'] else row['mean_lead_time'],
-        axis=1
+    item_vendor_stats['effective_mean_lead_time'] = np.where(
+        item_vendor_stats['use_fallback'].to_numpy(),
+        item_vendor_stats['mean_lead_time_vendor'].to_numpy(),
+        item_vendor_stats['mean_lead_time'].to_numpy()
     )
 
     # Calculate reliability score (higher = more reliable)
     # Factors: low CV (consistency), high count (data volume)
+    cv = np.clip(item_vendor_stats['cv'].to_numpy(dtype=float), 0, 1)
+    count = item_vendor_stats['count'].to_numpy(dtype=float)
     item_vendor_stats['reliability_score'] = (
-        (1 - item_vendor_stats['cv'].clip(0, 1)) * 0.5 +  # Consistency (50%)
-        (item_vendor_stats['count'] / item_vendor_stats['count'].max()) * 0.5  # Data volume (50%)
+        (1 - cv) * 0.5 +  # Consistency (50%)
+        (count / count.max()) * 0.5  # Data volume (50%)
     ) * 100
 
     logger.info(f"Calculated item-vendor stats for {len(item_vendor_stats)} item-vendor pairs")
     logger.info(f"  - Using item-vendor specific: {(~item_vendor_stats['use_fallback']).sum()}")
     logger.info(f"  - Using vendor fallback: {item_vendor_stats['use_fallback'].sum()}")
 
-    return item_vendor_stats, vendor_stats
+    return _downcast_numeric(item_vendor_stats), _downcast_numeric(vendor_stats)
 
 
 def identify_fastest_vendors(item_vendor_stats: pd.DataFrame) -> pd.DataFrame:
@@ -128,20 +289,38 @@ def identify_fastest_vendors(item_vendor_stats: pd.DataFrame) -> pd.DataFrame:
     logger.info("Identifying fastest vendors for each item...")
 
     # For each item, find the vendor with lowest mean lead time
-    fastest_vendors = item_vendor_stats.loc[
-        item_vendor_stats.groupby('ItemCode')['effective_mean_lead_time'].idxmin()
-    ].copy()
-
-    fastest_vendors = fastest_vendors.sort_values('ItemCode').reset_index(drop=True)
+    fastest_rows = None
+    if NUMBA_AVAILABLE:
+        # Single linear pass over sorted item codes; first minimum wins ties
+        codes, uniques = pd.factorize(item_vendor_stats['ItemCode'], sort=True)
+        fastest_rows = _group_argmin(
+            codes,
+            item_vendor_stats['effective_mean_lead_time'].to_numpy(dtype=np.float64),
+            len(uniques)
+        )
+        if (fastest_rows < 0).any():
+            # An item with no finite lead time; let the sort path handle it
+            fastest_rows = None
+
+    if fastest_rows is not None:
+        fastest_vendors = item_vendor_stats.take(fastest_rows).reset_index(drop=True)
+    else:
+        # Stable sort keeps the first vendor on ties, matching the kernel
+        fastest_vendors = (
+            item_vendor_stats
+            .sort_values(['ItemCode', 'effective_mean_lead_time'], kind='mergesort')
+            .drop_duplicates('ItemCode', keep='first')
+            .reset_index(drop=True)
+        )
 
     # Calculate alternative vendor count for each item
-    alt_vendor_counts = item_vendor_stats.groupby('ItemCode').size().reset_index(name='vendor_options')
-    fastest_vendors = fastest_vendors.merge(alt_vendor_counts, on='ItemCode')
+    vendor_counts = item_vendor_stats.groupby('ItemCode', sort=False, observed=True).size()
+    fastest_vendors['vendor_options'] = vendor_counts.reindex(fastest_vendors['ItemCode']).to_numpy()
 
     logger.info(f"Identified fastest vendors for {len(fastest_vendors)} items")
     logger.info(f"  - Items with multiple vendors: {(fastest_vendors['vendor_options'] > 1).sum()}")
 
-    return fastest_vendors
+    return _downcast_numeric(fastest_vendors)
 
 
 def calculate_vendor_performance_scores(vendor_stats: pd.DataFrame,
@@ -173,53 +352,125 @@ def calculate_vendor_performance_scores(vendor_stats: pd.DataFrame,
 
     logger.info("Calculating vendor performance scores...")
 
-    # Calculate item coverage per vendor
-    item_coverage = item_vendor_stats.groupby('VendorCode')['ItemCode'].nunique().reset_index()
-    item_coverage.columns = ['VendorCode', 'unique_items']
+    # Calculate item coverage per vendor. Rows are unique per
+    # (ItemCode, VendorCode), so the group size is the unique item count.
+    item_coverage = item_vendor_stats.groupby('VendorCode', sort=False, observed=True).size().reset_index(name='unique_items')
 
     # Merge coverage into vendor stats
     vendor_perf = vendor_stats.merge(item_coverage, on='VendorCode', how='left')
 
-    # Normalize metrics (0-100 scale, higher is better)
+    # Normalize metrics (0-100 scale, higher is better), computed on raw
+    # arrays so each score is one NumPy expression
+    median_lead_time = vendor_perf['median_lead_time'].to_numpy(dtype=float)
+    cv = np.clip(vendor_perf['cv'].to_numpy(dtype=float), 0, 1)
+    count = vendor_perf['count'].to_numpy(dtype=float)
+    unique_items = vendor_perf['unique_items'].to_numpy(dtype=float)
+
     # Speed: Lower lead time = higher score (inverse)
-    max_lead_time = vendor_perf['median_lead_time'].max()
-    vendor_perf['speed_score'] = (1 - vendor_perf['median_lead_time'] / max_lead_time) * 100
+    speed_score = (1 - median_lead_time / np.nanmax(median_lead_time)) * 100
 
     # Consistency: Lower CV = higher score (inverse, already 0-1)
-    vendor_perf['consistency_score'] = (1 - vendor_perf['cv'].clip(0, 1)) * 100
+    consistency_score = (1 - cv) * 100
 
     # Volume: More transactions = higher score
-    max_count = vendor_perf['count'].max()
-    vendor_perf['volume_score'] = (vendor_perf['count'] / max_count) * 100
+    volume_score = (count / np.nanmax(count)) * 100
 
     # Coverage: More unique items = higher score
-    max_items = vendor_perf['unique_items'].max()
-    vendor_perf['coverage_score'] = (vendor_perf['unique_items'] / max_items) * 100 if max_items > 0 else 0
+    max_items = np.nanmax(unique_items)
+    coverage_score = (unique_items / max_items) * 100 if max_items > 0 else np.zeros_like(unique_items)
 
     # Calculate overall score (weighted)
-    vendor_perf['overall_score'] = (
-        vendor_perf['speed_score'] * 0.40 +
-        vendor_perf['consistency_score'] * 0.30 +
-        vendor_perf['volume_score'] * 0.20 +
-        vendor_perf['coverage_score'] * 0.10
-    ).round(2)
+    overall_score = np.round(
+        speed_score * 0.40 +
+        consistency_score * 0.30 +
+        volume_score * 0.20 +
+        coverage_score * 0.10,
+        2
+    )
 
-    # Rank vendors (handle NaN values by filling with 0 before ranking)
-    vendor_perf['rank'] = vendor_perf['overall_score'].fillna(0).rank(ascending=False).astype(int)
+    vendor_perf = vendor_perf.assign(
+        speed_score=speed_score,
+        consistency_score=consistency_score,
+        volume_score=volume_score,
+        coverage_score=coverage_score,
+        overall_score=overall_score
+    )
 
-    # Sort by rank
-    vendor_perf = vendor_perf.sort_values('rank').reset_index(drop=True)
+    # Rank vendors (handle NaN values by filling with 0 before ranking) and
+    # sort by rank with one stable argsort permutation
+    scores = vendor_perf['overall_score'].fillna(0).to_numpy()
+    order = np.argsort(-scores, kind='stable')
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(1, len(order) + 1)
+    vendor_perf['rank'] = rank
+    vendor_perf = vendor_perf.iloc[order].reset_index(drop=True)
 
     logger.info(f"Calculated performance scores for {len(vendor_perf)} vendors")
     logger.info(f"  - Top vendor: {vendor_perf.iloc[0]['VendorCode'] if len(vendor_perf) > 0 else 'N/A'}")
 
-    return vendor_perf
+    return _downcast_numeric(vendor_perf)
+
+
+# ItemCode -> row positions per item_vendor_stats frame, keyed by id() and
+# checked against a weak reference so a recycled id never serves stale rows
+_item_row_index_cache: Dict[int, Tuple[weakref.ref, Dict]] = {}
+
+# (item_vendor_stats, vendor_stats) per supply history frame, keyed by
+# (id(df_history), min_sample_size) with the same weak reference guard
+_stats_cache: Dict[Tuple[int, int], Tuple[weakref.ref, Tuple[pd.DataFrame, pd.DataFrame]]] = {}
+
+
+def clear_lead_time_cache() -> None:
+    """Drop all in-memory lead time stats and item row indexes."""
+    _stats_cache.clear()
+    _item_row_index_cache.clear()
+
+
+def _get_cached_lead_time_stats(df_history: pd.DataFrame,
+                                min_sample_size: int) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Return calculate_item_vendor_lead_times() for a history frame, computing it once.
+
+    Per-item lookups in a loop would otherwise re-aggregate the full history
+    on every call. The history frame is treated as read-only while cached.
+    """
+    key = (id(df_history), min_sample_size)
+    cached = _stats_cache.get(key)
+    if cached is not None and cached[0]() is df_history:
+        return cached[1]
+
+    stats = calculate_item_vendor_lead_times(df_history, min_sample_size)
+    ref = weakref.ref(df_history, lambda _, key=key: _stats_cache.pop(key, None))
+    _stats_cache[key] = (ref, stats)
+    return stats
+
+
+def _get_item_row_index(item_vendor_stats: pd.DataFrame) -> Dict:
+    """
+    Return (building once per frame) a mapping of ItemCode to row positions.
+
+    The stats frames are treated as read-only once built; the cached index
+    is dropped automatically when the frame is garbage collected.
+    """
+    if item_vendor_stats.empty:
+        return {}
+
+    key = id(item_vendor_stats)
+    cached = _item_row_index_cache.get(key)
+    if cached is not None and cached[0]() is item_vendor_stats:
+        return cached[1]
+
+    groups = item_vendor_stats.groupby('ItemCode', sort=False, observed=True).indices
+    ref = weakref.ref(item_vendor_stats, lambda _, key=key: _item_row_index_cache.pop(key, None))
+    _item_row_index_cache[key] = (ref, groups)
+    return groups
 
 
 def get_item_lead_time_with_fallback(item_code: str,
                                      df_history: pd.DataFrame,
                                      item_vendor_stats: pd.DataFrame = None,
-                                     vendor_stats: pd.DataFrame = None) -> Dict:
+                                     vendor_stats: pd.DataFrame = None,
+                                     min_sample_size: int = 3) -> Dict:
     """
     Get lead time information for a specific item with fallback logic.
 
@@ -238,20 +489,23 @@ def get_item_lead_time_with_fallback(item_code: str,
         Pre-calculated item-vendor stats (will calculate if not provided)
     vendor_stats : pd.DataFrame, optional
         Pre-calculated vendor stats (will calculate if not provided)
+    min_sample_size : int
+        Minimum observations for item-vendor specific lead times when stats
+        are calculated here (default: 3)
 
     Returns:
     --------
     Dict
         Lead time information with source and vendors
     """
-    # Calculate stats if not provided
+    # Calculate stats if not provided (once per history frame, then reused)
     if item_vendor_stats is None or vendor_stats is None:
-        item_vendor_stats, vendor_stats = calculate_item_vendor_lead_times(df_history)
+        item_vendor_stats, vendor_stats = _get_cached_lead_time_stats(df_history, min_sample_size)
 
-    # Filter for this item
-    item_data = item_vendor_stats[item_vendor_stats['ItemCode'] == item_code].copy()
+    # Look up this item's rows via the cached item -> row positions index
+    positions = _get_item_row_index(item_vendor_stats).get(item_code)
 
-    if item_data.empty:
+    if positions is None or len(positions) == 0:
         # No data for this item
         overall_median = df_history['lead_time_days'].median()
         return {
@@ -261,19 +515,29 @@ def get_item_lead_time_with_fallback(item_code: str,
             'vendors': []
         }
 
+    item_data = item_vendor_stats.take(positions)
+
     # Find fastest vendor
-    fastest = item_data.loc[item_data['effective_mean_lead_time'].idxmin()]
-
-    # Get all vendors for this item
-    vendors = []
-    for _, row in item_data.sort_values('effective_mean_lead_time').iterrows():
-        vendors.append({
-            'vendor_code': row['VendorCode'],
-            'lead_time_days': row['effective_mean_lead_time'],
-            'is_fastest': row['VendorCode'] == fastest['VendorCode'],
-            'using_fallback': bool(row['use_fallback']),
-            'sample_count': int(row['count'])
-        })
+    fastest = item_data.iloc[np.nanargmin(item_data['effective_mean_lead_time'].to_numpy(dtype=float))]
+
+    # Get all vendors for this item (column arrays, no per-row Series)
+    sorted_data = item_data.sort_values('effective_mean_lead_time')
+    fastest_vendor = fastest['VendorCode']
+    vendors = [
+        {
+            'vendor_code': vendor_code,
+            'lead_time_days': float(lead_time),
+            'is_fastest': vendor_code == fastest_vendor,
+            'using_fallback': bool(use_fallback),
+            'sample_count': int(count)
+        }
+        for vendor_code, lead_time, use_fallback, count in zip(
+            sorted_data['VendorCode'].to_numpy(),
+            sorted_data['effective_mean_lead_time'].to_numpy(),
+            sorted_data['use_fallback'].to_numpy(),
+            sorted_data['count'].to_numpy()
+        )
+    ]
 
     return {
         'item_code': item_code,
@@ -284,6 +548,12 @@ def get_item_lead_time_with_fallback(item_code: str,
     }
 
 
+def _round_float_columns(df: pd.DataFrame, decimals: int = 2) -> pd.DataFrame:
+    """Round only the float columns of a frame for persisting (counts and keys untouched)."""
+    float_cols = df.select_dtypes(include='floating').columns
+    return df.round({col: decimals for col in float_cols})
+
+
 def save_vendor_performance_data(item_vendor_stats: pd.DataFrame,
                                   vendor_stats: pd.DataFrame,
                                   fastest_vendors: pd.DataFrame,
@@ -310,10 +580,27 @@ def save_vendor_performance_data(item_vendor_stats: pd.DataFrame,
     logger.info("Saving vendor performance data to cache...")
 
     try:
-        item_vendor_stats.to_parquet(output_dir / "item_vendor_stats.parquet", index=False)
-        vendor_stats.to_parquet(output_dir / "vendor_stats.parquet", index=False)
-        fastest_vendors.to_parquet(output_dir / "fastest_vendors.parquet", index=False)
-        vendor_perf.to_parquet(output_dir / "vendor_perf.parquet", index=False)
+        # Per-item frames are cold cache: zstd keeps them small on disk.
+        # Per-vendor frames are tiny, so they skip compression entirely.
+        # item_vendor_stats is the largest frame: write it through pyarrow
+        # directly so the key columns are dictionary-encoded
+        pq.write_table(
+            pa.Table.from_pandas(_round_float_columns(item_vendor_stats), preserve_index=False),
+            output_dir / "item_vendor_stats.parquet",
+            compression='zstd', compression_level=3, row_group_size=64_000,
+            use_dictionary=['ItemCode', 'VendorCode'],
+            data_page_size=1 << 20, write_batch_size=65_536
+        )
+        _round_float_columns(vendor_stats).to_parquet(
+            output_dir / "vendor_stats.parquet", index=False, compression=None
+        )
+        _round_float_columns(fastest_vendors).to_parquet(
+            output_dir / "fastest_vendors.parquet", index=False,
+            compression='zstd', compression_level=3, row_group_size=64_000
+        )
+        _round_float_columns(vendor_perf).to_parquet(
+            output_dir / "vendor_perf.parquet", index=False, compression=None
+        )
 
         logger.info("[OK] Vendor performance data cached successfully")
     except Exception as e:
@@ -337,10 +624,10 @@ def load_vendor_performance_data(cache_dir: Path = Path("data/cache")) -> Tuple[
     logger.info("Loading vendor performance data from cache...")
 
     try:
-        item_vendor_stats = pd.read_parquet(cache_dir / "item_vendor_stats.parquet")
-        vendor_stats = pd.read_parquet(cache_dir / "vendor_stats.parquet")
-        fastest_vendors = pd.read_parquet(cache_dir / "fastest_vendors.parquet")
-        vendor_perf = pd.read_parquet(cache_dir / "vendor_perf.parquet")
+        item_vendor_stats = pd.read_parquet(cache_dir / "item_vendor_stats.parquet", engine='pyarrow')
+        vendor_stats = pd.read_parquet(cache_dir / "vendor_stats.parquet", engine='pyarrow')
+        fastest_vendors = pd.read_parquet(cache_dir / "fastest_vendors.parquet", engine='pyarrow')
+        vendor_perf = pd.read_parquet(cache_dir / "vendor_perf.parquet", engine='pyarrow')
 
         logger.info("[OK] Vendor performance data loaded from cache")
         return item_vendor_stats, vendor_stats, fastest_vendors, vendor_perf
@@ -7,14 +7,32 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 import sys
-from typing import Dict, List, Tuple
+from typing import Dict, List
 import json
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property, lru_cache
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# Optional: joblib for evaluating models in parallel
+try:
+    from joblib import Parallel, delayed, parallel_backend
+    JOB_LIB_AVAILABLE = True
+except ImportError:
+    JOB_LIB_AVAILABLE = False
+
+# Optional: orjson for fast serialization of results with ndarrays
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from src.forecasting import (
-    forecast_sma,
+    forecast_sma_np,
     forecast_holt_winters,
     forecast_theta,
     forecast_arima,
@@ -25,10 +43,104 @@ from src.forecasting import (
     calculate_rmse,
     calculate_mape,
     prepare_monthly_data,
+    train_test_split,
     run_tournament
 )
 
 
+# Forecasting models available to the benchmark
+_MODEL_REGISTRY = {
+    'SMA': forecast_sma_np,
+    'Holt-Winters': forecast_holt_winters,
+    'Theta': forecast_theta,
+    'ARIMA': forecast_arima,
+    'SARIMA': forecast_sarima,
+    'Croston': forecast_croston
+}
+
+# Models that take float64 ndarrays rather than period-indexed Series
+_NDARRAY_MODELS = {'SMA'}
+
+# Models worth fitting per pattern; SMA is always kept as the baseline.
+# ARIMA/SARIMA/Holt-Winters degrade on mostly-zero intermittent demand,
+# where Croston is the designated model.
+_MODELS_BY_PATTERN = {
+    'stable': ['SMA', 'Holt-Winters', 'Theta', 'ARIMA'],
+    'trending': ['SMA', 'Holt-Winters', 'Theta', 'ARIMA'],
+    'seasonal': ['SMA', 'Holt-Winters', 'Theta', 'SARIMA'],
+    'intermittent': ['SMA', 'Croston']
+}
+
+# Minimum training history (months) for each model to be fitted
+_MIN_OBS = {'SMA': 3, 'Holt-Winters': 12, 'Theta': 12, 'ARIMA': 12, 'SARIMA': 24, 'Croston': 6}
+
+# Maximum number of prepared series kept by PerformanceBenchmark.prepare_series
+_PREP_CACHE_SIZE = 32
+
+# Per-pattern RNG seeds for synthetic data
+_SEEDS = {'stable': 1, 'trending': 2, 'seasonal': 3, 'intermittent': 4}
+
+# Model names -> ensemble result keys (e.g. 'Holt-Winters' -> 'holt_winters')
+_ENSEMBLE_KEY_TRANS = str.maketrans({'-': '_'})
+
+
+class NumpyEncoder(json.JSONEncoder):
+    """JSON encoder for the ndarrays kept in benchmark results"""
+
+    def default(self, obj):
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        if isinstance(obj, np.generic):
+            return obj.item()
+        return super().default(obj)
+
+
+def _num(x):
+    """Metric as a plain float, or None when missing or NaN"""
+    return None if (x is None or x != x) else float(x)
+
+
+def _fmt(value) -> str:
+    """Format a metric for display; metrics can be None when undefined"""
+    return 'n/a' if value is None else f"{value:.2f}"
+
+
+def _safe_mape(test_np: np.ndarray, forecast_np: np.ndarray) -> float:
+    """MAPE over the overlapping horizon; NaN when there is no positive demand"""
+    min_len = min(test_np.size, forecast_np.size)
+    test_np = test_np[:min_len]
+    if min_len == 0 or test_np.sum() <= 0:
+        return np.nan
+    return calculate_mape(test_np, forecast_np[:min_len])
+
+
+def _batch_mape(test_np: np.ndarray, forecasts: List[np.ndarray]) -> np.ndarray:
+    """
+    MAPE of several equal-length forecasts against one test window
+
+    Matches _safe_mape row by row (zero actuals excluded, NaN without
+    positive demand) using a single 2-D reduction.
+    """
+    forecast_matrix = np.stack(forecasts)
+    min_len = min(test_np.size, forecast_matrix.shape[1])
+    test_np = test_np[:min_len]
+    non_zero = test_np != 0
+    if min_len == 0 or test_np.sum() <= 0 or not non_zero.any():
+        return np.full(len(forecasts), np.nan)
+
+    actual = test_np[non_zero]
+    errors = np.abs((forecast_matrix[:, :min_len][:, non_zero] - actual) / actual)
+    return errors.mean(axis=1) * 100
+
+
+@lru_cache(maxsize=None)
+def _seasonal_component(n_months: int) -> np.ndarray:
+    """Annual sine cycle used by the seasonal pattern, shared across calls"""
+    seasonal = 30 * np.sin(2 * np.pi * np.arange(n_months) / 12)
+    seasonal.flags.writeable = False
+    return seasonal
+
+
 class PerformanceBenchmark:
     """Benchmarking suite for forecasting model comparison"""
 
@@ -37,11 +149,16 @@ class PerformanceBenchmark:
             'baseline_models': {},
             'advanced_models': {},
             'ensemble_models': {},
-            'improvements': {},
-            'metadata': {
-                'timestamp': datetime.now().isoformat(),
-                'test_scenarios': []
-            }
+            'improvements': {}
+        }
+        self._prep_cache = OrderedDict()
+
+    @cached_property
+    def metadata(self) -> Dict:
+        """Run metadata, created on first access so construction stays cheap"""
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'test_scenarios': []
         }
 
     def generate_test_data(self, pattern: str, n_months: int = 36) -> pd.DataFrame:
@@ -61,35 +178,24 @@ class PerformanceBenchmark:
             Test sales data with date, item_code, qty columns
         """
         dates = pd.date_range('2021-01-01', periods=n_months, freq='MS')
+        # Independent, reproducible stream per pattern, whichever worker runs it
+        rng = np.random.default_rng(_SEEDS.get(pattern))
 
         if pattern == 'stable':
             # Stable demand around 100 with small noise
-            base = 100
-            noise = np.random.normal(0, 5, n_months)
-            qty = base + noise
-            qty = np.maximum(qty, 0)  # No negative values
+            qty = np.maximum(100 + 5 * rng.standard_normal(n_months), 0)
 
         elif pattern == 'trending':
             # Linear upward trend
-            trend = np.linspace(80, 150, n_months)
-            noise = np.random.normal(0, 8, n_months)
-            qty = trend + noise
-            qty = np.maximum(qty, 0)
+            qty = np.maximum(np.linspace(80, 150, n_months) + 8 * rng.standard_normal(n_months), 0)
 
         elif pattern == 'seasonal':
             # Seasonal pattern (annual cycle)
-            base = 100
-            seasonal = 30 * np.sin(2 * np.pi * np.arange(n_months) / 12)
-            noise = np.random.normal(0, 5, n_months)
-            qty = base + seasonal + noise
-            qty = np.maximum(qty, 0)
+            qty = np.maximum(100 + _seasonal_component(n_months) + 5 * rng.standard_normal(n_months), 0)
 
         elif pattern == 'intermittent':
-            # Intermittent demand (many zeros)
-            base_qty = np.random.poisson(20, n_months)
-            # 60% zeros (intermittent)
-            zeros = np.random.choice([0, 1], size=n_months, p=[0.6, 0.4])
-            qty = base_qty * zeros
+            # Intermittent demand: 60% zeros
+            qty = rng.poisson(20, n_months) * (rng.random(n_months) < 0.4)
 
         else:
             raise ValueError(f"Unknown pattern: {pattern}")
@@ -102,50 +208,55 @@ class PerformanceBenchmark:
 
         return df
 
-    def split_train_test(self, df: pd.DataFrame, train_size: float = 0.8) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        """Split data into training and test sets"""
-        n = len(df)
-        split_idx = int(n * train_size)
-        train = df.iloc[:split_idx].copy()
-        test = df.iloc[split_idx:].copy()
-        return train, test
-
     def prepare_series(self, df: pd.DataFrame, item_code: str) -> pd.Series:
-        """Prepare monthly time series from DataFrame"""
-        return prepare_monthly_data(df, item_code)
+        """
+        Prepare monthly time series from DataFrame
+
+        Results are memoized by item code and a content hash of the input
+        columns, so repeated runs on identical synthetic data skip the
+        groupby; the cache is LRU-bounded to _PREP_CACHE_SIZE entries.
+        """
+        content_hash = pd.util.hash_pandas_object(df[['date', 'item_code', 'qty']], index=False)
+        key = (item_code, hash(content_hash.to_numpy().tobytes()))
+
+        cached = self._prep_cache.get(key)
+        if cached is not None:
+            self._prep_cache.move_to_end(key)
+            return cached
+
+        series = prepare_monthly_data(df, item_code)
+        self._prep_cache[key] = series
+        if len(self._prep_cache) > _PREP_CACHE_SIZE:
+            self._prep_cache.popitem(last=False)
+        return series
 
     def calculate_metrics(self, actual: pd.Series, forecast: np.array) -> Dict[str, float]:
         """Calculate RMSE and MAPE metrics"""
-        # Align lengths
-        min_len = min(len(actual), len(forecast))
-        actual_aligned = actual.iloc[:min_len]
-        forecast_aligned = forecast[:min_len]
+        # Convert once and align lengths; the metric kernels take raw arrays
+        actual_np = actual.to_numpy(dtype=np.float64)
+        forecast_np = np.asarray(forecast, dtype=np.float64)
+        min_len = min(actual_np.size, forecast_np.size)
 
-        rmse = calculate_rmse(actual_aligned, forecast_aligned)
-        mape = calculate_mape(actual_aligned, forecast_aligned)
+        rmse = calculate_rmse(actual_np[:min_len], forecast_np[:min_len])
+        mape = calculate_mape(actual_np[:min_len], forecast_np[:min_len])
 
         return {'rmse': rmse, 'mape': mape}
 
     def evaluate_model(self, model_func, train_series: pd.Series, test_series: pd.Series,
-                      model_name: str, forecast_horizon: int = 6) -> Dict:
-        """Evaluate a single model's performance"""
-        try:
-            forecast, rmse = model_func(train_series, test_series, forecast_horizon)
+                      model_name: str, forecast_horizon: int = 6, compute_mape: bool = True) -> Dict:
+        """
+        Evaluate a single model's performance
 
-            # Calculate MAPE if we have test data
-            mape = np.nan
-            if len(test_series) > 0:
-                min_len = min(len(test_series), len(forecast))
-                if min_len > 0 and test_series.iloc[:min_len].sum() > 0:
-                    mape = calculate_mape(test_series.iloc[:min_len], forecast[:min_len])
+        With compute_mape=False the MAPE is left as None for the caller to
+        fill in, e.g. in one batched pass over several models.
+        """
+        # Skip up front when the history is too short for the model to fit
+        if len(train_series) < _MIN_OBS.get(model_name, 0):
+            return {'forecast': None, 'rmse': None, 'mape': None, 'status': 'skipped'}
 
-            return {
-                'forecast': forecast.tolist(),
-                'rmse': float(rmse) if not np.isnan(rmse) else None,
-                'mape': float(mape) if not np.isnan(mape) else None,
-                'status': 'success'
-            }
-        except Exception as e:
+        try:
+            forecast, rmse = model_func(train_series, test_series, forecast_horizon)
+        except (ValueError, np.linalg.LinAlgError, RuntimeError) as e:
             return {
                 'forecast': None,
                 'rmse': None,
@@ -153,19 +264,39 @@ class PerformanceBenchmark:
                 'status': f'error: {str(e)}'
             }
 
-    def benchmark_pattern(self, pattern: str) -> Dict:
-        """Benchmark all models on a specific data pattern"""
+        forecast = np.asarray(forecast, dtype=np.float64)
+        mape = _safe_mape(np.asarray(test_series, dtype=np.float64), forecast) if compute_mape else np.nan
+
+        return {
+            'forecast': forecast,
+            'rmse': _num(rmse),
+            'mape': _num(mape),
+            'status': 'success'
+        }
+
+    def benchmark_pattern(self, pattern: str, n_jobs: int = -1) -> Dict:
+        """
+        Benchmark all models on a specific data pattern
+
+        n_jobs caps the joblib workers fitting the models; callers running
+        several patterns at once pass their share of the cores.
+        """
         print(f"\n{'='*60}")
         print(f"Benchmarking: {pattern.upper()} PATTERN")
         print(f"{'='*60}")
 
         # Generate test data
         df = self.generate_test_data(pattern, n_months=36)
-        train_df, test_df = self.split_train_test(df, train_size=0.8)
 
-        # Prepare series
-        train_series = self.prepare_series(train_df, f'TEST_{pattern.upper()}')
-        test_series = self.prepare_series(test_df, f'TEST_{pattern.upper()}')
+        # Prepare the monthly series once, then split it
+        full_series = self.prepare_series(df, f'TEST_{pattern.upper()}')
+        train_series, test_series = train_test_split(full_series, train_pct=0.8)
+
+        # Convert once; array-based models and the metrics reuse these
+        train_np = train_series.to_numpy(dtype=np.float64)
+        test_np = test_series.to_numpy(dtype=np.float64)
+        series_inputs = (train_series, test_series)
+        array_inputs = (train_np, test_np)
 
         forecast_horizon = 6
         results = {
@@ -175,80 +306,84 @@ class PerformanceBenchmark:
             'models': {}
         }
 
-        # Baseline Models
-        print("\n--- BASELINE MODELS ---")
-        baseline_models = {
-            'SMA': lambda t, s, h: forecast_sma(t, s, h),
-            'Holt-Winters': lambda t, s, h: forecast_holt_winters(t, s, h)
-        }
+        # Individual models are independent fits, so collect them first and
+        # evaluate them concurrently; the ensembles below depend on all of them.
+        # Only models suited to the pattern are fitted.
+        model_tasks = {name: _MODEL_REGISTRY[name] for name in _MODELS_BY_PATTERN[pattern]}
+
+        print("\n--- BASELINE AND ADVANCED MODELS ---")
+        print(f"Evaluating {', '.join(model_tasks)}...")
+        if JOB_LIB_AVAILABLE:
+            # Single-threaded BLAS inside each worker; the worker count itself
+            # is bounded by n_jobs
+            with parallel_backend('loky', inner_max_num_threads=1):
+                model_results = Parallel(n_jobs=n_jobs)(
+                    delayed(self.evaluate_model)(
+                        model_func,
+                        *(array_inputs if name in _NDARRAY_MODELS else series_inputs),
+                        name, forecast_horizon, compute_mape=False
+                    )
+                    for name, model_func in model_tasks.items()
+                )
+        else:
+            model_results = [
+                self.evaluate_model(
+                    model_func,
+                    *(array_inputs if name in _NDARRAY_MODELS else series_inputs),
+                    name, forecast_horizon, compute_mape=False
+                )
+                for name, model_func in model_tasks.items()
+            ]
+
+        # MAPE for all fitted models in one pass over a (models x horizon) matrix
+        fitted = [result for result in model_results if result['status'] == 'success']
+        if fitted and len({result['forecast'].size for result in fitted}) == 1:
+            mapes = _batch_mape(test_np, [result['forecast'] for result in fitted])
+        else:
+            mapes = [_safe_mape(test_np, result['forecast']) for result in fitted]
+        for result, mape in zip(fitted, mapes):
+            result['mape'] = _num(mape)
 
-        for name, model_func in baseline_models.items():
-            print(f"Evaluating {name}...")
-            result = self.evaluate_model(model_func, train_series, test_series, name, forecast_horizon)
+        for name, result in zip(model_tasks, model_results):
             results['models'][name] = result
             if result['status'] == 'success':
-                print(f"  RMSE: {result['rmse']:.2f}, MAPE: {result['mape']:.2f}%")
-
-        # Advanced Models (requires sufficient history)
-        print("\n--- ADVANCED MODELS ---")
-        if len(train_series) >= 12:
-            advanced_models = {
-                'Theta': forecast_theta,
-                'ARIMA': forecast_arima
-            }
-
-            for name, model_func in advanced_models.items():
-                print(f"Evaluating {name}...")
-                result = self.evaluate_model(model_func, train_series, test_series, name, forecast_horizon)
-                results['models'][name] = result
-                if result['status'] == 'success':
-                    print(f"  RMSE: {result['rmse']:.2f}, MAPE: {result['mape']:.2f}%")
-
-        if len(train_series) >= 24:
-            print(f"Evaluating SARIMA...")
-            result = self.evaluate_model(forecast_sarima, train_series, test_series, 'SARIMA', forecast_horizon)
-            results['models']['SARIMA'] = result
-            if result['status'] == 'success':
-                print(f"  RMSE: {result['rmse']:.2f}, MAPE: {result['mape']:.2f}%")
-
-        # Croston's Method (for intermittent)
-        if pattern == 'intermittent':
-            print(f"Evaluating Croston's Method...")
-            result = self.evaluate_model(forecast_croston, train_series, test_series, 'Croston', forecast_horizon)
-            results['models']['Croston'] = result
-            if result['status'] == 'success':
-                print(f"  RMSE: {result['rmse']:.2f}, MAPE: {result['mape']:.2f}%")
+                print(f"  {name} RMSE: {_fmt(result['rmse'])}, MAPE: {_fmt(result['mape'])}%")
 
         # Ensemble Models
         print("\n--- ENSEMBLE MODELS ---")
         # Build results dict for ensembles
-        ensemble_results = {}
-        for model_name, model_result in results['models'].items():
-            if model_result['status'] == 'success' and model_result['forecast'] is not None:
-                ensemble_results[model_name.lower().replace('-', '_')] = {
-                    'forecast': np.array(model_result['forecast']),
-                    'rmse': model_result['rmse'] if model_result['rmse'] is not None else np.nan
-                }
+        ensemble_results = {
+            model_name.lower().translate(_ENSEMBLE_KEY_TRANS): {
+                'forecast': model_result['forecast'],
+                'rmse': model_result['rmse'] if model_result['rmse'] is not None else np.nan
+            }
+            for model_name, model_result in results['models'].items()
+            if model_result['status'] == 'success' and model_result['forecast'] is not None
+        }
 
         if ensemble_results:
+            # Both ensembles read the same inputs and are independent, so
+            # compute them side by side and collect each result below
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                simple_future = executor.submit(forecast_ensemble_simple, ensemble_results,
+                                                forecast_horizon, method='mean')
+                weighted_future = executor.submit(forecast_ensemble_weighted, ensemble_results,
+                                                  forecast_horizon)
+
             # Simple Ensemble
             print("Evaluating Simple Ensemble (Mean)...")
             try:
-                forecast, rmse = forecast_ensemble_simple(ensemble_results, forecast_horizon, method='mean')
-                mape = np.nan
-                if len(test_series) > 0:
-                    min_len = min(len(test_series), len(forecast))
-                    if min_len > 0 and test_series.iloc[:min_len].sum() > 0:
-                        mape = calculate_mape(test_series.iloc[:min_len], forecast[:min_len])
+                forecast, rmse = simple_future.result()
+                mape = _safe_mape(test_np, np.asarray(forecast, dtype=np.float64))
 
                 results['models']['Ensemble-Simple'] = {
-                    'forecast': forecast.tolist(),
-                    'rmse': float(rmse) if not np.isnan(rmse) else None,
-                    'mape': float(mape) if not np.isnan(mape) else None,
+                    'forecast': np.asarray(forecast, dtype=np.float64),
+                    'rmse': _num(rmse),
+                    'mape': _num(mape),
                     'status': 'success'
                 }
-                print(f"  RMSE: {results['models']['Ensemble-Simple']['rmse']:.2f}, "
-                      f"MAPE: {results['models']['Ensemble-Simple']['mape']:.2f}%")
+                print(f"  RMSE: {_fmt(results['models']['Ensemble-Simple']['rmse'])}, "
+                      f"MAPE: {_fmt(results['models']['Ensemble-Simple']['mape'])}%")
             except Exception as e:
                 results['models']['Ensemble-Simple'] = {
                     'forecast': None, 'rmse': None, 'mape': None, 'status': f'error: {str(e)}'
@@ -257,21 +392,17 @@ class PerformanceBenchmark:
             # Weighted Ensemble
             print("Evaluating Weighted Ensemble (RMSE)...")
             try:
-                forecast, rmse = forecast_ensemble_weighted(ensemble_results, forecast_horizon)
-                mape = np.nan
-                if len(test_series) > 0:
-                    min_len = min(len(test_series), len(forecast))
-                    if min_len > 0 and test_series.iloc[:min_len].sum() > 0:
-                        mape = calculate_mape(test_series.iloc[:min_len], forecast[:min_len])
+                forecast, rmse = weighted_future.result()
+                mape = _safe_mape(test_np, np.asarray(forecast, dtype=np.float64))
 
                 results['models']['Ensemble-Weighted'] = {
-                    'forecast': forecast.tolist(),
-                    'rmse': float(rmse) if not np.isnan(rmse) else None,
-                    'mape': float(mape) if not np.isnan(mape) else None,
+                    'forecast': np.asarray(forecast, dtype=np.float64),
+                    'rmse': _num(rmse),
+                    'mape': _num(mape),
                     'status': 'success'
                 }
-                print(f"  RMSE: {results['models']['Ensemble-Weighted']['rmse']:.2f}, "
-                      f"MAPE: {results['models']['Ensemble-Weighted']['mape']:.2f}%")
+                print(f"  RMSE: {_fmt(results['models']['Ensemble-Weighted']['rmse'])}, "
+                      f"MAPE: {_fmt(results['models']['Ensemble-Weighted']['mape'])}%")
             except Exception as e:
                 results['models']['Ensemble-Weighted'] = {
                     'forecast': None, 'rmse': None, 'mape': None, 'status': f'error: {str(e)}'
@@ -306,8 +437,15 @@ class PerformanceBenchmark:
 
         return improvements
 
-    def run_full_benchmark(self) -> Dict:
-        """Run comprehensive benchmark across all patterns"""
+    def run_full_benchmark(self, max_workers: int = None) -> Dict:
+        """
+        Run comprehensive benchmark across all patterns
+
+        Patterns are independent, so each one is benchmarked in its own
+        worker process; results are collected here in pattern order. joblib
+        cannot see this outer pool, so each pattern's model fits get an even
+        share of the cores rather than all of them.
+        """
         patterns = ['stable', 'trending', 'seasonal', 'intermittent']
 
         print("\n" + "="*60)
@@ -315,28 +453,39 @@ class PerformanceBenchmark:
         print("SR&ED Experimental Development - Accuracy Validation")
         print("="*60)
 
+        # Record the scenarios up front rather than appending per pattern, so
+        # rerunning on the same instance does not accumulate duplicates
+        self.metadata['test_scenarios'] = list(patterns)
+        self.results['metadata'] = self.metadata
+
         all_results = {}
         summary = {
             'best_model_by_pattern': {},
             'overall_improvements': {}
         }
 
-        for pattern in patterns:
-            self.results['metadata']['test_scenarios'].append(pattern)
-            pattern_result = self.benchmark_pattern(pattern)
-            all_results[pattern] = pattern_result
-
-            # Find best model for this pattern
-            best_model = min(
-                [(name, data) for name, data in pattern_result['models'].items()
-                 if data.get('rmse') is not None],
-                key=lambda x: x[1]['rmse']
-            )
-            summary['best_model_by_pattern'][pattern] = {
-                'model': best_model[0],
-                'rmse': best_model[1]['rmse'],
-                'mape': best_model[1]['mape']
-            }
+        max_workers = max_workers or len(patterns)
+        n_jobs = max(1, (os.cpu_count() or 1) // min(max_workers, len(patterns)))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {pattern: executor.submit(self.benchmark_pattern, pattern, n_jobs)
+                       for pattern in patterns}
+
+            for pattern in patterns:
+                pattern_result = futures[pattern].result()
+                all_results[pattern] = pattern_result
+
+                # Find best model for this pattern (first one wins on ties)
+                valid = {name: data for name, data in pattern_result['models'].items()
+                         if data.get('rmse') is not None}
+                names = list(valid)
+                rmses = np.fromiter((data['rmse'] for data in valid.values()),
+                                    dtype=np.float64, count=len(valid))
+                best_name = names[int(np.argmin(rmses))]
+                summary['best_model_by_pattern'][pattern] = {
+                    'model': best_name,
+                    'rmse': valid[best_name]['rmse'],
+                    'mape': valid[best_name]['mape']
+                }
 
         self.results['all_patterns'] = all_results
         self.results['summary'] = summary
@@ -350,22 +499,34 @@ class PerformanceBenchmark:
         """Calculate average improvements across all patterns"""
         overall = {}
 
-        # Collect all improvements
-        all_improvements = {}
-        for pattern, pattern_data in self.results.get('all_patterns', {}).items():
-            for model, improvement in pattern_data.get('improvements', {}).items():
-                if model not in all_improvements:
-                    all_improvements[model] = []
-                all_improvements[model].append(improvement)
+        pattern_improvements = [pattern_data.get('improvements', {})
+                                 for pattern_data in self.results.get('all_patterns', {}).values()]
+
+        # Model rows in order of first appearance, one column per pattern
+        model_rows = {}
+        for improvements in pattern_improvements:
+            for model in improvements:
+                model_rows.setdefault(model, len(model_rows))
+
+        rmse_imps = np.full((len(model_rows), len(pattern_improvements)), np.nan)
+        mape_imps = np.full_like(rmse_imps, np.nan)
+        tested = np.zeros(rmse_imps.shape, dtype=bool)
+        for col, improvements in enumerate(pattern_improvements):
+            for model, improvement in improvements.items():
+                row = model_rows[model]
+                rmse_imps[row, col] = improvement['rmse_improvement_pct']
+                mape_imps[row, col] = improvement['mape_improvement_pct']
+                tested[row, col] = True
 
         # Calculate averages
-        for model, improvements in all_improvements.items():
-            avg_rmse_imp = np.mean([imp['rmse_improvement_pct'] for imp in improvements])
-            avg_mape_imp = np.mean([imp['mape_improvement_pct'] for imp in improvements])
+        patterns_tested = tested.sum(axis=1)
+        avg_rmse = np.nansum(rmse_imps, axis=1) / np.maximum(patterns_tested, 1)
+        avg_mape = np.nansum(mape_imps, axis=1) / np.maximum(patterns_tested, 1)
+        for model, row in model_rows.items():
             overall[model] = {
-                'avg_rmse_improvement_pct': round(avg_rmse_imp, 2),
-                'avg_mape_improvement_pct': round(avg_mape_imp, 2),
-                'patterns_tested': len(improvements)
+                'avg_rmse_improvement_pct': round(float(avg_rmse[row]), 2),
+                'avg_mape_improvement_pct': round(float(avg_mape[row]), 2),
+                'patterns_tested': int(patterns_tested[row])
             }
 
         return overall
@@ -375,8 +536,13 @@ class PerformanceBenchmark:
         if filepath is None:
             filepath = Path(__file__).parent.parent / 'benchmark_results.json'
 
-        with open(filepath, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        if ORJSON_AVAILABLE:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(self.results,
+                                     option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(self.results, f, indent=2, cls=NumpyEncoder)
 
         print(f"\nResults saved to: {filepath}")
         return filepath
@@ -389,7 +555,7 @@ class PerformanceBenchmark:
 
         print("\n--- BEST MODEL BY PATTERN ---")
         for pattern, best in self.results['summary']['best_model_by_pattern'].items():
-            print(f"{pattern.upper():15} -> {best['model']:20} (RMSE: {best['rmse']:.2f}, MAPE: {best['mape']:.2f}%)")
+            print(f"{pattern.upper():15} -> {best['model']:20} (RMSE: {_fmt(best['rmse'])}, MAPE: {_fmt(best['mape'])}%)")
 
         print("\n--- OVERALL IMPROVEMENTS (vs SMA Baseline) ---")
         if self.results.get('overall_improvements'):
@@ -403,23 +569,35 @@ class PerformanceBenchmark:
         print("\n" + "="*80)
 
 
+@pytest.fixture(scope='session')
+def bm():
+    """Single benchmark instance shared across the test session"""
+    return PerformanceBenchmark()
+
+
+@pytest.fixture(scope='module')
+def full_results(bm):
+    """Run the full benchmark once and share it across tests"""
+    return bm, bm.run_full_benchmark()
+
+
 class TestBenchmarking:
     """Pytest tests for benchmarking"""
 
-    def test_benchmark_stable_pattern(self):
+    def test_benchmark_stable_pattern(self, full_results):
         """Test benchmarking on stable demand pattern"""
-        bm = PerformanceBenchmark()
-        results = bm.benchmark_pattern('stable')
+        _, full = full_results
+        results = full['all_patterns']['stable']
 
         assert 'models' in results
         assert 'SMA' in results['models']
         assert results['models']['SMA']['status'] == 'success'
         assert results['models']['SMA']['rmse'] is not None
 
-    def test_benchmark_trending_pattern(self):
+    def test_benchmark_trending_pattern(self, full_results):
         """Test benchmarking on trending demand pattern"""
-        bm = PerformanceBenchmark()
-        results = bm.benchmark_pattern('trending')
+        _, full = full_results
+        results = full['all_patterns']['trending']
 
         assert 'models' in results
         assert 'improvements' in results
@@ -428,29 +606,28 @@ class TestBenchmarking:
                             for imp in results['improvements'].values())
         assert has_improvement, "Expected at least one model to improve over SMA for trending data"
 
-    def test_benchmark_seasonal_pattern(self):
+    def test_benchmark_seasonal_pattern(self, full_results):
         """Test benchmarking on seasonal demand pattern"""
-        bm = PerformanceBenchmark()
-        results = bm.benchmark_pattern('seasonal')
+        _, full = full_results
+        results = full['all_patterns']['seasonal']
 
         assert 'models' in results
         # Theta or SARIMA should be available for seasonal data
         assert 'Theta' in results['models'] or 'SARIMA' in results['models']
 
-    def test_benchmark_intermittent_pattern(self):
+    def test_benchmark_intermittent_pattern(self, full_results):
         """Test benchmarking on intermittent demand pattern"""
-        bm = PerformanceBenchmark()
-        results = bm.benchmark_pattern('intermittent')
+        _, full = full_results
+        results = full['all_patterns']['intermittent']
 
         assert 'models' in results
         assert 'Croston' in results['models']
         # Croston should be available for intermittent data
         assert results['models']['Croston']['status'] == 'success'
 
-    def test_full_benchmark_suite(self):
+    def test_full_benchmark_suite(self, full_results):
         """Test complete benchmark suite"""
-        bm = PerformanceBenchmark()
-        results = bm.run_full_benchmark()
+        _, results = full_results
 
         assert 'metadata' in results
         assert 'all_patterns' in results
@@ -460,9 +637,8 @@ class TestBenchmarking:
         # Should have tested all 4 patterns
         assert len(results['metadata']['test_scenarios']) == 4
 
-    def test_improvement_calculation(self):
+    def test_improvement_calculation(self, bm):
         """Test improvement calculation is correct"""
-        bm = PerformanceBenchmark()
 
         # Test data
         models = {
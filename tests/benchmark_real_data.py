@@ -9,6 +9,9 @@ from pathlib import Path
 import sys
 from typing import Dict, List, Tuple
 import json
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from collections import defaultdict
 
@@ -24,13 +27,177 @@ from src.forecasting import (
     forecast_ensemble_simple,
     forecast_ensemble_weighted,
     calculate_rmse,
-    calculate_mape,
-    prepare_monthly_data,
-    run_tournament
+    calculate_mape
 )
 from src.ingestion import load_sales_orders, load_supply_chain, load_items
 from src.config import DataConfig
 
+# Optional: orjson for fast serialization of results
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional: joblib for categorizing large item sets in parallel
+try:
+    from joblib import Parallel, delayed
+    JOB_LIB_AVAILABLE = True
+except ImportError:
+    JOB_LIB_AVAILABLE = False
+
+# Optional: tqdm for a progress bar over parallel item benchmarks
+try:
+    from tqdm import tqdm
+    TQDM_AVAILABLE = True
+except ImportError:
+    TQDM_AVAILABLE = False
+
+
+def _load_sales(sales_file: Path) -> pd.DataFrame:
+    """Load sales orders with the date column parsed to datetime"""
+    df_sales = load_sales_orders(sales_file)
+    df_sales['date'] = pd.to_datetime(df_sales['date'], errors='coerce')
+    return df_sales
+
+
+# Seasonal lags (months) probed when categorizing demand; lag 12 (annual)
+# decides the seasonal classification, the others are reported as metrics
+_SEASONAL_LAGS = (4, 6, 12, 24)
+
+# Items per block when categorization is sharded across joblib workers;
+# smaller matrices are categorized in a single vectorized pass
+_CATEGORIZE_BLOCK_ROWS = 20000
+
+# Forecasting models available to the benchmark
+_MODEL_REGISTRY = {
+    'SMA': forecast_sma,
+    'Holt-Winters': forecast_holt_winters,
+    'Theta': forecast_theta,
+    'ARIMA': forecast_arima,
+    'SARIMA': forecast_sarima,
+    'Croston': forecast_croston
+}
+
+# Models worth fitting per demand pattern, as in benchmark_performance
+# (volatile is only produced by the real-data categorization and fits the
+# same models as trending)
+_MODELS_BY_PATTERN = {
+    'stable': ['SMA', 'Holt-Winters', 'Theta', 'ARIMA'],
+    'trending': ['SMA', 'Holt-Winters', 'Theta', 'ARIMA'],
+    'volatile': ['SMA', 'Holt-Winters', 'Theta', 'ARIMA'],
+    'seasonal': ['SMA', 'Holt-Winters', 'Theta', 'SARIMA'],
+    'intermittent': ['SMA', 'Croston']
+}
+
+# Minimum training history (months) for the advanced models
+_MIN_TRAIN_MONTHS = {'Theta': 12, 'ARIMA': 12, 'SARIMA': 24}
+
+# Models compared against the SMA baseline, in benchmark_item's evaluation
+# order; each one's index is its column in the improvements matrix
+_IMPROVEMENT_MODELS = ('Holt-Winters', 'Theta', 'ARIMA', 'SARIMA', 'Croston')
+_MODEL_IDS = {model: idx for idx, model in enumerate(_IMPROVEMENT_MODELS)}
+
+
+def _acf_fft(x: np.ndarray, nlags: int, n: np.ndarray = None) -> np.ndarray:
+    """
+    Lag correlations of a series (or each row of a 2-D array) via FFT
+
+    For every lag k < nlags this equals np.corrcoef(x[:-k], x[k:])[0, 1]:
+    the lagged cross-products for all lags come from one rfft/irfft pair and
+    the window sums from cumulative sums, instead of one pass per lag. Rows
+    may be zero-padded on the right, with their true lengths passed in n.
+    Lags without at least two overlapping points, or with a constant
+    window, are NaN.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    squeeze = x.ndim == 1
+    x = np.atleast_2d(x)
+    rows, length = x.shape
+    n = np.full(rows, length) if n is None else np.asarray(n)
+    valid = np.arange(length) < n[:, None]
+
+    # Demean within each row's valid span (correlation is shift-invariant)
+    x = np.where(valid, x, 0.0)
+    x = np.where(valid, x - (x.sum(axis=1) / np.maximum(n, 1))[:, None], 0.0)
+
+    # sum_t x[t] * x[t + k] for all k at once
+    n_fft = max(2 * length, nlags)
+    spectrum = np.fft.rfft(x, n=n_fft, axis=1)
+    cross = np.fft.irfft(spectrum * np.conj(spectrum), n=n_fft, axis=1)[:, :nlags]
+
+    # Window sums for x[:n-k] (lead) and x[k:n] (lagged) from cumulative sums
+    zeros = np.zeros((rows, 1))
+    cs = np.hstack([zeros, np.cumsum(x, axis=1)])
+    cs2 = np.hstack([zeros, np.cumsum(x * x, axis=1)])
+    lags = np.arange(nlags)
+    m = n[:, None] - lags
+    lead_end = np.clip(m, 0, length)
+    lag_start = np.minimum(lags, length)[None, :].repeat(rows, axis=0)
+    n_idx = n[:, None].repeat(nlags, axis=1)
+
+    take = np.take_along_axis
+    sum_a = take(cs, lead_end, axis=1)
+    sum_a2 = take(cs2, lead_end, axis=1)
+    sum_b = take(cs, n_idx, axis=1) - take(cs, lag_start, axis=1)
+    sum_b2 = take(cs2, n_idx, axis=1) - take(cs2, lag_start, axis=1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        m_safe = np.maximum(m, 1)
+        cov = cross - sum_a * sum_b / m_safe
+        var_a = sum_a2 - sum_a ** 2 / m_safe
+        var_b = sum_b2 - sum_b ** 2 / m_safe
+        # Treat round-off level variance as a constant window, as corrcoef would
+        tol = 1e-10 * np.maximum(sum_a2, sum_b2)
+        acf = np.clip(cov / np.sqrt(var_a * var_b), -1.0, 1.0)
+    acf[(m < 2) | (var_a <= tol) | (var_b <= tol)] = np.nan
+
+    return acf[0] if squeeze else acf
+
+
+def _json_line(record: Dict) -> bytes:
+    """One JSON-lines record (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record, default=str, option=orjson.OPT_SERIALIZE_NUMPY) + b'\n'
+    return (json.dumps(record, default=str) + '\n').encode()
+
+
+def _data_signature(monthly_matrix: pd.DataFrame) -> str:
+    """Content hash of the monthly demand matrix, tying a checkpoint to its input"""
+    digest = hashlib.sha1(pd.util.hash_pandas_object(monthly_matrix, index=True).to_numpy().tobytes())
+    digest.update(pd.util.hash_pandas_object(monthly_matrix.columns.astype(str)).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _load_json_lines(filepath: Path, header: Dict) -> Dict[str, Dict]:
+    """
+    Per-item results from a JSON-lines checkpoint, keyed by item_code
+
+    The first line is the checkpoint header (data signature and run
+    parameters); a checkpoint written for other data or parameters is ignored.
+    orjson writes NaN metrics as null, so they are read back as NaN.
+    """
+    loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+    results = {}
+    with open(filepath, 'rb') as f:
+        first = f.readline()
+        if not first.strip() or loads(first).get('checkpoint') != header:
+            return results
+        for line in f:
+            if line.strip():
+                record = loads(line)
+                for metrics in record.get('models', {}).values():
+                    for key in ('rmse', 'mape'):
+                        if metrics.get(key) is None:
+                            metrics[key] = np.nan
+                results[record['item_code']] = record
+    return results
+
+
+def _bench_one(item_code: str, monthly_data: pd.Series) -> Dict:
+    """Benchmark a single item from its monthly series (runs in a worker)"""
+    return RealDataBenchmark().benchmark_item(monthly_data, item_code)
+
 
 class RealDataBenchmark:
     """Benchmarking on real SAP B1 sales data"""
@@ -49,6 +216,8 @@ class RealDataBenchmark:
                 'business_impact': {}
             }
         }
+        # Per-item checkpoint of the last run, removed once results are saved
+        self.checkpoint_file = None
 
     def load_real_data(self):
         """Load real SAP B1 sales data"""
@@ -58,11 +227,8 @@ class RealDataBenchmark:
         if not sales_file.exists():
             raise FileNotFoundError(f"Sales data not found: {sales_file}")
 
-        df_sales = load_sales_orders(sales_file)
+        df_sales = _load_sales(sales_file)
         print(f"Loaded {len(df_sales)} sales records")
-
-        # Convert date column to datetime
-        df_sales['date'] = pd.to_datetime(df_sales['date'], errors='coerce')
         print(f"Date range: {df_sales['date'].min()} to {df_sales['date'].max()}")
 
         return df_sales
@@ -84,28 +250,24 @@ class RealDataBenchmark:
         cv = std_val / mean_val if mean_val > 0 else np.inf
 
         # Zero ratio (for intermittent detection)
-        zero_ratio = np.sum(values == 0) / len(values)
+        zero_ratio = (values.size - np.count_nonzero(values)) / values.size
 
-        # Trend detection (linear regression slope)
+        # Trend detection (closed-form OLS slope/intercept)
         x = np.arange(len(values))
-        if len(values) > 1:
-            slope = np.polyfit(x, values, 1)[0]
-            slope_pct = (slope / mean_val) * 100 if mean_val > 0 else 0
+        x_dev = x - x.mean()
+        slope = (x_dev * (values - mean_val)).sum() / (x_dev ** 2).sum()
+        intercept = mean_val - slope * x.mean()
+        slope_pct = (slope / mean_val) * 100 if mean_val > 0 else 0
+
+        # Seasonality detection (autocorrelation of the detrended series at
+        # the seasonal lags; annual lag 12 needs two years of history)
+        if abs(slope_pct) > 1:
+            detrended = values - (intercept + slope * x)
         else:
-            slope_pct = 0
-
-        # Seasonality detection (simple autocorrelation at lag 12)
-        has_seasonality = False
-        if len(values) >= 24:
-            # Detrend
-            if abs(slope_pct) > 1:
-                detrended = values - np.polyval(np.polyfit(x, values, 1), x)
-            else:
-                detrended = values - mean_val
+            detrended = values - mean_val
 
-            # Autocorrelation at seasonal lags
-            acf_lag12 = np.corrcoef(detrended[:-12], detrended[12:])[0, 1]
-            has_seasonality = abs(acf_lag12) > 0.3
+        acf = _acf_fft(detrended, max(_SEASONAL_LAGS) + 1)
+        has_seasonality = bool(len(values) >= 24 and abs(acf[12]) > 0.3)
 
         # Pattern classification
         pattern = 'stable'
@@ -134,11 +296,137 @@ class RealDataBenchmark:
                 'zero_ratio': float(zero_ratio),
                 'slope_pct': float(slope_pct),
                 'has_seasonality': has_seasonality,
+                **{f'acf_lag{lag}': float(acf[lag]) for lag in _SEASONAL_LAGS},
                 'n_months': len(values)
             }
         }
 
-    def sample_items_by_pattern(self, df_sales: pd.DataFrame, n_per_pattern: int = 5) -> Dict[str, List[str]]:
+    def build_monthly_matrix(self, df_sales: pd.DataFrame) -> pd.DataFrame:
+        """
+        Monthly demand for every item in one bincount pass
+
+        Returns an items x months frame (items in first-appearance order) with
+        NaN where an item has no sales in a month, so each item's own history
+        span can be told apart from months outside it.
+        """
+        sales = df_sales[['item_code', 'date']].assign(
+            qty=pd.to_numeric(df_sales['qty'], errors='coerce')
+        ).dropna()
+        if sales.empty:
+            return pd.DataFrame(index=pd.Index([], name='item_code'))
+
+        # Integer item and month ids, so every (item, month) cell is one flat bin
+        items = pd.Index(df_sales['item_code'].dropna().unique(), name='item_code')
+        item_id = items.get_indexer(sales['item_code'])
+        months = sales['date'].to_numpy().astype('datetime64[M]')
+        first_month = months.min()
+        month_id = (months - first_month).astype(np.int64)
+        n_months = int(month_id.max()) + 1
+
+        flat = item_id * n_months + month_id
+        size = len(items) * n_months
+        totals = np.bincount(flat, weights=sales['qty'].to_numpy(dtype=np.float64), minlength=size)
+        counts = np.bincount(flat, minlength=size)
+        totals = totals.reshape(len(items), n_months)
+        counts = counts.reshape(len(items), n_months)
+
+        # Drop items without any valid sales row
+        has_sales = counts.any(axis=1)
+        return pd.DataFrame(
+            np.where(counts > 0, totals, np.nan)[has_sales],
+            index=items[has_sales],
+            columns=pd.period_range(pd.Timestamp(first_month).to_period('M'), periods=n_months, freq='M')
+        )
+
+    def categorize_demand_patterns(self, monthly_matrix: pd.DataFrame) -> pd.DataFrame:
+        """
+        Vectorized categorize_demand_pattern over an items x months matrix
+
+        Each row is evaluated over its own span from first to last month with
+        sales (missing months inside the span count as zero demand), matching
+        prepare_monthly_data + categorize_demand_pattern per item.
+
+        Returns one row per item with pattern, confidence and metric columns;
+        items with fewer than 12 months of history are dropped.
+        """
+        observed = monthly_matrix.notna().to_numpy()
+        values = np.nan_to_num(monthly_matrix.to_numpy(dtype=np.float64))
+        n_cols = values.shape[1]
+        cols = np.arange(n_cols)
+
+        # Per-item history span
+        first = observed.argmax(axis=1)
+        last = n_cols - 1 - observed[:, ::-1].argmax(axis=1)
+        n = last - first + 1
+        keep = observed.any(axis=1) & (n >= 12)
+        values, first, last, n = values[keep], first[keep], last[keep], n[keep]
+        span = (cols >= first[:, None]) & (cols <= last[:, None])
+
+        # Calculate metrics
+        mean_val = values.sum(axis=1) / n
+        dev = np.where(span, values - mean_val[:, None], 0)
+        std_val = np.sqrt((dev ** 2).sum(axis=1) / n)
+        positive = mean_val > 0
+        cv = np.divide(std_val, mean_val, out=np.full_like(mean_val, np.inf), where=positive)
+
+        # Zero ratio (for intermittent detection); outside each span values
+        # are already 0, so the nonzero count covers the span only
+        zero_ratio = (n - np.count_nonzero(values, axis=1)) / n
+
+        # Trend detection: closed-form OLS slope over each item's local time index
+        x = cols - first[:, None]
+        x_mean = (n - 1) / 2
+        x_dev = np.where(span, x - x_mean[:, None], 0)
+        slope = (x_dev * dev).sum(axis=1) / (x_dev ** 2).sum(axis=1)
+        slope_pct = np.divide(slope, mean_val, out=np.zeros_like(mean_val), where=positive) * 100
+
+        # Seasonality detection (autocorrelation of the detrended series at the
+        # seasonal lags, all rows in one batched FFT over left-aligned spans)
+        intercept = mean_val - slope * x_mean
+        detrended = np.where((np.abs(slope_pct) > 1)[:, None],
+                             values - (intercept[:, None] + slope[:, None] * x),
+                             dev)
+        aligned_idx = np.minimum(first[:, None] + cols, n_cols - 1)
+        aligned = np.take_along_axis(detrended, aligned_idx, axis=1)
+        acf = _acf_fft(aligned, max(_SEASONAL_LAGS) + 1, n=n)
+        with np.errstate(invalid='ignore'):
+            has_seasonality = (n >= 24) & (np.abs(acf[:, 12]) > 0.3)
+
+        # Pattern classification
+        conditions = [zero_ratio > 0.3, has_seasonality, np.abs(slope_pct) > 5, cv > 0.5]
+        pattern = np.select(conditions, ['intermittent', 'seasonal', 'trending', 'volatile'], 'stable')
+        confidence = np.select(conditions, ['high', 'high', 'high', 'medium'], 'medium')
+
+        return pd.DataFrame({
+            'pattern': pattern,
+            'confidence': confidence,
+            'mean_demand': mean_val,
+            'std_demand': std_val,
+            'cv': cv,
+            'zero_ratio': zero_ratio,
+            'slope_pct': slope_pct,
+            'has_seasonality': has_seasonality,
+            **{f'acf_lag{lag}': acf[:, lag] for lag in _SEASONAL_LAGS},
+            'n_months': n
+        }, index=monthly_matrix.index[keep])
+
+    def monthly_series(self, monthly_matrix: pd.DataFrame, item_code: str) -> pd.Series:
+        """
+        One item's monthly series from build_monthly_matrix output
+
+        Same shape as prepare_monthly_data: the item's first to last month
+        with sales, missing months filled with 0.
+        """
+        row = monthly_matrix.loc[item_code]
+        observed = row.notna().to_numpy()
+        if not observed.any():
+            return row.iloc[:0].rename('qty')
+        first = observed.argmax()
+        last = len(observed) - 1 - observed[::-1].argmax()
+        return row.iloc[first:last + 1].fillna(0).rename('qty')
+
+    def sample_items_by_pattern(self, df_sales: pd.DataFrame, n_per_pattern: int = 5,
+                                monthly_matrix: pd.DataFrame = None) -> Dict[str, List[str]]:
         """Sample items from each demand pattern"""
         print("\nCategorizing items by demand pattern...")
 
@@ -146,30 +434,36 @@ class RealDataBenchmark:
         all_items = df_sales['item_code'].unique()
         print(f"Total unique items: {len(all_items)}")
 
-        # Categorize each item
+        # Categorize every item from one monthly matrix
         pattern_items = defaultdict(list)
-        pattern_stats = defaultdict(list)
-
-        for item_code in all_items:
-            try:
-                monthly_data = prepare_monthly_data(df_sales, item_code)
-
-                if len(monthly_data) < 12:
-                    continue
-
-                categorization = self.categorize_demand_pattern(monthly_data)
-                pattern = categorization['pattern']
-
-                if pattern != 'insufficient_data':
-                    pattern_items[pattern].append({
-                        'item_code': item_code,
-                        'metrics': categorization['metrics'],
-                        'confidence': categorization['confidence']
-                    })
-                    pattern_stats[pattern].append(categorization['metrics'])
-
-            except Exception as e:
-                continue
+        if monthly_matrix is None:
+            monthly_matrix = self.build_monthly_matrix(df_sales)
+        if not monthly_matrix.empty:
+            if JOB_LIB_AVAILABLE and len(monthly_matrix) > _CATEGORIZE_BLOCK_ROWS:
+                # Rows are independent, so blocks of items are categorized
+                # concurrently (NumPy releases the GIL in the heavy kernels)
+                blocks = Parallel(n_jobs=-1, prefer='threads')(
+                    delayed(self.categorize_demand_patterns)(monthly_matrix.iloc[start:start + _CATEGORIZE_BLOCK_ROWS])
+                    for start in range(0, len(monthly_matrix), _CATEGORIZE_BLOCK_ROWS)
+                )
+                categorized = pd.concat(blocks)
+            else:
+                categorized = self.categorize_demand_patterns(monthly_matrix)
+            for item_code, row in zip(categorized.index, categorized.itertuples(index=False)):
+                pattern_items[row.pattern].append({
+                    'item_code': item_code,
+                    'metrics': {
+                        'mean_demand': float(row.mean_demand),
+                        'std_demand': float(row.std_demand),
+                        'cv': float(row.cv),
+                        'zero_ratio': float(row.zero_ratio),
+                        'slope_pct': float(row.slope_pct),
+                        'has_seasonality': bool(row.has_seasonality),
+                        **{f'acf_lag{lag}': float(getattr(row, f'acf_lag{lag}')) for lag in _SEASONAL_LAGS},
+                        'n_months': int(row.n_months)
+                    },
+                    'confidence': row.confidence
+                })
 
         # Print summary
         print("\nDemand Pattern Distribution:")
@@ -192,15 +486,16 @@ class RealDataBenchmark:
 
         return sampled
 
-    def benchmark_item(self, df_sales: pd.DataFrame, item_code: str) -> Dict:
-        """Run full benchmark on single item"""
+    def benchmark_item(self, monthly_data: pd.Series, item_code: str) -> Dict:
+        """Run full benchmark on single item from its monthly demand series"""
         try:
-            # Prepare data
-            monthly_data = prepare_monthly_data(df_sales, item_code)
-
             if len(monthly_data) < 12:
                 return {'error': 'Insufficient data'}
 
+            # Cast once so every model fit sees the same contiguous float64
+            # buffer (train/test below are views) instead of copying its own
+            monthly_data = monthly_data.astype(np.float64, copy=False)
+
             # Categorize pattern
             pattern_info = self.categorize_demand_pattern(monthly_data)
             pattern = pattern_info['pattern']
@@ -212,41 +507,23 @@ class RealDataBenchmark:
 
             forecast_horizon = 6
 
-            # Run tournament to get winning model
-            tournament_result = run_tournament(df_sales, item_code, use_advanced_models=True)
+            # Evaluate only the models suited to the pattern and its history length
+            model_fns = [(name, _MODEL_REGISTRY[name]) for name in _MODELS_BY_PATTERN[pattern]
+                         if len(train) >= _MIN_TRAIN_MONTHS.get(name, 0)]
 
-            # Evaluate individual models
+            # Actuals converted once and shared by every model's MAPE
+            test_np = test.to_numpy()
             models = {}
+            for model_name, model_fn in model_fns:
+                forecast, rmse = model_fn(train, test, forecast_horizon)
+                mape = calculate_mape(test_np, forecast) if len(test_np) > 0 else np.nan
+                models[model_name] = {'rmse': rmse, 'mape': mape}
 
-            # Baseline models
-            forecast, rmse = forecast_sma(train, test, forecast_horizon)
-            mape = calculate_mape(test, forecast) if len(test) > 0 else np.nan
-            models['SMA'] = {'rmse': rmse, 'mape': mape}
-
-            forecast, rmse = forecast_holt_winters(train, test, forecast_horizon)
-            mape = calculate_mape(test, forecast) if len(test) > 0 else np.nan
-            models['Holt-Winters'] = {'rmse': rmse, 'mape': mape}
-
-            # Advanced models (if sufficient data)
-            if len(train) >= 12:
-                forecast, rmse = forecast_theta(train, test, forecast_horizon)
-                mape = calculate_mape(test, forecast) if len(test) > 0 else np.nan
-                models['Theta'] = {'rmse': rmse, 'mape': mape}
-
-                forecast, rmse = forecast_arima(train, test, forecast_horizon)
-                mape = calculate_mape(test, forecast) if len(test) > 0 else np.nan
-                models['ARIMA'] = {'rmse': rmse, 'mape': mape}
-
-            if len(train) >= 24:
-                forecast, rmse = forecast_sarima(train, test, forecast_horizon)
-                mape = calculate_mape(test, forecast) if len(test) > 0 else np.nan
-                models['SARIMA'] = {'rmse': rmse, 'mape': mape}
-
-            # Croston for intermittent
-            if pattern_info['metrics']['zero_ratio'] > 0.3:
-                forecast, rmse = forecast_croston(train, test, forecast_horizon)
-                mape = calculate_mape(test, forecast) if len(test) > 0 else np.nan
-                models['Croston'] = {'rmse': rmse, 'mape': mape}
+            # Winning model: lowest RMSE among the models just evaluated
+            # (rather than refitting them all in a separate tournament)
+            scored = {name: m['rmse'] for name, m in models.items()
+                      if m['rmse'] is not None and not np.isnan(m['rmse'])}
+            winning_model = min(scored, key=scored.get) if scored else 'unknown'
 
             # Calculate improvements vs SMA
             baseline_rmse = models['SMA']['rmse']
@@ -274,7 +551,7 @@ class RealDataBenchmark:
                 'confidence': pattern_info['confidence'],
                 'models': models,
                 'improvements': improvements,
-                'winning_model': tournament_result.get('winning_model', 'unknown'),
+                'winning_model': winning_model,
                 'train_size': len(train),
                 'test_size': len(test)
             }
@@ -282,8 +559,22 @@ class RealDataBenchmark:
         except Exception as e:
             return {'error': str(e), 'item_code': item_code}
 
-    def run_real_data_benchmark(self, max_items_per_pattern: int = 10):
-        """Run comprehensive benchmark on real SAP B1 data"""
+    def run_real_data_benchmark(self, max_items_per_pattern: int = 10, max_workers: int = None,
+                                checkpoint_file: str = None, resume: bool = True):
+        """
+        Run comprehensive benchmark on real SAP B1 data
+
+        Items are independent, so they are benchmarked in parallel worker
+        processes (one per core by default); each task ships only the item's
+        monthly series. Results are reported in the sampled pattern/item order.
+
+        Each item's result is appended to a JSON-lines checkpoint as soon as it
+        completes; with resume=True items already in the checkpoint are not
+        benchmarked again, so an interrupted run picks up where it stopped.
+        The checkpoint is headed by the data signature and run parameters, so
+        a checkpoint from other data is discarded; failed items are not
+        checkpointed (they are retried), and save_results() deletes it.
+        """
         print("\n" + "="*80)
         print("REAL SAP B1 DATA BENCHMARK")
         print("="*80)
@@ -291,12 +582,65 @@ class RealDataBenchmark:
         # Load data
         df_sales = self.load_real_data()
 
-        # Sample items by pattern
-        sampled_items = self.sample_items_by_pattern(df_sales, max_items_per_pattern)
-
-        # Benchmark each item
-        all_results = []
+        # Monthly demand for all items, built once and shared by sampling
+        # and the per-item benchmarks
+        monthly_matrix = self.build_monthly_matrix(df_sales)
 
+        # Sample items by pattern
+        sampled_items = self.sample_items_by_pattern(df_sales, max_items_per_pattern,
+                                                     monthly_matrix=monthly_matrix)
+
+        # Results of items finished by an earlier, interrupted run
+        if checkpoint_file is None:
+            checkpoint_file = Path(__file__).parent.parent / 'real_data_benchmark_items.jsonl'
+        checkpoint_file = Path(checkpoint_file)
+        self.checkpoint_file = checkpoint_file
+        header = {'data_signature': _data_signature(monthly_matrix),
+                  'max_items_per_pattern': max_items_per_pattern}
+        item_results = {}
+        resume = resume and checkpoint_file.exists()
+        if resume:
+            item_results = _load_json_lines(checkpoint_file, header)
+            if item_results:
+                print(f"Resuming: {len(item_results)} items already benchmarked in {checkpoint_file}")
+            else:
+                # Empty or written for other data/parameters: start over
+                resume = False
+
+        # Benchmark the remaining sampled items in parallel, streaming each
+        # result to the checkpoint as it completes
+        item_codes = [item_code for codes in sampled_items.values() for item_code in codes
+                      if item_code not in item_results]
+        with open(checkpoint_file, 'ab' if resume else 'wb') as checkpoint, \
+                ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            if not resume:
+                checkpoint.write(_json_line({'checkpoint': header}))
+            futures = {
+                executor.submit(_bench_one, item_code, self.monthly_series(monthly_matrix, item_code)): item_code
+                for item_code in item_codes
+            }
+            completed = as_completed(futures)
+            if TQDM_AVAILABLE:
+                completed = tqdm(completed, total=len(futures), desc="Benchmarking items")
+            for future in completed:
+                item_code = futures[future]
+                result = future.result()
+                item_results[item_code] = result
+                if 'error' not in result:
+                    checkpoint.write(_json_line({**result, 'item_code': item_code}))
+                    checkpoint.flush()
+
+        # Successful results in sampled order, with each item's best model
+        # read off one improvements matrix
+        all_results = [item_results[item_code] for item_codes in sampled_items.values()
+                       for item_code in item_codes if 'error' not in item_results[item_code]]
+        improvements = self.improvements_matrix(all_results)
+        has_improvement = ~np.isnan(improvements).all(axis=1)
+        best_idx = np.zeros(len(all_results), dtype=np.int64)
+        if has_improvement.any():
+            best_idx[has_improvement] = np.nanargmax(improvements[has_improvement], axis=1)
+
+        row = 0
         for pattern, item_codes in sampled_items.items():
             print(f"\n{'='*60}")
             print(f"Testing {pattern.upper()} pattern ({len(item_codes)} items)")
@@ -304,10 +648,9 @@ class RealDataBenchmark:
 
             for i, item_code in enumerate(item_codes, 1):
                 print(f"\n[{i}/{len(item_codes)}] Testing item: {item_code}")
-                result = self.benchmark_item(df_sales, item_code)
+                result = item_results[item_code]
 
                 if 'error' not in result:
-                    all_results.append(result)
                     self.results['items'][item_code] = result
 
                     # Print summary
@@ -315,90 +658,95 @@ class RealDataBenchmark:
                     print(f"  Winning Model: {result['winning_model']}")
 
                     # Show best improvement
-                    if result['improvements']:
-                        best_model = max(result['improvements'].items(),
-                                       key=lambda x: x[1]['rmse_improvement_pct'])
-                        print(f"  Best Improvement: {best_model[0]} +{best_model[1]['rmse_improvement_pct']:.2f}% RMSE")
+                    if has_improvement[row]:
+                        best = best_idx[row]
+                        print(f"  Best Improvement: {_IMPROVEMENT_MODELS[best]} "
+                              f"+{improvements[row, best]:.2f}% RMSE")
+                    row += 1
                 else:
                     print(f"  Error: {result['error']}")
 
         self.results['metadata']['items_tested'] = len(all_results)
 
         # Calculate summary statistics
-        self.calculate_summary_statistics(all_results)
+        self.calculate_summary_statistics(all_results, improvements)
 
         return self.results
 
-    def calculate_summary_statistics(self, all_results: List[Dict]):
-        """Calculate summary statistics across all tested items"""
-
-        # Group by pattern
-        by_pattern = defaultdict(lambda: {'items': [], 'improvements': defaultdict(list)})
-
-        for result in all_results:
-            pattern = result['pattern']
-            by_pattern[pattern]['items'].append(result)
+    def improvements_matrix(self, all_results: List[Dict]) -> np.ndarray:
+        """
+        Per-item RMSE improvements as an (n_items, n_models) matrix
 
-            # Collect improvements
+        Columns follow _IMPROVEMENT_MODELS; models not evaluated for an item
+        are NaN. Built in one pass so every summary is a NumPy reduction.
+        """
+        matrix = np.full((len(all_results), len(_IMPROVEMENT_MODELS)), np.nan)
+        for row, result in enumerate(all_results):
             for model, imp in result['improvements'].items():
-                by_pattern[pattern]['improvements'][model].append(imp['rmse_improvement_pct'])
+                matrix[row, _MODEL_IDS[model]] = imp['rmse_improvement_pct']
+        return matrix
 
-        # Calculate average improvements per pattern
-        for pattern, data in by_pattern.items():
-            avg_improvements = {}
-            for model, improvements in data['improvements'].items():
-                if improvements:
-                    avg_improvements[model] = round(np.mean(improvements), 2)
+    @staticmethod
+    def _model_averages(sums: np.ndarray, counts: np.ndarray) -> Dict[str, float]:
+        """Average improvement per model, for models with at least one item"""
+        return {model: round(float(sums[idx] / counts[idx]), 2)
+                for idx, model in enumerate(_IMPROVEMENT_MODELS) if counts[idx] > 0}
 
+    def calculate_summary_statistics(self, all_results: List[Dict], improvements: np.ndarray = None):
+        """Calculate summary statistics across all tested items"""
+        if improvements is None:
+            improvements = self.improvements_matrix(all_results)
+        evaluated = ~np.isnan(improvements)
+        filled = np.where(evaluated, improvements, 0.0)
+
+        # Average improvements per pattern (patterns in first-seen order)
+        codes, patterns = pd.factorize(pd.Series([result['pattern'] for result in all_results],
+                                                 dtype=object))
+        pattern_sums = np.zeros((len(patterns), improvements.shape[1]))
+        pattern_counts = np.zeros((len(patterns), improvements.shape[1]), dtype=np.int64)
+        np.add.at(pattern_sums, codes, filled)
+        np.add.at(pattern_counts, codes, evaluated)
+        items_per_pattern = np.bincount(codes, minlength=len(patterns))
+        for code, pattern in enumerate(patterns):
             self.results['summary']['by_pattern'][pattern] = {
-                'n_items': len(data['items']),
-                'avg_improvements': avg_improvements
+                'n_items': int(items_per_pattern[code]),
+                'avg_improvements': self._model_averages(pattern_sums[code], pattern_counts[code])
             }
 
         # Overall best models
-        all_improvements = defaultdict(list)
-        for result in all_results:
-            for model, imp in result['improvements'].items():
-                all_improvements[model].append(imp['rmse_improvement_pct'])
-
-        overall_avg = {}
-        for model, improvements in all_improvements.items():
-            if improvements:
-                overall_avg[model] = round(np.mean(improvements), 2)
-
         self.results['summary']['best_models'] = {
-            'overall_average_improvements': overall_avg
+            'overall_average_improvements': self._model_averages(filled.sum(axis=0),
+                                                                 evaluated.sum(axis=0))
         }
 
         # Calculate business impact
-        self.calculate_business_impact(all_results)
+        self.calculate_business_impact(all_results, improvements)
 
-    def calculate_business_impact(self, all_results: List[Dict]):
+    def calculate_business_impact(self, all_results: List[Dict], improvements: np.ndarray = None):
         """Calculate business impact metrics"""
+        if improvements is None:
+            improvements = self.improvements_matrix(all_results)
 
         total_items = len(all_results)
-        items_with_improvement = 0
 
-        # Count items where best model improves over SMA
-        total_improvement = 0
-        best_model_counts = defaultdict(int)
+        # Best model per item (first one on ties), counting only items it improves
+        rows = improvements[~np.isnan(improvements).all(axis=1)]
+        best_idx = np.nanargmax(rows, axis=1) if len(rows) else np.zeros(0, dtype=np.int64)
+        best_imp = rows[np.arange(len(rows)), best_idx]
+        improved = best_imp > 0
 
-        for result in all_results:
-            if result['improvements']:
-                best_model = max(result['improvements'].items(),
-                               key=lambda x: x[1]['rmse_improvement_pct'])
-
-                if best_model[1]['rmse_improvement_pct'] > 0:
-                    items_with_improvement += 1
-                    total_improvement += best_model[1]['rmse_improvement_pct']
-                    best_model_counts[best_model[0]] += 1
+        items_with_improvement = int(improved.sum())
+        total_improvement = float(best_imp[improved].sum())
+        best_model_counts = np.bincount(best_idx[improved], minlength=len(_IMPROVEMENT_MODELS))
 
         self.results['summary']['business_impact'] = {
             'total_items_tested': total_items,
             'items_with_improvement': items_with_improvement,
             'pct_items_improved': round((items_with_improvement / total_items * 100) if total_items > 0 else 0, 2),
             'avg_improvement_per_item': round(total_improvement / items_with_improvement, 2) if items_with_improvement > 0 else 0,
-            'best_model_distribution': dict(best_model_counts)
+            'best_model_distribution': {model: int(count)
+                                        for model, count in zip(_IMPROVEMENT_MODELS, best_model_counts)
+                                        if count > 0}
         }
 
     def print_summary(self):
@@ -444,8 +792,18 @@ class RealDataBenchmark:
         if filepath is None:
             filepath = Path(__file__).parent.parent / 'real_data_benchmark_results.json'
 
-        with open(filepath, 'w') as f:
-            json.dump(self.results, f, indent=2, default=str)
+        if ORJSON_AVAILABLE:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(self.results, default=str,
+                                     option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(self.results, f, indent=2, default=str)
+
+        # Results are complete on disk, so the per-item checkpoint is spent
+        if self.checkpoint_file is not None:
+            self.checkpoint_file.unlink(missing_ok=True)
+            self.checkpoint_file = None
 
         print(f"\nResults saved to: {filepath}")
         return filepath
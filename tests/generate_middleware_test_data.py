@@ -3,13 +3,18 @@
 Generate test data for SAP middleware to send to Railway ingestion service.
 Creates encrypted payloads for all supported data types.
 """
+import os
 import sys
 import json
 import hashlib
 import base64
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 try:
@@ -19,6 +24,21 @@ except ImportError:
     print("Install: pip install cryptography")
     sys.exit(1)
 
+# Optional: rfernet (Rust fernet-rs binding) produces the same Fernet tokens
+# with AES/HMAC in native code
+try:
+    from rfernet import Fernet as RFernet
+    RFERNET_AVAILABLE = True
+except ImportError:
+    RFERNET_AVAILABLE = False
+
+# Optional: orjson serializes payloads straight to bytes
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 sys.stdout.reconfigure(encoding='utf-8')
 
 
@@ -30,19 +50,49 @@ API_KEY = "BzYlIYXKMxzN49K28NBSDP1jK0FcvTQsuXIR5p0XgeM"
 INGESTION_URL = "https://ingestion-service-production-6947.up.railway.app/api/ingest"
 
 
+@lru_cache(maxsize=None)
 def get_fernet_key(key: str) -> bytes:
-    """Transform raw key to Fernet-compatible format."""
+    """Transform raw key to Fernet-compatible format (derived once per key)."""
     hashed = hashlib.sha256(key.encode()).digest()
     return base64.b64encode(hashed)
 
 
-def encrypt_payload(data: dict, key: str) -> str:
+@lru_cache(maxsize=None)
+def get_fernet(key: str):
+    """Fernet cipher for a raw key, built once per key and reused across payloads."""
+    if RFERNET_AVAILABLE:
+        # rfernet only accepts the URL-safe alphabet; same 32 key bytes
+        return RFernet(base64.urlsafe_b64encode(base64.b64decode(get_fernet_key(key))).decode())
+    return Fernet(get_fernet_key(key))
+
+
+def _compact_json(data) -> bytes:
+    """Compact JSON bytes: less plaintext to encrypt, same data once decrypted."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def encrypt_json(json_data: bytes, key: str = ENCRYPTION_KEY) -> str:
+    """Encrypt already-serialized JSON bytes using Fernet symmetric encryption."""
+    encrypted = get_fernet(key).encrypt(json_data)
+    return encrypted.decode('utf-8') if isinstance(encrypted, bytes) else encrypted
+
+
+def encrypt_payload(data: dict, key: str = ENCRYPTION_KEY) -> str:
     """Encrypt payload using Fernet symmetric encryption."""
-    fernet_key = get_fernet_key(key)
-    fernet = Fernet(fernet_key)
-    json_data = json.dumps(data).encode('utf-8')
-    encrypted = fernet.encrypt(json_data)
-    return encrypted.decode('utf-8')
+    return encrypt_json(_compact_json(data), key)
+
+
+def write_bytes(path: Path, data: bytes) -> None:
+    """Write a fully-built file with raw os.write calls (no Python IO buffering)."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 
 def create_ingestion_payload(data_type: str, records: list) -> dict:
@@ -55,6 +105,34 @@ def create_ingestion_payload(data_type: str, records: list) -> dict:
     }
 
 
+def serialize_ingestion_payload(data_type: str, records: list) -> bytes:
+    """
+    Compact JSON of create_ingestion_payload(data_type, records), streamed into
+    one buffer record by record instead of building the wrapper dict first.
+    """
+    header = _compact_json({
+        "data_type": data_type,
+        "source": "SAP_B1",
+        "timestamp": datetime.now().isoformat()
+    })
+    buf = bytearray(header[:-1])
+    buf += b',"records":['
+    for idx, record in enumerate(records):
+        if idx:
+            buf += b','
+        buf += _compact_json(record)
+    buf += b']}'
+    return bytes(buf)
+
+
+def create_batch_payload(records_by_type: dict) -> dict:
+    """Create a batch payload (for /api/ingest/batch) covering several data types."""
+    return {
+        "batch": [create_ingestion_payload(data_type, records)
+                  for data_type, records in records_by_type.items()]
+    }
+
+
 # ============================================================================
 # Sample Data Generators
 # ============================================================================
@@ -188,61 +266,115 @@ def generate_inventory_data():
     ]
 
 
-def generate_sales_orders_data():
-    """Generate sample sales orders - matches Railway simplified schema."""
+def _iso_dates(base_date: datetime, day_offsets) -> list:
+    """YYYY-MM-DD strings for base_date plus each day offset (one vectorized cast)."""
+    days = np.datetime64(base_date.date(), 'D') + np.asarray(day_offsets, dtype='timedelta64[D]')
+    return days.astype(str).tolist()
+
+
+def generate_sales_orders_data(n: int = None, seed: int = 0):
+    """Generate sample sales orders - matches Railway simplified schema.
+
+    With n, builds n synthetic orders column-wise over the last 30 days.
+    """
     base_date = datetime.now() - timedelta(days=30)
+    if n is None:
+        dates = _iso_dates(base_date, [1, 5, 15])
+        return [
+            {
+                "order_date": dates[0],
+                "item_code": "ITEM001",
+                "quantity": 100.0,
+                "warehouse_code": "WH01",
+                "customer_code": "CUST001",
+                "region": "NORTH_AMERICA"
+            },
+            {
+                "order_date": dates[1],
+                "item_code": "ITEM002",
+                "quantity": 50.0,
+                "warehouse_code": "WH01",
+                "customer_code": "CUST002",
+                "region": "NORTH_AMERICA"
+            },
+            {
+                "order_date": dates[2],
+                "item_code": "ITEM001",
+                "quantity": 200.0,
+                "warehouse_code": "WH02",
+                "customer_code": "CUST001",
+                "region": "EUROPE"
+            }
+        ]
+
+    rng = np.random.default_rng(seed)
+    dates = _iso_dates(base_date, rng.integers(0, 30, n))
+    items = rng.choice(["ITEM001", "ITEM002", "ITEM003"], n).tolist()
+    quantities = rng.uniform(1, 500, n).round(0).tolist()
+    warehouses = rng.choice(["WH01", "WH02", "WH03"], n).tolist()
+    customers = np.char.add("CUST", np.char.zfill(rng.integers(1, 100, n).astype(str), 3)).tolist()
+    regions = rng.choice(["NORTH_AMERICA", "EUROPE"], n).tolist()
     return [
         {
-            "order_date": (base_date + timedelta(days=1)).strftime('%Y-%m-%d'),
-            "item_code": "ITEM001",
-            "quantity": 100.0,
-            "warehouse_code": "WH01",
-            "customer_code": "CUST001",
-            "region": "NORTH_AMERICA"
-        },
-        {
-            "order_date": (base_date + timedelta(days=5)).strftime('%Y-%m-%d'),
-            "item_code": "ITEM002",
-            "quantity": 50.0,
-            "warehouse_code": "WH01",
-            "customer_code": "CUST002",
-            "region": "NORTH_AMERICA"
-        },
-        {
-            "order_date": (base_date + timedelta(days=15)).strftime('%Y-%m-%d'),
-            "item_code": "ITEM001",
-            "quantity": 200.0,
-            "warehouse_code": "WH02",
-            "customer_code": "CUST001",
-            "region": "EUROPE"
+            "order_date": date,
+            "item_code": item,
+            "quantity": qty,
+            "warehouse_code": warehouse,
+            "customer_code": customer,
+            "region": region
         }
+        for date, item, qty, warehouse, customer, region
+        in zip(dates, items, quantities, warehouses, customers, regions)
     ]
 
 
-def generate_purchase_orders_data():
-    """Generate sample purchase orders - matches Railway simplified schema."""
+def generate_purchase_orders_data(n: int = None, seed: int = 0):
+    """Generate sample purchase orders - matches Railway simplified schema.
+
+    With n, builds n synthetic orders column-wise over the last 45 days.
+    """
     base_date = datetime.now() - timedelta(days=45)
+    if n is None:
+        dates = _iso_dates(base_date, [2, 10])
+        return [
+            {
+                "order_date": dates[0],
+                "vendor_code": "VENDOR001",
+                "item_code": "ITEM001",
+                "quantity": 500.0,
+                "warehouse_code": "WH01"
+            },
+            {
+                "order_date": dates[1],
+                "vendor_code": "VENDOR002",
+                "item_code": "ITEM002",
+                "quantity": 50.0,
+                "warehouse_code": "WH01"
+            }
+        ]
+
+    rng = np.random.default_rng(seed)
+    dates = _iso_dates(base_date, rng.integers(0, 45, n))
+    vendors = rng.choice(["VENDOR001", "VENDOR002", "VENDOR003"], n).tolist()
+    items = rng.choice(["ITEM001", "ITEM002", "ITEM003"], n).tolist()
+    quantities = rng.uniform(10, 1000, n).round(0).tolist()
+    warehouses = rng.choice(["WH01", "WH02", "WH03"], n).tolist()
     return [
         {
-            "order_date": (base_date + timedelta(days=2)).strftime('%Y-%m-%d'),
-            "vendor_code": "VENDOR001",
-            "item_code": "ITEM001",
-            "quantity": 500.0,
-            "warehouse_code": "WH01"
-        },
-        {
-            "order_date": (base_date + timedelta(days=10)).strftime('%Y-%m-%d'),
-            "vendor_code": "VENDOR002",
-            "item_code": "ITEM002",
-            "quantity": 50.0,
-            "warehouse_code": "WH01"
+            "order_date": date,
+            "vendor_code": vendor,
+            "item_code": item,
+            "quantity": qty,
+            "warehouse_code": warehouse
         }
+        for date, vendor, item, qty, warehouse in zip(dates, vendors, items, quantities, warehouses)
     ]
 
 
 def generate_costs_data():
     """Generate sample cost data."""
     base_date = datetime.now() - timedelta(days=60)
+    dates = _iso_dates(base_date, [30, 45, 20])
     return [
         {
             "item_code": "ITEM001",
@@ -251,7 +383,7 @@ def generate_costs_data():
             "duty": 1.15,
             "total_landed_cost": 28.95,
             "currency": "USD",
-            "effective_date": (base_date + timedelta(days=30)).strftime('%Y-%m-%d'),
+            "effective_date": dates[0],
             "vendor_code": "VENDOR001"
         },
         {
@@ -261,7 +393,7 @@ def generate_costs_data():
             "duty": 0.00,
             "total_landed_cost": 157.50,
             "currency": "USD",
-            "effective_date": (base_date + timedelta(days=45)).strftime('%Y-%m-%d'),
+            "effective_date": dates[1],
             "vendor_code": "VENDOR002"
         },
         {
@@ -271,7 +403,7 @@ def generate_costs_data():
             "duty": 1.75,
             "total_landed_cost": 11.35,
             "currency": "USD",
-            "effective_date": (base_date + timedelta(days=20)).strftime('%Y-%m-%d'),
+            "effective_date": dates[2],
             "vendor_code": "VENDOR001"
         }
     ]
@@ -280,6 +412,7 @@ def generate_costs_data():
 def generate_pricing_data():
     """Generate sample pricing data."""
     base_date = datetime.now() - timedelta(days=90)
+    dates = _iso_dates(base_date, [60, 60, 45, 30])
     return [
         {
             "item_code": "ITEM001",
@@ -287,7 +420,7 @@ def generate_pricing_data():
             "region": "NORTH_AMERICA",
             "unit_price": 45.00,
             "currency": "CAD",
-            "effective_date": (base_date + timedelta(days=60)).strftime('%Y-%m-%d'),
+            "effective_date": dates[0],
             "expiry_date": None,
             "price_source": "SAP_B1",
             "is_active": True
@@ -298,7 +431,7 @@ def generate_pricing_data():
             "region": "NORTH_AMERICA",
             "unit_price": 38.25,
             "currency": "CAD",
-            "effective_date": (base_date + timedelta(days=60)).strftime('%Y-%m-%d'),
+            "effective_date": dates[1],
             "expiry_date": None,
             "price_source": "SAP_B1",
             "is_active": True
@@ -309,7 +442,7 @@ def generate_pricing_data():
             "region": None,
             "unit_price": 275.00,
             "currency": "CAD",
-            "effective_date": (base_date + timedelta(days=45)).strftime('%Y-%m-%d'),
+            "effective_date": dates[2],
             "expiry_date": None,
             "price_source": "SAP_B1",
             "is_active": True
@@ -320,7 +453,7 @@ def generate_pricing_data():
             "region": "EUROPE",
             "unit_price": 18.50,
             "currency": "EUR",
-            "effective_date": (base_date + timedelta(days=30)).strftime('%Y-%m-%d'),
+            "effective_date": dates[3],
             "expiry_date": None,
             "price_source": "SAP_B1",
             "is_active": True
@@ -332,6 +465,14 @@ def generate_pricing_data():
 # Main Generator
 # ============================================================================
 
+def build_encrypted_payload(data_type: str, generator) -> tuple:
+    """Generate, wrap and encrypt one data type; returns (records, file bytes)."""
+    records = generator()
+    encrypted = encrypt_json(serialize_ingestion_payload(data_type, records), ENCRYPTION_KEY)
+    # Payload files are machine-read, so they are written compact
+    return records, _compact_json({"encrypted_payload": encrypted})
+
+
 def main():
     """Generate all test data files."""
     print("=" * 70)
@@ -355,26 +496,29 @@ def main():
         "pricing": generate_pricing_data,
     }
 
-    # Generate encrypted payloads for each data type
-    for data_type, generator in data_generators.items():
-        print(f"Generating {data_type}...")
-
-        # Create ingestion payload
-        records = generator()
-        ingestion_payload = create_ingestion_payload(data_type, records)
-
-        # Encrypt payload
-        encrypted = encrypt_payload(ingestion_payload, ENCRYPTION_KEY)
-
-        # Create final payload
-        final_payload = {"encrypted_payload": encrypted}
-
-        # Save to file
-        filename = output_dir / f"{data_type}_encrypted.json"
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(final_payload, f, indent=2)
-
-        print(f"  [OK] {len(records)} records -> {filename.name}")
+    # Generate encrypted payloads for each data type; the pipelines are
+    # independent, so they run in worker processes and the parent writes files
+    records_by_type = {}
+    with ProcessPoolExecutor(max_workers=len(data_generators)) as executor:
+        built = executor.map(build_encrypted_payload, data_generators.keys(), data_generators.values())
+        for data_type, (records, file_bytes) in zip(data_generators, built):
+            print(f"Generating {data_type}...")
+            records_by_type[data_type] = records
+
+            # Save to file
+            filename = output_dir / f"{data_type}_encrypted.json"
+            write_bytes(filename, file_bytes)
+
+            print(f"  [OK] {len(records)} records -> {filename.name}")
+
+    # All data types in one payload (master data first), so the whole set
+    # goes through a single Fernet encryption and one batch request
+    batch_order = ["warehouses", "vendors", "items", "inventory_current",
+                   "costs", "pricing", "sales_orders", "purchase_orders"]
+    batch_payload = create_batch_payload({dt: records_by_type[dt] for dt in batch_order})
+    filename = output_dir / "batch_encrypted.json"
+    write_bytes(filename, _compact_json({"encrypted_payload": encrypt_payload(batch_payload, ENCRYPTION_KEY)}))
+    print(f"  [OK] batch of {len(batch_order)} data types -> {filename.name}")
 
     # Generate README
     readme_content = f"""# SAP Middleware Test Data
@@ -387,6 +531,9 @@ This directory contains encrypted test payloads for all supported data types:
 
 {" | ".join([f"- {dt}_encrypted.json" for dt in data_generators.keys()])}
 
+`batch_encrypted.json` holds all data types in one encrypted payload for the
+batch endpoint (`{INGESTION_URL}/batch`).
+
 ## How to Use
 
 ### 1. Send to Railway Ingestion Service
@@ -490,8 +637,7 @@ curl {INGESTION_URL}/health
 """
 
     readme_path = output_dir / "README.md"
-    with open(readme_path, 'w', encoding='utf-8') as f:
-        f.write(readme_content)
+    write_bytes(readme_path, readme_content.encode('utf-8'))
 
     print()
     print(f"[OK] README.md created")
@@ -502,7 +648,7 @@ curl {INGESTION_URL}/health
 Send all test data to Railway ingestion service.
 \"\"\"
 import requests
-import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Configuration
@@ -510,21 +656,24 @@ INGESTION_URL = "{INGESTION_URL}"
 API_KEY = "{API_KEY}"
 TEST_DATA_DIR = Path(__file__).parent
 
+# One keep-alive session, so every upload reuses the same TCP/TLS connection(s)
+SESSION = requests.Session()
+SESSION.headers.update({{
+    "X-API-Key": API_KEY,
+    "Content-Type": "application/json"
+}})
+
 def send_payload(filename):
-    \"\"\"Send encrypted payload to ingestion service.\"\"\"
+    \"\"\"Send encrypted payload to ingestion service; returns the response JSON.\"\"\"
+    # The file already holds the JSON body, so stream its bytes as-is
+    # (requests reads the file object in blocks instead of loading it whole)
+    with open(TEST_DATA_DIR / filename, 'rb') as f:
+        return SESSION.post(INGESTION_URL, data=f).json()
+
+def report(filename, result):
+    \"\"\"Print the outcome of one upload.\"\"\"
     print(f"Sending {{filename}}...")
 
-    with open(TEST_DATA_DIR / filename, 'r') as f:
-        payload = json.load(f)
-
-    headers = {{
-        "X-API-Key": API_KEY,
-        "Content-Type": "application/json"
-    }}
-
-    response = requests.post(INGESTION_URL, json=payload, headers=headers)
-    result = response.json()
-
     if result.get('success'):
         print(f"  [OK] {{result.get('records_processed', 0)}} records processed")
     else:
@@ -532,6 +681,7 @@ def send_payload(filename):
         if result.get('errors'):
             for error in result['errors']:
                 print(f"    - {{error}}")
+    print()
 
     return result.get('success', False)
 
@@ -541,12 +691,15 @@ def main():
     print("=" * 70)
     print()
 
-    # Order matters - send master data first
-    files = [
+    # Order matters - send master data first, one file at a time
+    master_files = [
         "warehouses_encrypted.json",
         "vendors_encrypted.json",
         "items_encrypted.json",
         "inventory_current_encrypted.json",
+    ]
+    # Transactional data only depends on master data, so these go concurrently
+    transactional_files = [
         "costs_encrypted.json",
         "pricing_encrypted.json",
         "sales_orders_encrypted.json",
@@ -554,13 +707,19 @@ def main():
     ]
 
     success_count = 0
-    for filename in files:
-        if send_payload(filename):
+    for filename in master_files:
+        if report(filename, send_payload(filename)):
             success_count += 1
-        print()
 
+    with ThreadPoolExecutor(max_workers=len(transactional_files)) as executor:
+        results = executor.map(send_payload, transactional_files)
+        for filename, result in zip(transactional_files, results):
+            if report(filename, result):
+                success_count += 1
+
+    total = len(master_files) + len(transactional_files)
     print("=" * 70)
-    print(f"Results: {{success_count}}/{{len(files)}} successful")
+    print(f"Results: {{success_count}}/{{total}} successful")
     print("=" * 70)
 
 if __name__ == "__main__":
@@ -568,8 +727,7 @@ if __name__ == "__main__":
 """
 
     script_path = output_dir / "send_all_test_data.py"
-    with open(script_path, 'w', encoding='utf-8') as f:
-        f.write(test_script)
+    write_bytes(script_path, test_script.encode('utf-8'))
 
     print(f"[OK] send_all_test_data.py created")
     print()
@@ -3,7 +3,7 @@
 Send all test data to Railway ingestion service.
 """
 import requests
-import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Configuration
@@ -11,20 +11,23 @@ INGESTION_URL = "https://ingestion-service-production-6947.up.railway.app/api/in
 API_KEY = "BzYlIYXKMxzN49K28NBSDP1jK0FcvTQsuXIR5p0XgeM"
 TEST_DATA_DIR = Path(__file__).parent
 
-def send_payload(filename):
-    """Send encrypted payload to ingestion service."""
-    print(f"Sending {filename}...")
+# One keep-alive session, so every upload reuses the same TCP/TLS connection(s)
+SESSION = requests.Session()
+SESSION.headers.update({
+    "X-API-Key": API_KEY,
+    "Content-Type": "application/json"
+})
 
-    with open(TEST_DATA_DIR / filename, 'r') as f:
-        payload = json.load(f)
-
-    headers = {
-        "X-API-Key": API_KEY,
-        "Content-Type": "application/json"
-    }
+def send_payload(filename):
+    """Send encrypted payload to ingestion service; returns the response JSON."""
+    # The file already holds the JSON body, so stream its bytes as-is
+    # (requests reads the file object in blocks instead of loading it whole)
+    with open(TEST_DATA_DIR / filename, 'rb') as f:
+        return SESSION.post(INGESTION_URL, data=f).json()
 
-    response = requests.post(INGESTION_URL, json=payload, headers=headers)
-    result = response.json()
+def report(filename, result):
+    """Print the outcome of one upload."""
+    print(f"Sending {filename}...")
 
     if result.get('success'):
         print(f"  [OK] {result.get('records_processed', 0)} records processed")
@@ -33,6 +36,7 @@ def send_payload(filename):
         if result.get('errors'):
             for error in result['errors']:
                 print(f"    - {error}")
+    print()
 
     return result.get('success', False)
 
@@ -42,12 +46,15 @@ def main():
     print("=" * 70)
     print()
 
-    # Order matters - send master data first
-    files = [
+    # Order matters - send master data first, one file at a time
+    master_files = [
         "warehouses_encrypted.json",
         "vendors_encrypted.json",
         "items_encrypted.json",
         "inventory_current_encrypted.json",
+    ]
+    # Transactional data only depends on master data, so these go concurrently
+    transactional_files = [
         "costs_encrypted.json",
         "pricing_encrypted.json",
         "sales_orders_encrypted.json",
@@ -55,13 +62,19 @@ def main():
     ]
 
     success_count = 0
-    for filename in files:
-        if send_payload(filename):
+    for filename in master_files:
+        if report(filename, send_payload(filename)):
             success_count += 1
-        print()
 
+    with ThreadPoolExecutor(max_workers=len(transactional_files)) as executor:
+        results = executor.map(send_payload, transactional_files)
+        for filename, result in zip(transactional_files, results):
+            if report(filename, result):
+                success_count += 1
+
+    total = len(master_files) + len(transactional_files)
     print("=" * 70)
-    print(f"Results: {success_count}/{len(files)} successful")
+    print(f"Results: {success_count}/{total} successful")
     print("=" * 70)
 
 if __name__ == "__main__":
@@ -7,10 +7,6 @@ import pandas as pd
 import json
 import tempfile
 import shutil
-from pathlib import Path
-import sys
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.cache_manager import (
     get_file_hash,
@@ -23,6 +19,23 @@ from src.cache_manager import (
 )
 
 
+@pytest.fixture(scope="class")
+def cache_dir(tmp_path_factory):
+    """Temporary cache directory shared by a test class"""
+    # clear_cache only accepts a directory named exactly 'cache', and mktemp
+    # appends a counter to the name, so nest it inside a unique parent
+    cache_dir = tmp_path_factory.mktemp("cache_root") / "cache"
+    cache_dir.mkdir()
+    return cache_dir
+
+
+@pytest.fixture
+def _reset_cache_dir(cache_dir):
+    """Start every test with an empty cache directory"""
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    cache_dir.mkdir()
+
+
 class TestFileHashing:
     """Test file hashing for cache invalidation"""
 
@@ -82,6 +95,7 @@ class TestDataSignature:
         assert isinstance(sig['items.tsv']['modified'], float)
 
 
+@pytest.mark.usefixtures("_reset_cache_dir")
 class TestCacheOperations:
     """Test cache save/load operations"""
 
@@ -101,13 +115,6 @@ class TestCacheOperations:
         }
         return pd.DataFrame(data)
 
-    @pytest.fixture
-    def cache_dir(self, tmp_path):
-        """Create a temporary cache directory"""
-        cache_dir = tmp_path / "cache"
-        cache_dir.mkdir(exist_ok=True)
-        return cache_dir
-
     def test_save_and_load_forecasts(self, sample_forecasts, cache_dir):
         """Test saving and loading forecasts"""
         # Save forecasts
@@ -174,16 +181,10 @@ class TestCacheOperations:
         assert not (cache_dir / "forecasts.parquet").exists()
 
 
+@pytest.mark.usefixtures("_reset_cache_dir")
 class TestCacheInfo:
     """Test cache information retrieval"""
 
-    @pytest.fixture
-    def cache_dir(self, tmp_path):
-        """Create a temporary cache directory"""
-        cache_dir = tmp_path / "cache"
-        cache_dir.mkdir(exist_ok=True)
-        return cache_dir
-
     def test_cache_info_when_empty(self, cache_dir):
         """Test cache info when no cache exists"""
         info = get_cache_info(cache_dir)
@@ -213,16 +214,10 @@ class TestCacheInfo:
         assert info['valid'] is True
 
 
+@pytest.mark.usefixtures("_reset_cache_dir")
 class TestCacheSecurity:
     """Test cache security features"""
 
-    @pytest.fixture
-    def cache_dir(self, tmp_path):
-        """Create a temporary cache directory"""
-        cache_dir = tmp_path / "cache"
-        cache_dir.mkdir(exist_ok=True)
-        return cache_dir
-
     def test_no_pickle_import_in_cache_manager(self):
         """Verify pickle module is not imported/used in cache_manager"""
         import src.cache_manager as cm
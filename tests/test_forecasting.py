@@ -5,14 +5,12 @@ Tests model selection, forecast generation, and tournament logic
 import pytest
 import pandas as pd
 import numpy as np
-from pathlib import Path
-import sys
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.forecasting import (
     calculate_dynamic_forecast_horizon,
     prepare_monthly_data,
+    _prepare_all_monthly,
+    _item_monthly,
     forecast_sma,
     run_tournament,
     forecast_items
@@ -218,6 +216,23 @@ class TestMonthlyDataPreparation:
         # Should return empty series
         assert len(monthly) == 0
 
+    def test_prepare_all_monthly_matches_per_item(self):
+        """Test the all-items aggregation slices to the same series per item"""
+        df_sales = pd.DataFrame({
+            'date': pd.to_datetime(['2023-01-05', '2023-03-10', '2023-03-20',
+                                    '2023-02-01', '2023-02-15', '2023-05-01']),
+            'item_code': ['A', 'A', 'A', 'B', 'B', 'B'],
+            'qty': [5, 3, 'bad', 7, 1, 2]
+        })
+
+        all_monthly = _prepare_all_monthly(df_sales)
+
+        for item_code in ['A', 'B', 'MISSING']:
+            expected = prepare_monthly_data(df_sales, item_code)
+            result = _item_monthly(all_monthly, item_code)
+            assert list(result.index) == list(expected.index)
+            assert result.tolist() == expected.tolist()
+
 
 class TestForecastAccuracy:
     """Test forecast accuracy calculations"""
@@ -6,23 +6,39 @@ Simulates SAP middleware sending encrypted data.
 import os
 import sys
 import json
-import base64
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 from cryptography.fernet import Fernet
 
+# Optional: orjson serializes payloads straight to bytes
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-# Encryption key (should match Railway environment)
-ENCRYPTION_KEY = os.environ.get("INGESTION_ENCRYPTION_KEY", Fernet.generate_key().decode())
-cipher = Fernet(ENCRYPTION_KEY.encode())
+
+@lru_cache(maxsize=1)
+def get_cipher() -> Fernet:
+    """Fernet cipher for the ingestion key, built on first use rather than at import."""
+    # Encryption key (should match Railway environment)
+    encryption_key = os.environ.get("INGESTION_ENCRYPTION_KEY")
+    if encryption_key is None:
+        encryption_key = Fernet.generate_key().decode()
+    return Fernet(encryption_key.encode())
 
 
 def encrypt_data(data: dict) -> str:
     """Encrypt data payload as middleware would."""
-    json_str = json.dumps(data)
-    return cipher.encrypt(json_str.encode()).decode()
+    if ORJSON_AVAILABLE:
+        json_bytes = orjson.dumps(data)
+    else:
+        json_bytes = json.dumps(data, separators=(',', ':')).encode()
+    return get_cipher().encrypt(json_bytes).decode()
 
 
 def create_sample_items_data() -> dict:
@@ -102,8 +118,8 @@ def test_encryption_decryption():
     encrypted = encrypt_data(sample)
 
     try:
-        decrypted = cipher.decrypt(encrypted.encode()).decode()
-        decrypted_data = json.loads(decrypted)
+        decrypted = get_cipher().decrypt(encrypted.encode())
+        decrypted_data = orjson.loads(decrypted) if ORJSON_AVAILABLE else json.loads(decrypted)
 
         assert decrypted_data == sample, "Decrypted data doesn't match original"
         print("  [OK] Encryption/decryption working")
@@ -113,6 +129,16 @@ def test_encryption_decryption():
         return False
 
 
+def write_json_file(filepath: Path, data) -> None:
+    """Write indented JSON in one binary write (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        content = json.dumps(data, indent=2).encode()
+    with open(filepath, 'wb') as f:
+        f.write(content)
+
+
 def generate_test_payloads():
     """Generate all test payloads for manual testing."""
     payloads = {
@@ -127,8 +153,7 @@ def generate_test_payloads():
     
     for filename, payload in payloads.items():
         filepath = test_dir / filename
-        with open(filepath, 'w') as f:
-            json.dump({"encrypted_payload": payload}, f, indent=2)
+        write_json_file(filepath, {"encrypted_payload": payload})
         print(f"  Created: {filepath}")
     
     # Also save unencrypted versions for reference
@@ -140,8 +165,7 @@ def generate_test_payloads():
     
     for filename, data in unencrypted.items():
         filepath = test_dir / filename
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        write_json_file(filepath, data)
         print(f"  Created: {filepath}")
 
 
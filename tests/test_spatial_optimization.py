@@ -5,10 +5,6 @@ Tests warehouse capacity management and vendor grouping
 import pytest
 import pandas as pd
 import numpy as np
-from pathlib import Path
-import sys
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.spatial_optimization import (
     ItemDimensions,
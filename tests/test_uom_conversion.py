@@ -5,121 +5,167 @@ Tests edge cases, data quality, and conversion accuracy
 import pytest
 import pandas as pd
 import numpy as np
-from pathlib import Path
-import sys
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.uom_conversion_sap import convert_stock_to_sales_uom_sap, validate_sap_uom_data
 
 
+def with_categorical_uom(df):
+    """Store the UoM and warehouse columns as categoricals, as a large item catalog would"""
+    # BaseUoM and SalesUoM share one dtype so they can be compared with each other
+    uom_dtype = pd.CategoricalDtype(sorted(set(df['BaseUoM']) | set(df['SalesUoM'])))
+    dtypes = {'BaseUoM': uom_dtype, 'SalesUoM': uom_dtype}
+    if 'Warehouse' in df.columns:
+        dtypes['Warehouse'] = 'category'
+    return df.astype(dtypes)
+
+
+# Small single-purpose inputs, built once at import; tests pass copies
+MISSING_UOM_ITEMS = pd.DataFrame({
+    'item_code': ['ITEM001'],
+    'current_stock': np.array([100.0], dtype=np.float64),
+    'incoming_stock': np.array([0.0], dtype=np.float64)
+})
+
+NEGATIVE_STOCK_ITEMS = pd.DataFrame({
+    'item_code': ['ITEM001'],
+    'BaseUoM': ['Litre'],
+    'SalesUoM': ['Pail'],
+    'QtyPerSalesUoM': np.array([18.9], dtype=np.float64),
+    'current_stock': np.array([-50.0], dtype=np.float64),
+    'incoming_stock': np.array([0.0], dtype=np.float64)
+})
+
+LARGE_FACTOR_ITEMS = pd.DataFrame({
+    'item_code': ['ITEM001'],
+    'BaseUoM': ['Litre'],
+    'SalesUoM': ['Tank'],
+    'QtyPerSalesUoM': np.array([50000.0], dtype=np.float64),  # Very large
+    'current_stock': np.array([100000.0], dtype=np.float64),
+    'incoming_stock': np.array([0.0], dtype=np.float64)
+})
+
+STRING_FACTOR_ITEMS = pd.DataFrame({
+    'item_code': ['ITEM001', 'ITEM002'],
+    'BaseUoM': ['Litre', 'kg'],
+    'SalesUoM': ['Pail', 'Pail'],
+    'QtyPerSalesUoM': ['18.9', 'invalid'],  # One valid, one invalid
+    'current_stock': np.array([189.0, 100.0], dtype=np.float64),
+    'incoming_stock': np.array([0.0, 0.0], dtype=np.float64)
+})
+
+
+@pytest.fixture(scope="class")
+def sample_items():
+    """Create sample items data for testing"""
+    data = {
+        'item_code': ['ITEM001', 'ITEM002', 'ITEM003', 'ITEM004', 'ITEM005'],
+        'Item Description': ['Test Item 1', 'Test Item 2', 'Test Item 3', 'Test Item 4', 'Test Item 5'],
+        'BaseUoM': ['Litre', 'Litre', 'kg', 'Litre', 'Litre'],
+        'SalesUoM': ['Pail', 'Drum', 'Pail', 'Pail', 'Pail'],
+        'QtyPerSalesUoM': np.array([18.9, 200.0, 20.0, 0.0, 15.0], dtype=np.float64),
+        'current_stock': np.array([189.0, 2000.0, 100.0, 50.0, 150.0], dtype=np.float64),
+        'incoming_stock': np.array([0.0, 0.0, 0.0, 0.0, 0.0], dtype=np.float64),
+        'Warehouse': ['REG', 'REG', 'REG', 'REG', 'REG']
+    }
+    return with_categorical_uom(pd.DataFrame(data))
+
+
+@pytest.fixture(scope="class")
+def converted_items(sample_items):
+    """sample_items converted once, indexed by item_code for per-item lookups"""
+    result = convert_stock_to_sales_uom_sap(sample_items.copy())
+    return result.set_index('item_code', drop=False)
+
+
 class TestUOMConversion:
     """Test UOM conversion functionality"""
 
-    @pytest.fixture
-    def sample_items(self):
-        """Create sample items data for testing"""
-        data = {
-            'Item No.': ['ITEM001', 'ITEM002', 'ITEM003', 'ITEM004', 'ITEM005'],
-            'Item Description': ['Test Item 1', 'Test Item 2', 'Test Item 3', 'Test Item 4', 'Test Item 5'],
-            'BaseUoM': ['Litre', 'Litre', 'kg', 'Litre', 'Litre'],
-            'SalesUoM': ['Pail', 'Drum', 'Pail', 'Pail', 'Pail'],
-            'QtyPerSalesUoM': [18.9, 200.0, 20.0, 0.0, 15.0],
-            'CurrentStock': [189.0, 2000.0, 100.0, 50.0, 150.0],
-            'IncomingStock': [0.0, 0.0, 0.0, 0.0, 0.0],
-            'Warehouse': ['REG', 'REG', 'REG', 'REG', 'REG']
-        }
-        return pd.DataFrame(data)
-
-    def test_basic_conversion(self, sample_items):
+    def test_stock_conversion(self, converted_items):
+        """Test current stock is converted to Sales UOM for every item at once"""
+        expected = pd.Series(
+            [10.0,    # ITEM001: 189.0 Litres / 18.9 = 10 Pails
+             10.0,    # ITEM002: 2000.0 Litres / 200.0 = 10 Drums
+             5.0,     # ITEM003: 100.0 kg / 20.0 = 5 Pails
+             np.nan,  # ITEM004: zero conversion factor
+             10.0],   # ITEM005: 150.0 Litres / 15.0 = 10 Pails
+            index=pd.Index(['ITEM001', 'ITEM002', 'ITEM003', 'ITEM004', 'ITEM005'], name='item_code'),
+            name='current_stock_SalesUOM'
+        )
+        pd.testing.assert_series_equal(converted_items['current_stock_SalesUOM'], expected, check_exact=True)
+
+    def test_basic_conversion(self, converted_items):
         """Test basic UOM conversion"""
-        result = convert_stock_to_sales_uom_sap(sample_items)
-
-        # ITEM001: 189.0 Litres / 18.9 = 10 Pails
-        item001 = result[result['Item No.'] == 'ITEM001'].iloc[0]
-        assert item001['CurrentStock_SalesUOM'] == pytest.approx(10.0, rel=0.01)
+        item001 = converted_items.loc['ITEM001']
         assert item001['SalesUOM'] == 'Pail'
         assert item001['ConversionFactor'] == 18.9
 
-    def test_drum_conversion(self, sample_items):
+    def test_drum_conversion(self, converted_items):
         """Test conversion to larger units (Drums)"""
-        result = convert_stock_to_sales_uom_sap(sample_items)
-
-        # ITEM002: 2000.0 Litres / 200.0 = 10 Drums
-        item002 = result[result['Item No.'] == 'ITEM002'].iloc[0]
-        assert item002['CurrentStock_SalesUOM'] == pytest.approx(10.0, rel=0.01)
+        item002 = converted_items.loc['ITEM002']
         assert item002['SalesUOM'] == 'Drum'
 
-    def test_kg_conversion(self, sample_items):
+    def test_kg_conversion(self, converted_items):
         """Test conversion from kg to Pail"""
-        result = convert_stock_to_sales_uom_sap(sample_items)
-
-        # ITEM003: 100.0 kg / 20.0 = 5 Pails
-        item003 = result[result['Item No.'] == 'ITEM003'].iloc[0]
-        assert item003['CurrentStock_SalesUOM'] == pytest.approx(5.0, rel=0.01)
+        item003 = converted_items.loc['ITEM003']
         assert item003['BaseUoM'] == 'kg'
 
-    def test_zero_conversion_factor(self, sample_items):
+    def test_zero_conversion_factor(self, converted_items):
         """Test handling of zero conversion factor"""
-        result = convert_stock_to_sales_uom_sap(sample_items)
-
         # ITEM004: Has 0 conversion factor, should be marked as invalid (NaN)
-        item004 = result[result['Item No.'] == 'ITEM004'].iloc[0]
+        item004 = converted_items.loc['ITEM004']
         # With conversion factor of 0, it should be set to NaN with error flag
         assert pd.isna(item004['ConversionFactor'])
         assert item004['ConversionError'] == 'Invalid QtyPerSalesUoM'
 
     def test_incoming_stock_conversion(self, sample_items):
         """Test conversion of incoming stock"""
-        sample_items.loc[sample_items['Item No.'] == 'ITEM001', 'IncomingStock'] = 189.0
-        result = convert_stock_to_sales_uom_sap(sample_items)
+        # Copy: sample_items is shared by the whole class
+        df = sample_items.copy()
+        df.loc[df['item_code'] == 'ITEM001', 'incoming_stock'] = 189.0
+        result = convert_stock_to_sales_uom_sap(df).set_index('item_code', drop=False)
 
-        item001 = result[result['Item No.'] == 'ITEM001'].iloc[0]
-        assert item001['IncomingStock_SalesUOM'] == pytest.approx(10.0, rel=0.01)
+        item001 = result.loc['ITEM001']
+        assert item001['incoming_stock_SalesUOM'] == 10.0
 
     def test_missing_uom_columns(self):
         """Test handling of missing UOM columns"""
-        data = {
-            'Item No.': ['ITEM001'],
-            'CurrentStock': [100.0],
-            'IncomingStock': [0.0]
-        }
-        df = pd.DataFrame(data)
-        result = convert_stock_to_sales_uom_sap(df)
+        result = convert_stock_to_sales_uom_sap(MISSING_UOM_ITEMS.copy())
 
         # Should return original dataframe if columns missing
-        assert 'CurrentStock_SalesUOM' not in result.columns
+        assert 'current_stock_SalesUOM' not in result.columns
+
+
+@pytest.fixture(scope="class")
+def valid_items():
+    """Create valid items data"""
+    data = {
+        'item_code': ['ITEM001', 'ITEM002', 'ITEM003'],
+        'BaseUoM': ['Litre', 'kg', 'Litre'],
+        'SalesUoM': ['Pail', 'Pail', 'Drum'],
+        'QtyPerSalesUoM': np.array([18.9, 20.0, 200.0], dtype=np.float64),
+        'current_stock': np.array([189.0, 100.0, 2000.0], dtype=np.float64),
+        'incoming_stock': np.array([0.0, 0.0, 0.0], dtype=np.float64)
+    }
+    return with_categorical_uom(pd.DataFrame(data))
+
+
+@pytest.fixture(scope="class")
+def invalid_items():
+    """Create items with validation issues"""
+    data = {
+        'item_code': ['ITEM001', 'ITEM002', 'ITEM003', 'ITEM004'],
+        'BaseUoM': ['Litre', 'kg', 'Litre', 'Litre'],
+        'SalesUoM': ['Pail', 'Pail', 'Drum', 'Pail'],
+        'QtyPerSalesUoM': np.array([18.9, np.nan, 0.0, 0.005], dtype=np.float64),  # Valid, NaN, zero, too small
+        'current_stock': np.array([189.0, 100.0, 2000.0, 100.0], dtype=np.float64),
+        'incoming_stock': np.array([0.0, 0.0, 0.0, 0.0], dtype=np.float64)
+    }
+    return with_categorical_uom(pd.DataFrame(data))
 
 
 class TestUOMValidation:
     """Test UOM data validation"""
 
-    @pytest.fixture
-    def valid_items(self):
-        """Create valid items data"""
-        data = {
-            'Item No.': ['ITEM001', 'ITEM002', 'ITEM003'],
-            'BaseUoM': ['Litre', 'kg', 'Litre'],
-            'SalesUoM': ['Pail', 'Pail', 'Drum'],
-            'QtyPerSalesUoM': [18.9, 20.0, 200.0],
-            'CurrentStock': [189.0, 100.0, 2000.0],
-            'IncomingStock': [0.0, 0.0, 0.0]
-        }
-        return pd.DataFrame(data)
-
-    @pytest.fixture
-    def invalid_items(self):
-        """Create items with validation issues"""
-        data = {
-            'Item No.': ['ITEM001', 'ITEM002', 'ITEM003', 'ITEM004'],
-            'BaseUoM': ['Litre', 'kg', 'Litre', 'Litre'],
-            'SalesUoM': ['Pail', 'Pail', 'Drum', 'Pail'],
-            'QtyPerSalesUoM': [18.9, np.nan, 0.0, 0.005],  # Valid, NaN, zero, too small
-            'CurrentStock': [189.0, 100.0, 2000.0, 100.0],
-            'IncomingStock': [0.0, 0.0, 0.0, 0.0]
-        }
-        return pd.DataFrame(data)
-
     def test_valid_data_passes(self, valid_items):
         """Test that valid data passes validation"""
         result = validate_sap_uom_data(valid_items)
@@ -148,12 +194,7 @@ class TestUOMValidation:
 
     def test_missing_uom_columns(self):
         """Test detection of missing UOM columns"""
-        data = {
-            'Item No.': ['ITEM001'],
-            'CurrentStock': [100.0]
-        }
-        df = pd.DataFrame(data)
-        result = validate_sap_uom_data(df)
+        result = validate_sap_uom_data(MISSING_UOM_ITEMS.copy())
 
         assert 'BaseUoM' in result['missing_uom_fields']
         assert 'SalesUoM' in result['missing_uom_fields']
@@ -165,55 +206,26 @@ class TestEdgeCases:
 
     def test_negative_stock(self):
         """Test handling of negative stock values"""
-        data = {
-            'Item No.': ['ITEM001'],
-            'BaseUoM': ['Litre'],
-            'SalesUoM': ['Pail'],
-            'QtyPerSalesUoM': [18.9],
-            'CurrentStock': [-50.0],
-            'IncomingStock': [0.0]
-        }
-        df = pd.DataFrame(data)
-        result = convert_stock_to_sales_uom_sap(df)
-
-        item = result.iloc[0]
-        assert item['CurrentStock_SalesUOM'] < 0
-
-    def test_very_large_conversion_factor(self):
-        """Test handling of very large conversion factors"""
-        data = {
-            'Item No.': ['ITEM001'],
-            'BaseUoM': ['Litre'],
-            'SalesUoM': ['Tank'],
-            'QtyPerSalesUoM': [50000.0],  # Very large
-            'CurrentStock': [100000.0],
-            'IncomingStock': [0.0]
-        }
-        df = pd.DataFrame(data)
-        result = convert_stock_to_sales_uom_sap(df)
-
-        item = result.iloc[0]
-        assert item['CurrentStock_SalesUOM'] == pytest.approx(2.0, rel=0.01)
-
-    def test_string_in_numeric_fields(self):
-        """Test handling of strings in numeric fields"""
-        data = {
-            'Item No.': ['ITEM001', 'ITEM002'],
-            'BaseUoM': ['Litre', 'kg'],
-            'SalesUoM': ['Pail', 'Pail'],
-            'QtyPerSalesUoM': ['18.9', 'invalid'],  # One valid, one invalid
-            'CurrentStock': [189.0, 100.0],
-            'IncomingStock': [0.0, 0.0]
-        }
-        df = pd.DataFrame(data)
-        result = convert_stock_to_sales_uom_sap(df)
-
-        # First item should convert correctly
-        item001 = result[result['Item No.'] == 'ITEM001'].iloc[0]
-        assert item001['CurrentStock_SalesUOM'] == pytest.approx(10.0, rel=0.01)
+        result = convert_stock_to_sales_uom_sap(NEGATIVE_STOCK_ITEMS.copy()).set_index('item_code', drop=False)
+
+        assert result.loc['ITEM001', 'current_stock_SalesUOM'] < 0
+
+    @pytest.mark.parametrize("items,item,expected", [
+        (LARGE_FACTOR_ITEMS, 'ITEM001', 2.0),
+        (STRING_FACTOR_ITEMS, 'ITEM001', 10.0),  # '18.9' parsed as a number
+    ], ids=['very_large_conversion_factor', 'string_in_numeric_fields'])
+    def test_converted_stock(self, items, item, expected):
+        """Test converted stock for large factors and numeric strings"""
+        result = convert_stock_to_sales_uom_sap(items.copy()).set_index('item_code', drop=False)
+
+        assert result.loc[item, 'current_stock_SalesUOM'] == expected
+
+    def test_string_in_numeric_fields_invalid(self):
+        """Test non-numeric string conversion factor is flagged as invalid"""
+        result = convert_stock_to_sales_uom_sap(STRING_FACTOR_ITEMS.copy()).set_index('item_code', drop=False)
 
         # Second item should be marked as invalid (NaN with error flag)
-        item002 = result[result['Item No.'] == 'ITEM002'].iloc[0]
+        item002 = result.loc['ITEM002']
         assert pd.isna(item002['ConversionFactor'])
         assert item002['ConversionError'] == 'Invalid QtyPerSalesUoM'
 